@@ -0,0 +1,83 @@
+"""Micro-benchmark for email extraction over a corpus of scraped pages.
+
+Compares the previous per-field ``re.findall`` approach with the shared
+single-pass ``EmailExtractor``. By default a synthetic corpus resembling
+Brave results and scraped markdown is generated; pass ``--corpus DIR`` to
+benchmark real pages (every ``*.md``/``*.txt``/``*.html`` file is loaded).
+
+Usage:
+    uv run python -m benchmarks.email_extraction [--corpus DIR] [--rounds 20]
+"""
+
+import argparse
+import random
+import re
+import string
+import time
+from pathlib import Path
+
+from src.common.email_extraction import extract_emails
+
+LEGACY_PATTERN = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
+
+
+def legacy_extract(results: list[dict[str, str]]) -> list[str]:
+    """The extraction previously inlined in extract_emails_from_results."""
+    emails = set()
+    for result in results:
+        emails.update(re.findall(LEGACY_PATTERN, result.get("title", "")))
+        emails.update(re.findall(LEGACY_PATTERN, result.get("description", "")))
+        emails.update(re.findall(LEGACY_PATTERN, result.get("url", "")))
+    spam_domains = ["example.com", "test.com", "localhost"]
+    return sorted(e for e in emails if e.split("@")[1].lower() not in spam_domains)
+
+
+def new_extract(results: list[dict[str, str]]) -> list[str]:
+    """The shared single-pass extractor."""
+    return extract_emails(
+        *(r.get(f, "") for r in results for f in ("title", "description", "url"))
+    )
+
+
+def _synthetic_page(rng: random.Random) -> dict[str, str]:
+    words = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9))) for _ in range(400)]
+    for _ in range(rng.randint(0, 3)):
+        words.insert(rng.randrange(len(words)), f"{rng.choice(words)}@{rng.choice(words)}.com.sg")
+    return {
+        "title": " ".join(words[:12]),
+        "description": " ".join(words),
+        "url": f"https://{words[0]}.sg/{words[1]}",
+    }
+
+
+def _load_corpus(directory: Path) -> list[dict[str, str]]:
+    pages = []
+    for path in sorted(directory.rglob("*")):
+        if path.suffix in {".md", ".txt", ".html"}:
+            pages.append({"title": path.stem, "description": path.read_text(errors="ignore")})
+    return pages
+
+
+def main(corpus: Path | None, rounds: int) -> None:
+    if corpus:
+        pages = _load_corpus(corpus)
+    else:
+        pages = [_synthetic_page(random.Random(i)) for i in range(500)]
+    batches = [pages[i : i + 15] for i in range(0, len(pages), 15)]
+    print(f"{len(pages)} pages, {sum(len(p['description']) for p in pages) / 1e6:.1f} MB text")
+
+    for label, fn in (("legacy per-field", legacy_extract), ("single-pass", new_extract)):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for batch in batches:
+                fn(batch)
+        elapsed = time.perf_counter() - start
+        print(f"{label:<17} {elapsed / (rounds * len(pages)) * 1e6:8.1f} µs/page")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--corpus", type=Path, default=None)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+    main(args.corpus, args.rounds)
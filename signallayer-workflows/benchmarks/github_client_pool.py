@@ -0,0 +1,107 @@
+"""Benchmark per-call latency of GitHubClient against a local stub server.
+
+Compares the previous behaviour (a fresh ``httpx.AsyncClient`` per call) with
+the shared pooled client now owned by ``GitHubClient``.
+
+Usage:
+    uv run python -m benchmarks.github_client_pool [--calls 200]
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+
+from src.common.clients.github import GitHubClient
+from src.common.config.github import GitHubSettings
+
+ISSUE = {
+    "number": 1,
+    "title": "Benchmark issue",
+    "body": "body",
+    "state": "open",
+    "labels": [{"name": "check-demand"}],
+    "created_at": "2024-01-01T00:00:00Z",
+    "updated_at": "2024-01-02T00:00:00Z",
+    "user": {"login": "bench"},
+    "html_url": "https://github.com/owner/repo/issues/1",
+}
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Minimal keep-alive capable GitHub API stub."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:  # noqa: N802
+        body = json.dumps(ISSUE).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+def _start_stub_server() -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def _per_call_client(base_url: str, calls: int) -> list[float]:
+    """Old behaviour: open and tear down a client for every request."""
+    timings = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        async with httpx.AsyncClient() as client:
+            response = await client.get(f"{base_url}/repos/owner/repo/issues/1")
+            response.raise_for_status()
+            response.json()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+async def _pooled_client(base_url: str, calls: int) -> list[float]:
+    """New behaviour: reuse the pooled client owned by GitHubClient."""
+    settings = GitHubSettings(token="bench", base_url=base_url)
+    timings = []
+    async with GitHubClient(settings=settings) as client:
+        for _ in range(calls):
+            start = time.perf_counter()
+            await client.fetch_issue_details("owner/repo", 1)
+            timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _report(label: str, timings: list[float]) -> None:
+    ms = sorted(t * 1000 for t in timings)
+    p95 = ms[int(len(ms) * 0.95) - 1]
+    print(
+        f"{label:<16} mean={statistics.mean(ms):7.3f}ms  "
+        f"p50={ms[len(ms) // 2]:7.3f}ms  p95={p95:7.3f}ms"
+    )
+
+
+async def main(calls: int) -> None:
+    server = _start_stub_server()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        _report("per-call client", await _per_call_client(base_url, calls))
+        _report("pooled client", await _pooled_client(base_url, calls))
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=200)
+    asyncio.run(main(parser.parse_args().calls))
@@ -0,0 +1,114 @@
+"""Benchmark the Pydantic payload converter on our workflow input/output models.
+
+Compares the previous converter (``model_dump(mode="json")`` + stdlib json on
+encode, a fresh ``TypeAdapter`` per decode) with the current one (direct
+JSON serialization and cached adapters validating payload bytes).
+
+Usage:
+    uv run python -m benchmarks.payload_converter [--rounds 2000]
+"""
+
+import argparse
+import time
+from typing import Any
+
+from pydantic import BaseModel, TypeAdapter
+from temporalio.api.common.v1 import Payload
+from temporalio.converter import JSONPlainPayloadConverter
+
+from src.common.models import IssueReference
+from src.common.pydantic_converter import PydanticJSONPayloadConverter
+from src.worker.workflows.batch_process_condos import BatchProcessCondosInput
+from src.worker.workflows.find_condo_emails import FindCondoEmailsOutput
+from src.worker.workflows.ingest_propertyguru import (
+    IngestPropertyGuruInput,
+    IngestPropertyGuruOutput,
+)
+from src.worker.workflows.process_github_issues import ProcessGithubIssuesOutput
+from src.worker.workflows.research_issue import ResearchIssueInput, ResearchIssueOutput
+
+
+class LegacyConverter(JSONPlainPayloadConverter):
+    """The converter as it was before adapters were cached."""
+
+    def to_payload(self, value: Any) -> Payload | None:
+        if isinstance(value, BaseModel):
+            value = value.model_dump(mode="json")
+        return super().to_payload(value)
+
+    def from_payload(self, payload: Payload, type_hint: type | None = None) -> Any:
+        value = super().from_payload(payload, type_hint=None)
+        if type_hint is not None:
+            try:
+                return TypeAdapter(type_hint).validate_python(value)
+            except Exception:
+                pass
+        return value
+
+
+def _samples() -> list[tuple[type, BaseModel]]:
+    issue = IssueReference(
+        platform="github",
+        repository="owner/repo",
+        number=42,
+        title="Demand for X",
+        url="https://github.com/owner/repo/issues/42",
+    )
+    return [
+        (ResearchIssueInput, ResearchIssueInput(issue_ref=issue)),
+        (
+            ResearchIssueOutput,
+            ResearchIssueOutput(title="Demand for X", status="researched", findings="## F\n" * 400),
+        ),
+        (
+            IngestPropertyGuruInput,
+            IngestPropertyGuruInput(cursor=300, failed=20, failed_sample=["A"] * 20),
+        ),
+        (
+            IngestPropertyGuruOutput,
+            IngestPropertyGuruOutput(total_streets=5000, successful=4990, failed=10),
+        ),
+        (BatchProcessCondosInput, BatchProcessCondosInput(limit=50)),
+        (
+            FindCondoEmailsOutput,
+            FindCondoEmailsOutput(
+                condo_name="The Pier",
+                emails_found=3,
+                emails=["a@pier.sg", "b@pier.sg", "c@pier.sg"],
+                output_file="data/condo/emails/condo.the_pier.email.txt",
+                used_agent=False,
+            ),
+        ),
+        (
+            ProcessGithubIssuesOutput,
+            ProcessGithubIssuesOutput(signals_found=3, signals_processed=3),
+        ),
+    ]
+
+
+def main(rounds: int) -> None:
+    samples = _samples()
+    converters = (("legacy", LegacyConverter()), ("cached", PydanticJSONPayloadConverter()))
+    for label, converter in converters:
+        encode = decode = 0.0
+        for model_type, value in samples:
+            start = time.perf_counter()
+            for _ in range(rounds):
+                payload = converter.to_payload(value)
+            encode += time.perf_counter() - start
+
+            start = time.perf_counter()
+            for _ in range(rounds):
+                decoded = converter.from_payload(payload, model_type)
+            decode += time.perf_counter() - start
+            assert decoded == value
+
+        per_op = 1e6 / (rounds * len(samples))
+        print(f"{label:<7} encode {encode * per_op:7.1f} µs  decode {decode * per_op:7.1f} µs")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+    main(args.rounds)
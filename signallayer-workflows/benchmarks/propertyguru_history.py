@@ -0,0 +1,74 @@
+"""Measure workflow history payload bytes per street for PropertyGuru ingest.
+
+Encodes the activity arguments and results each mode records in history
+with the worker's data converter:
+
+- split: ``fetch_propertyguru_autocomplete`` (result is the full response)
+  followed by ``save_propertyguru_data`` (response sent back as an argument)
+- fused: ``fetch_and_save_propertyguru_data`` (street in, path out)
+
+By default a synthetic 100-result response is used; pass ``--sample FILE``
+to measure a real saved ``condo.<street>.json``.
+
+Usage:
+    uv run python -m benchmarks.propertyguru_history [--sample FILE] [--streets 5000]
+"""
+
+import argparse
+import json
+from pathlib import Path
+from typing import Any
+
+from src.common.pydantic_converter import pydantic_data_converter
+
+STREET = "Ang Mo Kio Avenue 1"
+OUTPUT_DIR = "data"
+SAVED_PATH = "data/condo.ang_mo_kio_avenue_1.json"
+
+
+def _synthetic_response(results: int = 100) -> dict[str, Any]:
+    items = [
+        {
+            "id": f"{i:06d}",
+            "objectType": "PROPERTY",
+            "displayText": f"The Residences at Block {i}",
+            "displayType": "Condominium" if i % 3 else "Executive Condominium",
+            "displayDescription": f"{i} Ang Mo Kio Avenue 1, Singapore 56{i:04d}",
+            "propertyTypeGroup": "CONDO",
+            "location": {"lat": 1.3691 + i / 1e4, "lng": 103.8454 + i / 1e4},
+            "districtCode": "D20",
+        }
+        for i in range(results)
+    ]
+    return {"data": {"items": items, "total": results}}
+
+
+def _size(*values: Any) -> int:
+    payloads = pydantic_data_converter.payload_converter.to_payloads(list(values))
+    return sum(payload.ByteSize() for payload in payloads)
+
+
+def main(sample: Path | None, streets: int) -> None:
+    response = json.loads(sample.read_text()) if sample else _synthetic_response()
+
+    split = (
+        _size(STREET)  # fetch input
+        + _size(response)  # fetch result
+        + _size(STREET, response, OUTPUT_DIR)  # save input
+        + _size(SAVED_PATH)  # save result
+    )
+    fused = _size(STREET, OUTPUT_DIR) + _size(SAVED_PATH)
+
+    print(f"response: {_size(response):,} bytes encoded")
+    for label, size in (("split", split), ("fused", fused)):
+        total_mb = size * streets / 1e6
+        print(f"{label:<6} {size:>9,} bytes/street {total_mb:>9.1f} MB/{streets} streets")
+    print(f"reduction: {split / fused:.0f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sample", type=Path, default=None)
+    parser.add_argument("--streets", type=int, default=5000)
+    args = parser.parse_args()
+    main(args.sample, args.streets)
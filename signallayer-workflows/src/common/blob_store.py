@@ -0,0 +1,330 @@
+"""Blob stores for payloads too large to keep in Temporal history.
+
+Stores follow a small subset of the S3 object API (``put_object``,
+``get_object``, ``delete_object``, ``last_modified``) so the filesystem store
+used locally and an S3-compatible bucket are interchangeable.
+"""
+
+import os
+import sqlite3
+import tempfile
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from threading import Lock
+from typing import Any, Literal, Protocol
+
+BlobBackendName = Literal["file", "s3", "memory"]
+
+
+class BlobNotFoundError(KeyError):
+    """Raised when a blob is not in the store."""
+
+
+class BlobStore(Protocol):
+    """Protocol implemented by all blob stores."""
+
+    def put_object(self, key: str, data: bytes) -> None:
+        """Store a blob under a key, replacing any existing one."""
+        ...
+
+    def get_object(self, key: str) -> bytes:
+        """Return a blob, raising BlobNotFoundError if it does not exist."""
+        ...
+
+    def delete_object(self, key: str) -> None:
+        """Remove a blob if present."""
+        ...
+
+    def last_modified(self, key: str) -> float | None:
+        """Return when a blob was last written (Unix time), or None if it does not exist."""
+        ...
+
+
+class FileBlobStore:
+    """Blob store keeping one file per blob in a local directory."""
+
+    def __init__(self, directory: str | Path) -> None:
+        """Initialize the store, creating the directory if needed.
+
+        Args:
+            directory: Root directory for blob files
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def put_object(self, key: str, data: bytes) -> None:
+        """Store a blob atomically."""
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    def get_object(self, key: str) -> bytes:
+        """Return a blob, raising BlobNotFoundError if it does not exist."""
+        try:
+            return self._path(key).read_bytes()
+        except FileNotFoundError as e:
+            raise BlobNotFoundError(key) from e
+
+    def delete_object(self, key: str) -> None:
+        """Remove a blob if present."""
+        self._path(key).unlink(missing_ok=True)
+
+    def last_modified(self, key: str) -> float | None:
+        """Return the blob file's modification time, or None if it does not exist."""
+        try:
+            return self._path(key).stat().st_mtime
+        except FileNotFoundError:
+            return None
+
+    def _path(self, key: str) -> Path:
+        if not key.isalnum():
+            raise ValueError(f"Invalid blob key: {key}")
+        return self.directory / key[:2] / key
+
+
+class LocalS3Client:
+    """In-memory stand-in for a boto3 S3 client.
+
+    Implements just the calls S3BlobStore makes, for tests and local runs
+    without an object store.
+    """
+
+    def __init__(self) -> None:
+        self._buckets: dict[str, dict[str, tuple[bytes, datetime]]] = {}
+        self._lock = Lock()
+
+    def put_object(self, Bucket: str, Key: str, Body: bytes) -> dict[str, Any]:  # noqa: N803
+        with self._lock:
+            self._buckets.setdefault(Bucket, {})[Key] = (bytes(Body), datetime.now(UTC))
+        return {}
+
+    def get_object(self, Bucket: str, Key: str) -> dict[str, Any]:  # noqa: N803
+        body, modified = self._lookup(Bucket, Key)
+        return {"Body": _Body(body), "LastModified": modified}
+
+    def head_object(self, Bucket: str, Key: str) -> dict[str, Any]:  # noqa: N803
+        _, modified = self._lookup(Bucket, Key)
+        return {"LastModified": modified}
+
+    def delete_object(self, Bucket: str, Key: str) -> dict[str, Any]:  # noqa: N803
+        with self._lock:
+            self._buckets.get(Bucket, {}).pop(Key, None)
+        return {}
+
+    def _lookup(self, bucket: str, key: str) -> tuple[bytes, datetime]:
+        with self._lock:
+            try:
+                return self._buckets[bucket][key]
+            except KeyError as e:
+                raise BlobNotFoundError(key) from e
+
+
+class _Body:
+    """Minimal streaming body returned by LocalS3Client.get_object."""
+
+    def __init__(self, data: bytes) -> None:
+        self._data = data
+
+    def read(self) -> bytes:
+        return self._data
+
+
+class S3BlobStore:
+    """Blob store backed by an S3-compatible bucket."""
+
+    def __init__(self, client: Any, bucket: str, prefix: str = "payloads/") -> None:
+        """Initialize the store.
+
+        Args:
+            client: boto3-style S3 client (or a LocalS3Client)
+            bucket: Bucket name
+            prefix: Key prefix for all blobs
+        """
+        self.client = client
+        self.bucket = bucket
+        self.prefix = prefix
+
+    def put_object(self, key: str, data: bytes) -> None:
+        """Upload a blob."""
+        self.client.put_object(Bucket=self.bucket, Key=self.prefix + key, Body=data)
+
+    def get_object(self, key: str) -> bytes:
+        """Download a blob, raising BlobNotFoundError if it does not exist."""
+        response = self._call("get_object", key)
+        data: bytes = response["Body"].read()
+        return data
+
+    def delete_object(self, key: str) -> None:
+        """Delete a blob."""
+        self.client.delete_object(Bucket=self.bucket, Key=self.prefix + key)
+
+    def last_modified(self, key: str) -> float | None:
+        """Return the object's LastModified time, or None if it does not exist."""
+        try:
+            response = self._call("head_object", key)
+        except BlobNotFoundError:
+            return None
+        modified: datetime = response["LastModified"]
+        return modified.timestamp()
+
+    def _call(self, method: str, key: str) -> dict[str, Any]:
+        try:
+            response: dict[str, Any] = getattr(self.client, method)(
+                Bucket=self.bucket, Key=self.prefix + key
+            )
+        except BlobNotFoundError:
+            raise
+        except Exception as e:
+            # botocore raises ClientError/NoSuchKey; treat any error code of that kind as missing
+            code = getattr(e, "response", {}).get("Error", {}).get("Code")
+            if code in ("NoSuchKey", "NotFound", "404"):
+                raise BlobNotFoundError(key) from e
+            raise
+        return response
+
+
+class BlobLedger:
+    """SQLite ledger of the blobs this process has written and when.
+
+    The ledger only saves redundant uploads and remembers which blobs to
+    consider for garbage collection; the store is the source of truth. A
+    blob is rewritten (refreshing its last-modified time) whenever this
+    process offloads it again more than ``refresh_seconds`` after its last
+    write, and ``collect_garbage`` only deletes blobs that the store itself
+    reports as not written for ``max_age`` seconds. Processes with their own
+    ledgers can therefore share one bucket: a blob another process still
+    references keeps getting rewritten and is never old enough to delete.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Open (or create) the ledger.
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS blob_writes ("
+                "key TEXT PRIMARY KEY, written_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS blob_writes_written_at ON blob_writes (written_at)"
+            )
+
+    def close(self) -> None:
+        """Close the ledger database."""
+        self._conn.close()
+
+    def needs_write(self, key: str, refresh_seconds: float, now: float | None = None) -> bool:
+        """Decide whether a blob must be (re)written.
+
+        Args:
+            key: Blob key
+            refresh_seconds: Rewrite blobs last written longer ago than this
+            now: Current time (defaults to time.time())
+
+        Returns:
+            True if this process has not written the blob within ``refresh_seconds``
+        """
+        now = now if now is not None else time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT written_at FROM blob_writes WHERE key = ?", (key,)
+            ).fetchone()
+        return row is None or row[0] <= now - refresh_seconds
+
+    def record_write(self, key: str, now: float | None = None) -> None:
+        """Record a completed upload of a blob.
+
+        Args:
+            key: Blob key
+            now: Time of the write (defaults to time.time())
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO blob_writes (key, written_at) VALUES (?, ?)",
+                (key, now if now is not None else time.time()),
+            )
+
+    def collect_garbage(self, store: BlobStore, max_age: float, now: float | None = None) -> int:
+        """Delete blobs the store reports as not written for ``max_age`` seconds.
+
+        Args:
+            store: Store holding the blobs
+            max_age: Seconds since the last write after which a blob is deleted
+            now: Current time (defaults to time.time())
+
+        Returns:
+            Number of blobs deleted
+        """
+        now = now if now is not None else time.time()
+        cutoff = now - max_age
+        with self._lock:
+            keys = [
+                key
+                for (key,) in self._conn.execute(
+                    "SELECT key FROM blob_writes WHERE written_at <= ?", (cutoff,)
+                )
+            ]
+
+        deleted = 0
+        for key in keys:
+            modified = store.last_modified(key)
+            if modified is not None and modified > cutoff:
+                # Another process rewrote it since; check again once that write ages out
+                with self._lock, self._conn:
+                    self._conn.execute(
+                        "UPDATE blob_writes SET written_at = ? WHERE key = ?", (modified, key)
+                    )
+                continue
+            if modified is not None:
+                store.delete_object(key)
+                deleted += 1
+            with self._lock, self._conn:
+                self._conn.execute("DELETE FROM blob_writes WHERE key = ?", (key,))
+        return deleted
+
+
+def create_blob_store(
+    backend: BlobBackendName,
+    path: str | None = None,
+    bucket: str | None = None,
+    endpoint_url: str | None = None,
+) -> BlobStore:
+    """Build a blob store by name.
+
+    Args:
+        backend: "file", "s3" or "memory" (the in-process S3 stand-in)
+        path: Root directory (file backend)
+        bucket: Bucket name (s3 and memory backends)
+        endpoint_url: Endpoint of an S3-compatible service (s3 backend)
+
+    Returns:
+        The configured blob store
+
+    Raises:
+        ValueError: If required options are missing or the backend is unknown
+        ImportError: If the s3 backend is selected without boto3 installed
+    """
+    if backend == "file":
+        if path is None:
+            raise ValueError("A path is required for the 'file' blob store")
+        return FileBlobStore(path)
+    if backend == "memory":
+        return S3BlobStore(LocalS3Client(), bucket or "payloads")
+    if backend == "s3":
+        if bucket is None:
+            raise ValueError("A bucket is required for the 's3' blob store")
+        import boto3  # type: ignore
+
+        return S3BlobStore(boto3.client("s3", endpoint_url=endpoint_url), bucket)
+    raise ValueError(f"Unknown blob store backend: {backend}")
@@ -0,0 +1,378 @@
+"""Key/value caches with TTL and size-bounded eviction.
+
+Three interchangeable backends are provided:
+
+- ``MemoryCache``: in-process LRU, lost on restart.
+- ``SQLiteCache``: on-disk, shared between processes on the same host.
+- ``FileCache``: one file per entry in a local directory.
+
+Values are opaque bytes; callers are responsible for serialization.
+"""
+
+import hashlib
+import os
+import sqlite3
+import struct
+import tempfile
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Literal, Protocol
+
+CacheBackendName = Literal["memory", "sqlite", "file"]
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for a cache instance."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class CacheBackend(Protocol):
+    """Protocol implemented by all cache backends."""
+
+    stats: CacheStats
+
+    def get(self, key: str) -> bytes | None:
+        """Return the cached value, or None if missing or expired."""
+        ...
+
+    def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        """Store a value, optionally overriding the default TTL (seconds)."""
+        ...
+
+    def delete(self, key: str) -> None:
+        """Remove a value if present."""
+        ...
+
+    def clear(self) -> None:
+        """Remove every value."""
+        ...
+
+
+class MemoryCache:
+    """Thread-safe in-memory LRU cache with per-entry TTL."""
+
+    def __init__(self, max_entries: int = 1024, ttl: float | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries before least-recently-used eviction
+            ttl: Default time-to-live in seconds (None for no expiry)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._items: OrderedDict[str, tuple[float | None, bytes]] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: str) -> bytes | None:
+        """Return the cached value, or None if missing or expired."""
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                self.stats.misses += 1
+                return None
+            expires_at, value = item
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._items[key]
+                self.stats.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.stats.hits += 1
+            return value
+
+    def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        """Store a value, evicting the least recently used entries if full."""
+        ttl = ttl if ttl is not None else self.ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._items[key] = (expires_at, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+                self.stats.evictions += 1
+
+    def delete(self, key: str) -> None:
+        """Remove a value if present."""
+        with self._lock:
+            self._items.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every value."""
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class SQLiteCache:
+    """On-disk cache backed by a single SQLite table.
+
+    Entries are evicted by expiry first and then least-recently-accessed once
+    ``max_entries`` is exceeded.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_entries: int = 10_000,
+        ttl: float | None = None,
+        table: str = "cache",
+    ) -> None:
+        """Initialize the cache, creating the database file if needed.
+
+        Args:
+            path: Path to the SQLite database file
+            max_entries: Maximum number of entries kept on disk
+            ttl: Default time-to-live in seconds (None for no expiry)
+            table: Table name, allowing several caches to share one file
+        """
+        if not table.isidentifier():
+            raise ValueError(f"Invalid cache table name: {table}")
+
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.table = table
+        self.stats = CacheStats()
+        self._lock = Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+                "expires_at REAL, accessed_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {table}_accessed ON {table} (accessed_at)"
+            )
+
+    def get(self, key: str) -> bytes | None:
+        """Return the cached value, or None if missing or expired."""
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                f"SELECT value, expires_at FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.stats.misses += 1
+                return None
+            value, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+                self.stats.misses += 1
+                return None
+            self._conn.execute(
+                f"UPDATE {self.table} SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self.stats.hits += 1
+            return bytes(value)
+
+    def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        """Store a value and evict the oldest entries if over capacity."""
+        now = time.time()
+        ttl = ttl if ttl is not None else self.ttl
+        expires_at = now + ttl if ttl is not None else None
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, value, expires_at, now),
+            )
+            self._evict(now)
+
+    def delete(self, key: str) -> None:
+        """Remove a value if present."""
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        """Remove every value."""
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM {self.table}")
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = self._conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()
+        return int(row[0])
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries, then least-recently-accessed ones over capacity."""
+        cursor = self._conn.execute(
+            f"DELETE FROM {self.table} WHERE expires_at IS NOT NULL AND expires_at <= ?",
+            (now,),
+        )
+        evicted = max(cursor.rowcount, 0)
+        (count,) = self._conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()
+        overflow = count - self.max_entries
+        if overflow > 0:
+            cursor = self._conn.execute(
+                f"DELETE FROM {self.table} WHERE key IN ("
+                f"SELECT key FROM {self.table} ORDER BY accessed_at LIMIT ?)",
+                (overflow,),
+            )
+            evicted += max(cursor.rowcount, 0)
+        self.stats.evictions += evicted
+
+
+class FileCache:
+    """Directory-backed cache storing one file per entry.
+
+    Files are named by the SHA-256 of the key, so arbitrary keys are safe.
+    Each file starts with an 8-byte expiry timestamp; the file's mtime tracks
+    the last access and drives least-recently-used eviction.
+    """
+
+    _HEADER = struct.Struct("!d")
+
+    def __init__(
+        self,
+        directory: str | Path,
+        max_entries: int = 10_000,
+        ttl: float | None = None,
+    ) -> None:
+        """Initialize the cache, creating the directory if needed.
+
+        Args:
+            directory: Directory holding the cache files
+            max_entries: Maximum number of files kept
+            ttl: Default time-to-live in seconds (None for no expiry)
+        """
+        self.directory = Path(directory)
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._lock = Lock()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._count = sum(1 for _ in self._files())
+
+    def get(self, key: str) -> bytes | None:
+        """Return the cached value, or None if missing or expired."""
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            self.stats.misses += 1
+            return None
+
+        (expires_at,) = self._HEADER.unpack_from(data)
+        if expires_at and expires_at <= time.time():
+            self._remove(path)
+            self.stats.misses += 1
+            return None
+
+        os.utime(path)
+        self.stats.hits += 1
+        return data[self._HEADER.size :]
+
+    def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        """Store a value atomically and evict the oldest files if over capacity."""
+        ttl = ttl if ttl is not None else self.ttl
+        expires_at = time.time() + ttl if ttl is not None else 0.0
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        existed = path.exists()
+
+        fd, tmp = tempfile.mkstemp(dir=path.parent)
+        with os.fdopen(fd, "wb") as f:
+            f.write(self._HEADER.pack(expires_at))
+            f.write(value)
+        os.replace(tmp, path)
+
+        with self._lock:
+            if not existed:
+                self._count += 1
+            if self._count > self.max_entries:
+                self._evict()
+
+    def delete(self, key: str) -> None:
+        """Remove a value if present."""
+        self._remove(self._path(key))
+
+    def clear(self) -> None:
+        """Remove every value."""
+        for path in list(self._files()):
+            self._remove(path)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return self.directory / digest[:2] / digest
+
+    def _files(self) -> list[Path]:
+        return [p for p in self.directory.glob("??/*") if p.is_file() and len(p.name) == 64]
+
+    def _remove(self, path: Path) -> None:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            return
+        with self._lock:
+            self._count = max(self._count - 1, 0)
+
+    def _evict(self) -> None:
+        """Drop least-recently-used files until back under capacity (lock held)."""
+        files = sorted(self._files(), key=lambda p: p.stat().st_mtime)
+        overflow = len(files) - self.max_entries
+        for path in files[: max(overflow, 0)]:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            self.stats.evictions += 1
+        self._count = min(len(files), self.max_entries)
+
+
+def create_cache(
+    backend: CacheBackendName,
+    namespace: str,
+    path: str | None = None,
+    max_entries: int = 10_000,
+    ttl: float | None = None,
+) -> CacheBackend:
+    """Build a cache backend by name.
+
+    Args:
+        backend: "memory", "sqlite" or "file"
+        namespace: Table (SQLite) or sub-directory (file) isolating this cache
+        path: SQLite database file or cache root directory (required on disk)
+        max_entries: Maximum number of entries kept
+        ttl: Default time-to-live in seconds
+
+    Returns:
+        The configured cache backend
+
+    Raises:
+        ValueError: If the backend is unknown or an on-disk backend has no path
+    """
+    if backend == "memory":
+        return MemoryCache(max_entries=max_entries, ttl=ttl)
+    if path is None:
+        raise ValueError(f"A path is required for the '{backend}' cache backend")
+    if backend == "sqlite":
+        return SQLiteCache(path, max_entries=max_entries, ttl=ttl, table=namespace)
+    if backend == "file":
+        return FileCache(Path(path) / namespace, max_entries=max_entries, ttl=ttl)
+    raise ValueError(f"Unknown cache backend: {backend}")
@@ -0,0 +1,261 @@
+"""Brave Search API client."""
+
+import json
+import time
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any
+
+import httpx
+import inject
+import structlog
+
+from ..cache import CacheBackend, create_cache
+from ..config.brave import BraveSearchSettings
+from ..rate_limit import RateLimiter
+
+logger = structlog.get_logger()
+
+
+@dataclass
+class EndpointLatency:
+    """Latency statistics for one API endpoint."""
+
+    calls: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    last_seconds: float = 0.0
+
+    @property
+    def mean_seconds(self) -> float:
+        """Average request latency."""
+        return self.total_seconds / self.calls if self.calls else 0.0
+
+    def record(self, seconds: float) -> None:
+        """Record one request's latency."""
+        self.calls += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.last_seconds = seconds
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a search query for cache lookups (case and whitespace insensitive)."""
+    return " ".join(query.lower().split())
+
+
+def _parse_rate_header(value: str | None) -> list[int]:
+    """Parse Brave's comma-separated per-second/per-month rate limit headers."""
+    if not value:
+        return []
+    try:
+        return [int(part) for part in value.split(",")]
+    except ValueError:
+        return []
+
+
+class BraveSearchClient:
+    """Client for the Brave web and local search endpoints.
+
+    Holds one pooled HTTP client for the worker process and records
+    per-endpoint latency in ``latency``. Requests are paced by a worker-wide
+    token bucket tuned from Brave's ``X-RateLimit-*`` headers, and results are
+    stored in a persistent cache keyed on the normalized query so batch
+    re-runs and activity retries do not spend quota twice.
+    """
+
+    @inject.params(settings=BraveSearchSettings)
+    def __init__(
+        self,
+        settings: BraveSearchSettings,
+        transport: httpx.AsyncBaseTransport | None = None,
+        cache: CacheBackend | None = None,
+    ):
+        """Initialize Brave Search client.
+
+        Args:
+            settings: Brave Search settings (injected via DI)
+            transport: Optional custom transport (used by tests)
+            cache: Optional query cache; built from settings when omitted
+        """
+        self.settings = settings
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+        self.latency: dict[str, EndpointLatency] = {
+            "web": EndpointLatency(),
+            "local": EndpointLatency(),
+        }
+        self.rate_limiter = RateLimiter(
+            rate=settings.requests_per_second,
+            burst=settings.burst,
+            max_wait_seconds=settings.max_rate_limit_wait_seconds,
+        )
+        self.cache = cache
+        if cache is None and settings.cache_enabled:
+            self.cache = create_cache(
+                settings.cache_backend,
+                namespace="brave_queries",
+                path=settings.cache_path,
+                max_entries=settings.cache_max_entries,
+                ttl=settings.cache_ttl_seconds,
+            )
+        self.credits_saved = 0
+        self.monthly_remaining: int | None = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating the connection pool on first use."""
+        if not self.settings.api_key:
+            raise ValueError("BRAVE_SEARCH_API environment variable not set")
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.settings.base_url,
+                headers={
+                    "Accept": "application/json",
+                    "X-Subscription-Token": self.settings.api_key,
+                },
+                timeout=self.settings.timeout_seconds,
+                transport=self._transport,
+            )
+        return self._client
+
+    async def _get(self, endpoint: str, path: str, params: dict[str, Any]) -> httpx.Response:
+        """GET an endpoint through the rate limiter, retrying 429 responses."""
+        client = self.client
+        max_retries = self.settings.max_retries
+        for attempt in range(max_retries + 1):
+            await self.rate_limiter.acquire()
+            start = time.perf_counter()
+            try:
+                response = await client.get(path, params=params)
+            finally:
+                self.latency[endpoint].record(time.perf_counter() - start)
+
+            retry_after = self._observe_quota(response)
+            if response.status_code != 429 or attempt == max_retries:
+                return response
+
+            logger.warning(
+                "brave_rate_limited",
+                endpoint=endpoint,
+                retry_after=retry_after,
+                attempt=attempt + 1,
+            )
+            self.rate_limiter.pause_for(retry_after)
+
+        return response
+
+    def _observe_quota(self, response: httpx.Response) -> float:
+        """Track quota from rate limit headers.
+
+        Returns:
+            Seconds until the per-second window resets (used for retries)
+        """
+        remaining = _parse_rate_header(response.headers.get("X-RateLimit-Remaining"))
+        reset = _parse_rate_header(response.headers.get("X-RateLimit-Reset"))
+        per_second_reset = float(reset[0]) if reset else 1.0
+
+        if len(remaining) > 1:
+            self.monthly_remaining = remaining[1]
+        if remaining and remaining[0] == 0:
+            self.rate_limiter.pause_for(per_second_reset)
+        return per_second_reset
+
+    def _lookup(
+        self, endpoint: str, params: dict[str, Any], query: str
+    ) -> tuple[str, dict[str, Any] | None]:
+        """Look up a query in the cache.
+
+        Returns:
+            The cache key and the cached result (None on a miss)
+        """
+        extra = ",".join(f"{k}={v}" for k, v in sorted(params.items()) if k != "q")
+        key = f"{endpoint}:{normalize_query(query)}:{extra}"
+        if self.cache is None:
+            return key, None
+        cached = self.cache.get(key)
+        if cached is None:
+            return key, None
+        self.credits_saved += 1
+        return key, json.loads(cached)
+
+    def _store(self, key: str, response: httpx.Response) -> None:
+        """Cache a successful response body."""
+        if self.cache is not None:
+            self.cache.set(key, response.content)
+
+    async def web_search(self, query: str, count: int = 10) -> dict[str, Any]:
+        """Run a web search.
+
+        Args:
+            query: Search query
+            count: Number of results to request
+
+        Returns:
+            Raw web search response
+        """
+        params: dict[str, Any] = {"q": query, "count": count}
+        key, cached = self._lookup("web", params, query)
+        if cached is not None:
+            return cached
+
+        response = await self._get("web", "/web/search", params)
+        response.raise_for_status()
+        self._store(key, response)
+        data: dict[str, Any] = response.json()
+        return data
+
+    async def local_search(self, query: str) -> dict[str, Any]:
+        """Run a local POI search.
+
+        Local results are best-effort: a non-200 response yields an empty result.
+
+        Args:
+            query: Search query
+
+        Returns:
+            Raw local search response, or an empty dict
+        """
+        params: dict[str, Any] = {"q": query}
+        key, cached = self._lookup("local", params, query)
+        if cached is not None:
+            return cached
+
+        response = await self._get("local", "/local/search", params)
+        if response.status_code != 200:
+            return {}
+        self._store(key, response)
+        data: dict[str, Any] = response.json()
+        return data
+
+    def quota_report(self) -> dict[str, Any]:
+        """Summarize quota usage for this worker process.
+
+        Returns:
+            Requests sent, cache hits (credits saved) and the last known monthly quota
+        """
+        sent = sum(stats.calls for stats in self.latency.values())
+        return {
+            "requests_sent": sent,
+            "credits_saved": self.credits_saved,
+            "monthly_remaining": self.monthly_remaining,
+            "mean_wait_seconds": round(self.rate_limiter.metrics.mean_wait_seconds, 3),
+            "max_queue_depth": self.rate_limiter.metrics.max_queue_depth,
+        }
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "BraveSearchClient":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.aclose()
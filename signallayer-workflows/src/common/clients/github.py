@@ -1,14 +1,24 @@
 """GitHub API client for collaboration platform integration."""
 
+import asyncio
+import json
+import time
+from collections.abc import AsyncIterator
 from datetime import datetime
+from types import TracebackType
 from typing import Any
 
-import inject
 import httpx
+import inject
+import structlog
 from pydantic import BaseModel
 
+from ..cache import CacheBackend, MemoryCache, SQLiteCache
 from ..config.github import GitHubSettings
 from ..models import IssueDetails, IssueReference
+from ..rate_limit import RateLimiter
+
+logger = structlog.get_logger()
 
 
 class GitHubIssue(BaseModel):
@@ -30,14 +40,35 @@ class GitHubClient:
 
     Handles authentication, rate limiting, and API interactions.
     Returns platform-agnostic models for use by CollaborationContext.
+
+    A single pooled ``httpx.AsyncClient`` is created lazily and reused for
+    every call, so connections (and TLS sessions) to the API are kept alive
+    between requests. Call ``aclose()`` on shutdown to release the pool.
+
+    Reads go through an ETag cache: repeated GETs are sent with
+    ``If-None-Match``/``If-Modified-Since`` and a ``304 Not Modified`` is
+    served from the cache without counting against the rate limit.
+
+    Every request is scheduled through a token-bucket ``RateLimiter`` that is
+    tuned from ``X-RateLimit-*`` response headers. Throttled responses
+    (429, or 403 with ``Retry-After``, an exhausted quota or a secondary-limit
+    message) pause the bucket for all callers and are retried up to
+    ``settings.max_retries`` times.
     """
 
     @inject.params(settings=GitHubSettings)
-    def __init__(self, settings: GitHubSettings):
+    def __init__(
+        self,
+        settings: GitHubSettings,
+        transport: httpx.AsyncBaseTransport | None = None,
+        cache: CacheBackend | None = None,
+    ):
         """Initialize GitHub client.
 
         Args:
             settings: GitHub settings (injected via DI)
+            transport: Optional custom transport (used by tests and benchmarks)
+            cache: Optional response cache; built from settings when omitted
         """
         self.settings = settings
         self.base_url = self.settings.base_url.rstrip("/")
@@ -46,12 +77,220 @@ class GitHubClient:
             "Accept": "application/vnd.github+json",
             "X-GitHub-Api-Version": "2022-11-28",
         }
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+        self.cache = cache if cache is not None else self._create_cache()
+        self.rate_limiter = RateLimiter(
+            rate=self.settings.requests_per_second,
+            burst=self.settings.burst,
+            max_wait_seconds=self.settings.max_rate_limit_wait_seconds,
+        )
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating the connection pool on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = self._create_client()
+        return self._client
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """Build the pooled HTTP client from settings."""
+        http2 = self.settings.http2
+        if http2:
+            try:
+                import h2  # type: ignore  # noqa: F401
+            except ImportError:
+                logger.warning("github_http2_unavailable", reason="h2 package not installed")
+                http2 = False
+
+        limits = httpx.Limits(
+            max_connections=self.settings.max_connections,
+            max_keepalive_connections=self.settings.max_keepalive_connections,
+            keepalive_expiry=self.settings.keepalive_expiry_seconds,
+        )
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self.headers,
+            timeout=self.settings.timeout_seconds,
+            limits=limits,
+            http2=http2,
+            transport=self._transport,
+        )
+
+    def _create_cache(self) -> CacheBackend | None:
+        """Build the response cache configured in settings."""
+        if not self.settings.cache_enabled:
+            return None
+        if self.settings.cache_path:
+            return SQLiteCache(
+                self.settings.cache_path,
+                max_entries=self.settings.cache_max_entries,
+                ttl=self.settings.cache_ttl_seconds,
+                table="github_responses",
+            )
+        return MemoryCache(
+            max_entries=self.settings.cache_max_entries,
+            ttl=self.settings.cache_ttl_seconds,
+        )
+
+    async def _send(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request through the rate limiter, retrying when GitHub throttles it.
+
+        Args:
+            method: HTTP method
+            url: Path relative to the API base URL (or an absolute pagination URL)
+            **kwargs: Extra arguments passed to ``httpx.AsyncClient.request``
+
+        Returns:
+            The final response (callers still check its status)
+
+        Raises:
+            RateLimitExceededError: If a request would be queued for too long; its
+                ``next_retry_delay`` tells Temporal when to retry the activity
+        """
+        max_retries = self.settings.max_retries
+        for attempt in range(max_retries + 1):
+            wait = await self.rate_limiter.acquire()
+            if wait >= 1.0:
+                logger.info(
+                    "github_request_delayed",
+                    wait_seconds=round(wait, 3),
+                    queue_depth=self.rate_limiter.metrics.queue_depth,
+                )
+
+            response = await self.client.request(method, url, **kwargs)
+            retry_after = self._observe_rate_limit(response, attempt)
+            if retry_after is None or attempt == max_retries:
+                return response
+
+            logger.warning(
+                "github_rate_limited",
+                status_code=response.status_code,
+                retry_after=retry_after,
+                attempt=attempt + 1,
+            )
+            self.rate_limiter.pause_for(retry_after)
+
+        return response
+
+    def _observe_rate_limit(self, response: httpx.Response, attempt: int = 0) -> float | None:
+        """Tune the limiter from rate-limit headers.
+
+        Args:
+            response: Response to inspect
+            attempt: Number of retries already made for this request
+
+        Returns:
+            Seconds to wait before retrying if the response was throttled, else None
+        """
+        headers = response.headers
+        remaining_header = headers.get("X-RateLimit-Remaining")
+        reset_header = headers.get("X-RateLimit-Reset")
+        limit_header = headers.get("X-RateLimit-Limit")
+
+        remaining: int | None = None
+        seconds_to_reset: float | None = None
+        if remaining_header is not None and reset_header is not None:
+            remaining = int(remaining_header)
+            seconds_to_reset = max(float(reset_header) - time.time(), 0.0)
+            limit = int(limit_header) if limit_header else remaining
+            if remaining == 0:
+                self.rate_limiter.pause_for(seconds_to_reset)
+            elif remaining <= limit * 0.1:
+                # Spread the last tenth of the quota evenly until it resets
+                self.rate_limiter.set_rate(
+                    min(self.settings.requests_per_second, remaining / max(seconds_to_reset, 1.0))
+                )
+            else:
+                self.rate_limiter.set_rate(self.settings.requests_per_second)
+
+        retry_after = headers.get("Retry-After")
+        throttled = response.status_code == 429 or (
+            response.status_code == 403
+            and (
+                remaining == 0
+                or retry_after is not None
+                or "secondary rate limit" in response.text.lower()
+            )
+        )
+        if not throttled:
+            return None
+        if retry_after is not None:
+            return float(retry_after)
+        if remaining == 0 and seconds_to_reset is not None:
+            return seconds_to_reset
+        # Secondary rate limits without guidance: back off exponentially, but stay
+        # within the limiter's queueing cap so the retry is not rejected outright
+        cap = max(self.settings.max_rate_limit_wait_seconds - 1 / self.rate_limiter.rate, 0.0)
+        return min(self.settings.secondary_rate_limit_backoff_seconds * 2.0**attempt, cap)
+
+    async def _get_json(self, url: str) -> Any:
+        """GET a JSON resource, revalidating cached copies with conditional requests.
+
+        Args:
+            url: Path relative to the API base URL
+
+        Returns:
+            Decoded JSON body
+        """
+        if self.cache is None:
+            response = await self._send("GET", url)
+            response.raise_for_status()
+            return response.json()
+
+        key = f"GET {url}"
+        cached = self.cache.get(key)
+        validators: dict[str, str] = {}
+        content = b""
+        if cached is not None:
+            raw_validators, content = cached.split(b"\n", 1)
+            validators = json.loads(raw_validators)
+
+        headers = {}
+        if "etag" in validators:
+            headers["If-None-Match"] = validators["etag"]
+        if "last_modified" in validators:
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+        response = await self._send("GET", url, headers=headers)
+        if cached is not None and response.status_code == 304:
+            return json.loads(content)
+
+        response.raise_for_status()
+        validators = {}
+        if etag := response.headers.get("ETag"):
+            validators["etag"] = etag
+        if last_modified := response.headers.get("Last-Modified"):
+            validators["last_modified"] = last_modified
+        if validators:
+            self.cache.set(key, json.dumps(validators).encode() + b"\n" + response.content)
+        return response.json()
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and release pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "GitHubClient":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.aclose()
 
     async def fetch_issues_by_label(
         self, repository: str, label: str, state: str = "open"
     ) -> list[IssueReference]:
         """Fetch issues from a GitHub repository filtered by label.
 
+        Follows pagination so every matching issue is returned. Use
+        ``iter_issues_by_label`` to process large result sets incrementally.
+
         Args:
             repository: Repository in format "owner/repo"
             label: Label to filter by
@@ -60,24 +299,54 @@ class GitHubClient:
         Returns:
             List of issue references
         """
-        url = f"{self.base_url}/repos/{repository}/issues"
-        params = {"labels": label, "state": state, "per_page": 100}
+        return [issue async for issue in self.iter_issues_by_label(repository, label, state)]
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            issues_data = response.json()
+    async def iter_issues_by_label(
+        self, repository: str, label: str, state: str = "open", per_page: int = 100
+    ) -> AsyncIterator[IssueReference]:
+        """Stream issues filtered by label, following the ``Link: rel="next"`` header.
 
-        return [
-            IssueReference(
-                platform="github",
-                number=issue["number"],
-                repository=repository,
-                title=issue["title"],
-                url=issue["html_url"],
-            )
-            for issue in issues_data
-        ]
+        The next page is requested as soon as the current one arrives, so
+        network time overlaps with the caller consuming the current page.
+        At most two pages are held in memory at once.
+
+        Args:
+            repository: Repository in format "owner/repo"
+            label: Label to filter by
+            state: Issue state filter (open, closed, all)
+            per_page: Page size requested from the API (max 100)
+
+        Yields:
+            Issue references, in API order
+        """
+        url = f"/repos/{repository}/issues"
+        params = {"labels": label, "state": state, "per_page": per_page}
+
+        pending: asyncio.Task[httpx.Response] | None = asyncio.create_task(
+            self._send("GET", url, params=params)
+        )
+        try:
+            while pending is not None:
+                response = await pending
+                response.raise_for_status()
+
+                # Prefetch the next page while this one is being consumed
+                next_link = response.links.get("next", {}).get("url")
+                pending = (
+                    asyncio.create_task(self._send("GET", next_link)) if next_link else None
+                )
+
+                for issue in response.json():
+                    yield IssueReference(
+                        platform="github",
+                        number=issue["number"],
+                        repository=repository,
+                        title=issue["title"],
+                        url=issue["html_url"],
+                    )
+        finally:
+            if pending is not None and not pending.done():
+                pending.cancel()
 
     async def fetch_issue_details(self, repository: str, issue_number: int) -> IssueDetails:
         """Fetch complete details for a specific GitHub issue.
@@ -89,12 +358,8 @@ class GitHubClient:
         Returns:
             Complete issue details
         """
-        url = f"{self.base_url}/repos/{repository}/issues/{issue_number}"
-
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=self.headers)
-            response.raise_for_status()
-            issue_data = response.json()
+        url = f"/repos/{repository}/issues/{issue_number}"
+        issue_data = await self._get_json(url)
 
         # Parse into GitHub model first for validation
         github_issue = GitHubIssue(**issue_data)
@@ -125,13 +390,12 @@ class GitHubClient:
         Returns:
             Comment ID
         """
-        url = f"{self.base_url}/repos/{repository}/issues/{issue_number}/comments"
+        url = f"/repos/{repository}/issues/{issue_number}/comments"
         payload = {"body": body}
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, headers=self.headers, json=payload)
-            response.raise_for_status()
-            return response.json().get("id")
+        response = await self._send("POST", url, json=payload)
+        response.raise_for_status()
+        return response.json().get("id")
 
     async def get_comment(self, repository: str, comment_id: int) -> str:
         """Get the body of a GitHub issue comment.
@@ -143,12 +407,9 @@ class GitHubClient:
         Returns:
             Comment body
         """
-        url = f"{self.base_url}/repos/{repository}/issues/comments/{comment_id}"
-
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=self.headers)
-            response.raise_for_status()
-            return response.json().get("body", "")
+        url = f"/repos/{repository}/issues/comments/{comment_id}"
+        comment_data = await self._get_json(url)
+        return comment_data.get("body", "")
 
     async def list_comments(self, repository: str, issue_number: int) -> list[dict]:
         """List comments on a GitHub issue.
@@ -160,12 +421,8 @@ class GitHubClient:
         Returns:
             List of comment dictionaries
         """
-        url = f"{self.base_url}/repos/{repository}/issues/{issue_number}/comments"
-
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=self.headers)
-            response.raise_for_status()
-            comments_data = response.json()
+        url = f"/repos/{repository}/issues/{issue_number}/comments"
+        comments_data = await self._get_json(url)
 
         return [
             {
@@ -185,12 +442,11 @@ class GitHubClient:
             comment_id: Comment ID
             body: Comment body
         """
-        url = f"{self.base_url}/repos/{repository}/issues/comments/{comment_id}"
+        url = f"/repos/{repository}/issues/comments/{comment_id}"
         payload = {"body": body}
 
-        async with httpx.AsyncClient() as client:
-            response = await client.patch(url, headers=self.headers, json=payload)
-            response.raise_for_status()
+        response = await self._send("PATCH", url, json=payload)
+        response.raise_for_status()
 
     async def add_labels(self, repository: str, issue_number: int, labels: list[str]) -> None:
         """Add labels to an issue.
@@ -200,12 +456,11 @@ class GitHubClient:
             issue_number: Issue number
             labels: List of labels to add
         """
-        url = f"{self.base_url}/repos/{repository}/issues/{issue_number}/labels"
+        url = f"/repos/{repository}/issues/{issue_number}/labels"
         payload = {"labels": labels}
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, headers=self.headers, json=payload)
-            response.raise_for_status()
+        response = await self._send("POST", url, json=payload)
+        response.raise_for_status()
 
     async def remove_label(self, repository: str, issue_number: int, label: str) -> None:
         """Remove a label from an issue.
@@ -215,10 +470,9 @@ class GitHubClient:
             issue_number: Issue number
             label: Label name to remove
         """
-        url = f"{self.base_url}/repos/{repository}/issues/{issue_number}/labels/{label}"
+        url = f"/repos/{repository}/issues/{issue_number}/labels/{label}"
 
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(url, headers=self.headers)
-            # Ignore 404 (label already removed)
-            if response.status_code != 404:
-                response.raise_for_status()
+        response = await self._send("DELETE", url)
+        # Ignore 404 (label already removed)
+        if response.status_code != 404:
+            response.raise_for_status()
@@ -2,24 +2,47 @@ from .model import RedditSearchResult
 from .model import RedditCommunityPost
 from .model import RedditCommunity
 from .model import ScrapingBeeReponse
+from typing import Any
+
 import inject
-from scrapingbee import ScrapingBeeClient
+
+from ...scrape_cache import ScrapeCache
+from ..scrapingbee import AsyncScrapingBeeClient
 
 
 class RedditClient:
-    """Client for interacting with Reddit via ScrapingBee."""
+    """Client for interacting with Reddit via ScrapingBee.
+
+    All methods are coroutines so scrapes run concurrently on the worker's
+    event loop instead of blocking it. Responses are served from the shared
+    ScrapeCache when the same URL was scraped with the same parameters.
+    """
 
-    @inject.params(client=ScrapingBeeClient)
-    def __init__(self, client: ScrapingBeeClient):
+    @inject.params(client=AsyncScrapingBeeClient, cache=ScrapeCache)
+    def __init__(self, client: AsyncScrapingBeeClient, cache: ScrapeCache | None = None):
         """Initialize Reddit client.
 
         Args:
-            client: ScrapingBee client (injected via DI)
+            client: Async ScrapingBee client (injected via DI)
+            cache: Scrape cache (injected via DI, None disables caching)
         """
         self.client = client
+        self.cache = cache
         self.base_url = "https://www.reddit.com"
 
-    def list_communities(self, q: str) -> ScrapingBeeReponse[RedditCommunity]:
+    async def _scrape(self, url: str, params: dict[str, Any]) -> str:
+        """Scrape a URL through ScrapingBee, using the cache when available."""
+
+        async def fetch() -> str:
+            response = await self.client.get(url, params=params)
+            response.raise_for_status()
+            return response.text
+
+        if self.cache is None:
+            return await fetch()
+        return await self.cache.get_or_fetch(url, fetch, params)
+
+    async def list_communities(self, q: str) -> ScrapingBeeReponse[RedditCommunity]:
         url = f"{self.base_url}/search/?q={q}&type=communities"
         params = params = {
             "render_js": False,
@@ -44,11 +67,13 @@ class RedditClient:
                 }
             },
         }
-        response = self.client.get(url, params=params)
-        response.raise_for_status()
-        return ScrapingBeeReponse[RedditCommunity](**response.json())
+        return ScrapingBeeReponse[RedditCommunity].model_validate_json(
+            await self._scrape(url, params)
+        )
 
-    def latest_community_posts(self, community: str) -> ScrapingBeeReponse[RedditCommunityPost]:
+    async def latest_community_posts(
+        self, community: str
+    ) -> ScrapingBeeReponse[RedditCommunityPost]:
         url = f"{self.base_url}/{community}/"
         params = params = {
             "js_scenario": {
@@ -79,11 +104,13 @@ class RedditClient:
                 }
             },
         }
-        response = self.client.get(url, params=params)
-        response.raise_for_status()
-        return ScrapingBeeReponse[RedditCommunityPost](**response.json())
+        return ScrapingBeeReponse[RedditCommunityPost].model_validate_json(
+            await self._scrape(url, params)
+        )
 
-    def search_community(self, q: str, community: str) -> ScrapingBeeReponse[RedditSearchResult]:
+    async def search_community(
+        self, q: str, community: str
+    ) -> ScrapingBeeReponse[RedditSearchResult]:
         url = f"{self.base_url}/r/{community}/search/?q={q}"
         params = {
             "render_js": False,
@@ -101,15 +128,16 @@ class RedditClient:
                 }
             },
         }
-        response = self.client.get(url, params=params)
-        response.raise_for_status()
-        return ScrapingBeeReponse[RedditSearchResult](**response.json())
+        return ScrapingBeeReponse[RedditSearchResult].model_validate_json(
+            await self._scrape(url, params)
+        )
 
-    def get_community_post_markdown(self, community: str, post_id: str) -> str:
-        return self.get_community_post_markdown_by_url(f"{self.base_url}/r/{community}/comments/{post_id}")
-     
+    async def get_community_post_markdown(self, community: str, post_id: str) -> str:
+        return await self.get_community_post_markdown_by_url(
+            f"{self.base_url}/r/{community}/comments/{post_id}"
+        )
 
-    def get_community_post_markdown_by_url(self, url: str) -> str:
+    async def get_community_post_markdown_by_url(self, url: str) -> str:
         params = {
             "js_scenario": {
                 "instructions": [
@@ -121,6 +149,4 @@ class RedditClient:
             "wait": 100,
             "return_page_markdown": True,
         }
-        response = self.client.get(url, params=params)
-        response.raise_for_status()
-        return response.text
\ No newline at end of file
+        return await self._scrape(url, params)
\ No newline at end of file
@@ -0,0 +1,116 @@
+"""Plain-HTTP page fetcher that converts pages to markdown."""
+
+import asyncio
+from types import TracebackType
+
+import httpx
+import inject
+from bs4 import BeautifulSoup
+from markdownify import markdownify as md
+
+from ..scrape_cache import ScrapeCache
+
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+
+# Identifies the conversion applied to cached bodies
+_MARKDOWN_PARAMS = {"format": "markdown"}
+
+
+def html_to_markdown(html: str) -> str:
+    """Convert an HTML page to compact markdown.
+
+    Strips scripts, styles and page chrome, then drops blank lines.
+
+    Args:
+        html: Raw HTML
+
+    Returns:
+        Markdown content
+    """
+    soup = BeautifulSoup(html, "html.parser")
+
+    # Remove script and style elements
+    for script in soup(["script", "style", "nav", "footer", "header"]):
+        script.decompose()
+
+    # Convert to markdown
+    markdown_content = md(str(soup), heading_style="ATX")
+
+    # Clean up excessive whitespace
+    lines = [line.strip() for line in markdown_content.split("\n")]
+    return "\n".join(line for line in lines if line)
+
+
+class WebPageClient:
+    """Fetches web pages over a pooled HTTP client and returns them as markdown.
+
+    Converted pages are stored in the shared ScrapeCache, and the CPU-bound
+    HTML conversion runs in a thread so it does not block the event loop.
+    """
+
+    @inject.params(cache=ScrapeCache)
+    def __init__(
+        self,
+        cache: ScrapeCache | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        """Initialize the page fetcher.
+
+        Args:
+            cache: Scrape cache (injected via DI, None disables caching)
+            transport: Optional custom transport (used by tests)
+        """
+        self.cache = cache
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating the connection pool on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                follow_redirects=True,
+                timeout=30.0,
+                headers={"User-Agent": USER_AGENT},
+                transport=self._transport,
+            )
+        return self._client
+
+    async def get_markdown(self, url: str) -> str:
+        """Fetch a page and return its content as markdown.
+
+        Args:
+            url: The URL to fetch
+
+        Returns:
+            Markdown content of the page
+
+        Raises:
+            httpx.HTTPError: If the page cannot be fetched
+        """
+
+        async def fetch() -> str:
+            response = await self.client.get(url)
+            response.raise_for_status()
+            return await asyncio.to_thread(html_to_markdown, response.text)
+
+        if self.cache is None:
+            return await fetch()
+        return await self.cache.get_or_fetch(url, fetch, _MARKDOWN_PARAMS)
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "WebPageClient":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.aclose()
@@ -0,0 +1,244 @@
+"""Persistent index over PropertyGuru condo JSON files."""
+
+import hashlib
+import json
+import re
+import sqlite3
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+INDEX_FILENAME = ".condo_index.sqlite"
+BUSY_TIMEOUT_MS = 5000
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize a street or condo name for use in filenames and lookups.
+
+    Examples:
+        "Admiralty Drive" -> "admiralty_drive"
+        "St. George's Lane" -> "st_georges_lane"
+    """
+    normalized = name.lower()
+    normalized = re.sub(r"['\"]", "", normalized)
+    normalized = re.sub(r"[.\s-]+", "_", normalized)
+    normalized = re.sub(r"_+", "_", normalized)
+    return normalized.strip("_")
+
+
+def _iter_items(data: Any) -> Iterator[dict[str, Any]]:
+    """Yield autocomplete items from a saved file; only list-shaped files hold any."""
+    if isinstance(data, list):
+        for item in data:
+            if isinstance(item, dict):
+                yield item
+
+
+class CondoIndex:
+    """SQLite index of condo entries keyed by normalized name and displayType.
+
+    Lives next to the JSON files it indexes. ``refresh`` re-parses only
+    files whose size/mtime changed and whose content hash differs, so
+    repeated listings cost a directory scan plus an indexed query. The
+    database runs in WAL mode with a busy timeout, since activities write
+    to it concurrently.
+    """
+
+    def __init__(self, directory: str | Path, db_path: str | Path | None = None):
+        """Open (or create) the index for a data directory.
+
+        Args:
+            directory: Directory holding the condo JSON files
+            db_path: Index database file (defaults to a hidden file in ``directory``)
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.db_path = Path(db_path) if db_path else self.directory / INDEX_FILENAME
+        self._lock = Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS files (
+                    path TEXT PRIMARY KEY, mtime REAL NOT NULL,
+                    size INTEGER NOT NULL, sha256 TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS condos (
+                    path TEXT NOT NULL, name TEXT NOT NULL, normalized_name TEXT NOT NULL,
+                    display_type TEXT, address TEXT
+                );
+                CREATE INDEX IF NOT EXISTS condos_type_name ON condos (display_type, name);
+                CREATE INDEX IF NOT EXISTS condos_normalized ON condos (normalized_name);
+                CREATE INDEX IF NOT EXISTS condos_path ON condos (path);
+                """
+            )
+
+    def close(self) -> None:
+        """Close the index database."""
+        self._conn.close()
+
+    def refresh(self, pattern: str = "*.json") -> int:
+        """Bring the index up to date with the files on disk.
+
+        Args:
+            pattern: Glob pattern selecting the files to index
+
+        Returns:
+            Number of files that were (re-)parsed
+        """
+        with self._lock:
+            known = {
+                path: (mtime, size, sha)
+                for path, mtime, size, sha in self._conn.execute(
+                    "SELECT path, mtime, size, sha256 FROM files"
+                )
+            }
+
+        parsed = 0
+        seen = set()
+        for file_path in self.directory.glob(pattern):
+            key = str(file_path)
+            seen.add(key)
+            stat = file_path.stat()
+            previous = known.get(key)
+            if previous and previous[0] == stat.st_mtime and previous[1] == stat.st_size:
+                continue
+
+            content = file_path.read_bytes()
+            sha = hashlib.sha256(content).hexdigest()
+            if previous and previous[2] == sha:
+                # Touched but unchanged: record the new mtime without re-parsing
+                self._record_file(key, stat.st_mtime, stat.st_size, sha, items=None)
+                continue
+
+            try:
+                data = json.loads(content)
+            except ValueError:
+                data = []
+            self._record_file(key, stat.st_mtime, stat.st_size, sha, items=_iter_items(data))
+            parsed += 1
+
+        removed = set(known) - seen
+        if removed:
+            with self._lock, self._conn:
+                for path in removed:
+                    self._conn.execute("DELETE FROM files WHERE path = ?", (path,))
+                    self._conn.execute("DELETE FROM condos WHERE path = ?", (path,))
+        return parsed
+
+    def index_file(self, file_path: str | Path, data: Any) -> None:
+        """Index a file that was just written, avoiding a re-parse on the next refresh.
+
+        Args:
+            file_path: Path of the written JSON file
+            data: The data that was written to it
+        """
+        path = Path(file_path)
+        stat = path.stat()
+        sha = hashlib.sha256(path.read_bytes()).hexdigest()
+        self._record_file(str(path), stat.st_mtime, stat.st_size, sha, items=_iter_items(data))
+
+    def list_condos(
+        self,
+        display_types: Iterable[str],
+        offset: int = 0,
+        limit: int | None = None,
+        after: str | None = None,
+    ) -> list[dict[str, str]]:
+        """List unique condos of the given display types, sorted by name.
+
+        Prefer ``after`` over ``offset`` for paging through a catalog that may
+        change between calls: a keyset cursor neither skips nor repeats
+        condos when files are added or removed in between.
+
+        Args:
+            display_types: displayType values to include
+            offset: Number of condos to skip
+            limit: Maximum number of condos to return (None for all)
+            after: Only return condos whose name sorts after this one
+
+        Returns:
+            List of dicts with 'name' and 'address' keys
+        """
+        types = list(display_types)
+        placeholders = ",".join("?" for _ in types)
+        after_clause = "" if after is None else "AND name > ? "
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT name, address FROM condos WHERE rowid IN ("
+                f"SELECT MIN(rowid) FROM condos WHERE display_type IN ({placeholders}) "
+                f"{after_clause}GROUP BY name) ORDER BY name LIMIT ? OFFSET ?",
+                [
+                    *types,
+                    *([] if after is None else [after]),
+                    -1 if limit is None else limit,
+                    offset,
+                ],
+            ).fetchall()
+        return [{"name": name, "address": address or name} for name, address in rows]
+
+    def find_item(self, name: str) -> dict[str, Any] | None:
+        """Return the saved autocomplete record for a condo, if any file lists it.
+
+        Args:
+            name: Condo name (un-normalized)
+
+        Returns:
+            The first matching record from the first file listing it, or None
+        """
+        normalized = normalize_name(name)
+        for path in self.find_files(name):
+            try:
+                data = json.loads(path.read_bytes())
+            except (OSError, ValueError):
+                continue
+            for item in _iter_items(data):
+                if normalize_name(item.get("displayText") or "") == normalized:
+                    return item
+        return None
+
+    def find_files(self, name: str) -> list[Path]:
+        """Return the files containing a condo with the given (un-normalized) name."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT path FROM condos WHERE normalized_name = ? ORDER BY path",
+                (normalize_name(name),),
+            ).fetchall()
+        return [Path(path) for (path,) in rows]
+
+    def _record_file(
+        self,
+        path: str,
+        mtime: float,
+        size: int,
+        sha: str,
+        items: Iterable[dict[str, Any]] | None,
+    ) -> None:
+        """Upsert a file row and, when ``items`` is given, replace its condo rows."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO files (path, mtime, size, sha256) VALUES (?, ?, ?, ?)",
+                (path, mtime, size, sha),
+            )
+            if items is None:
+                return
+            self._conn.execute("DELETE FROM condos WHERE path = ?", (path,))
+            self._conn.executemany(
+                "INSERT INTO condos (path, name, normalized_name, display_type, address) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    (
+                        path,
+                        item["displayText"],
+                        normalize_name(item["displayText"]),
+                        item.get("displayType"),
+                        item.get("displayDescription"),
+                    )
+                    for item in items
+                    if item.get("displayText")
+                ),
+            )
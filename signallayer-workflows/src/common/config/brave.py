@@ -0,0 +1,63 @@
+"""Brave Search client configuration settings."""
+
+from pydantic import AliasChoices, Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from ..cache import CacheBackendName
+
+
+class BraveSearchSettings(BaseSettings):
+    """Settings for the Brave Search API client.
+
+    Configuration is loaded from environment variables with BRAVE_SEARCH_ prefix.
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix="BRAVE_SEARCH_",
+        env_file_encoding="utf-8",
+        extra="ignore",
+        populate_by_name=True,
+    )
+
+    api_key: str | None = Field(
+        default=None,
+        validation_alias=AliasChoices("BRAVE_SEARCH_API", "BRAVE_SEARCH_API_KEY"),
+    )
+    """Brave Search subscription token (BRAVE_SEARCH_API for backwards compatibility)."""
+
+    base_url: str = "https://api.search.brave.com/res/v1"
+    """Brave Search API base URL."""
+
+    timeout_seconds: float = 30.0
+    """HTTP request timeout in seconds."""
+
+    max_retries: int = 3
+    """Maximum retries for requests rejected with 429 Too Many Requests."""
+
+    requests_per_second: float = 1.0
+    """Sustained request rate shared by every search in this worker (plan limit)."""
+
+    burst: int = 1
+    """Number of requests that may be issued back-to-back.
+
+    Keep at 1 to match the 1 req/s plan; raise it only on plans that allow
+    bursts, so one lookup's web and local searches are sent together.
+    """
+
+    max_rate_limit_wait_seconds: float = 20.0
+    """Longest a search may be queued before failing so Temporal can retry later."""
+
+    cache_enabled: bool = True
+    """Serve repeated queries from the persistent query cache."""
+
+    cache_backend: CacheBackendName = "sqlite"
+    """Query cache backend: memory, sqlite or file."""
+
+    cache_path: str = "data/cache/brave.db"
+    """SQLite database file (sqlite backend) or root directory (file backend)."""
+
+    cache_ttl_seconds: float = 7 * 24 * 60 * 60
+    """Seconds a cached query result is reused before searching again."""
+
+    cache_max_entries: int = 50_000
+    """Maximum number of cached query results."""
@@ -27,3 +27,46 @@ class GitHubSettings(BaseSettings):
 
     max_retries: int = 3
     """Maximum number of retries for failed requests."""
+
+    http2: bool = False
+    """Negotiate HTTP/2 with the API (requires the optional ``h2`` package)."""
+
+    max_connections: int = 20
+    """Maximum number of concurrent connections in the shared pool."""
+
+    max_keepalive_connections: int = 10
+    """Maximum number of idle connections kept alive for reuse."""
+
+    keepalive_expiry_seconds: float = 30.0
+    """Seconds an idle pooled connection is kept before being closed."""
+
+    cache_enabled: bool = True
+    """Cache GET responses and revalidate them with conditional requests (ETag)."""
+
+    cache_max_entries: int = 1024
+    """Maximum number of cached responses before least-recently-used eviction."""
+
+    cache_ttl_seconds: float = 3600.0
+    """Seconds a cached response is kept for revalidation before being dropped."""
+
+    cache_path: str | None = None
+    """Optional SQLite file for an on-disk cache shared across processes."""
+
+    requests_per_second: float = 10.0
+    """Sustained request rate shared by all callers of the client in this process."""
+
+    burst: int = 20
+    """Number of requests that may be issued back-to-back before throttling."""
+
+    max_rate_limit_wait_seconds: float = 20.0
+    """Longest a request is queued in-process.
+
+    Longer waits, such as an exhausted quota pausing until its reset, fail the
+    activity with a Temporal retry scheduled for when the wait is over.
+    """
+
+    secondary_rate_limit_backoff_seconds: float = 5.0
+    """Initial back-off for throttled responses that carry no reset time.
+
+    Doubles with each retry and is capped below max_rate_limit_wait_seconds.
+    """
@@ -0,0 +1,71 @@
+"""Temporal payload encoding settings."""
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from ..blob_store import BlobBackendName
+from ..payload_codec import CompressionAlgorithm
+
+
+class PayloadSettings(BaseSettings):
+    """Settings for how workflow and activity payloads are encoded.
+
+    Configuration is loaded from environment variables with PAYLOAD_ prefix.
+    The worker and the web API must use the same settings so each can decode
+    what the other encodes.
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix="PAYLOAD_",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+    compression_enabled: bool = False
+    """Compress payloads larger than compression_threshold_bytes.
+
+    Enable only once every worker and API process runs a version that can
+    decode compressed payloads; compressed payloads also show as binary in
+    the Temporal UI.
+    """
+
+    compression_threshold_bytes: int = 4096
+    """Payloads smaller than this are sent as-is."""
+
+    compression_algorithm: CompressionAlgorithm = "gzip"
+    """Algorithm for new payloads; zstd requires the zstandard package in every process."""
+
+    compression_level: int | None = None
+    """Compression level (None uses the algorithm's default)."""
+
+    claim_check_enabled: bool = False
+    """Offload payloads above claim_check_threshold_bytes to a blob store.
+
+    Every process using the converter must be able to reach the same store.
+    """
+
+    claim_check_threshold_bytes: int = 256 * 1024
+    """Payloads (after compression) at least this large are offloaded."""
+
+    claim_check_backend: BlobBackendName = "file"
+    """Blob store: file, s3, or memory (in-process S3 stand-in for tests)."""
+
+    claim_check_path: str = "data/blobs"
+    """Root directory of the file blob store."""
+
+    claim_check_bucket: str | None = None
+    """Bucket name for the s3 blob store."""
+
+    claim_check_endpoint_url: str | None = None
+    """Endpoint of an S3-compatible service (None for AWS)."""
+
+    claim_check_index_path: str = "data/blobs/references.db"
+    """Per-process SQLite ledger of the blobs this process wrote (not shared)."""
+
+    claim_check_ttl_seconds: float = 30 * 24 * 60 * 60
+    """Seconds a blob is kept after its last reference; should cover history retention."""
+
+    claim_check_refresh_seconds: float = 24 * 60 * 60
+    """Minimum seconds between rewrites of a blob that keeps being referenced.
+
+    Garbage collection waits ttl + refresh seconds after the store's last write.
+    """
@@ -0,0 +1,36 @@
+"""Scrape cache configuration settings."""
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from ..cache import CacheBackendName
+
+
+class ScrapeCacheSettings(BaseSettings):
+    """Settings for the shared cache of scraped pages.
+
+    Configuration is loaded from environment variables with SCRAPE_CACHE_ prefix.
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix="SCRAPE_CACHE_",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+    enabled: bool = True
+    """Serve repeated scrapes of the same URL and parameters from the cache."""
+
+    backend: CacheBackendName = "sqlite"
+    """Storage backend: memory, sqlite or file."""
+
+    path: str = "data/cache/scrape.db"
+    """SQLite database file (sqlite backend) or root directory (file backend)."""
+
+    ttl_seconds: float = 6 * 60 * 60
+    """Seconds a scraped page is served from the cache before being re-fetched."""
+
+    max_entries: int = 5_000
+    """Maximum number of cached pages before least-recently-used eviction."""
+
+    compression_level: int = 6
+    """zlib compression level applied to stored pages (0 disables compression)."""
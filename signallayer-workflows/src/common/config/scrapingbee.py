@@ -21,3 +21,9 @@ class ScrapingBeeSettings(BaseSettings):
 
     timeout: int = 60
     """ScrapingBee timeout in seconds."""
+
+    base_url: str = "https://app.scrapingbee.com/api/v1/"
+    """ScrapingBee HTML API endpoint."""
+
+    max_concurrent_requests: int = 100
+    """Maximum number of scrapes in flight at once (match your ScrapingBee plan)."""
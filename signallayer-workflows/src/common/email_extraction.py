@@ -0,0 +1,92 @@
+"""Email address extraction from scraped text."""
+
+import html
+import re
+from collections.abc import Callable, Iterable
+
+EMAIL_PATTERN = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b")
+
+# "name [at] domain [dot] com", "name (at) domain (dot) com", "name {@} domain"
+_OBFUSCATED_AT = re.compile(r"\s*[\[({<]\s*(?:at|@)\s*[\])}>]\s*", re.IGNORECASE)
+_OBFUSCATED_DOT = re.compile(r"\s*[\[({<]\s*(?:dot|\.)\s*[\])}>]\s*", re.IGNORECASE)
+
+# Asset names such as "logo@2x.png" match the email pattern but are not addresses
+_ASSET_SUFFIXES = (".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp", ".css", ".js")
+
+DEFAULT_BLOCKLIST = frozenset({"example.com", "test.com", "localhost"})
+
+
+def deobfuscate(text: str) -> str:
+    """Undo common email obfuscations.
+
+    Decodes HTML entities (``&#64;``, ``&commat;``), URL-encoded ``@`` in
+    mailto links, and bracketed ``[at]``/``(dot)`` spellings.
+
+    Args:
+        text: Raw text
+
+    Returns:
+        Text with obfuscated addresses restored
+    """
+    if "&" in text:
+        text = html.unescape(text)
+    if "%40" in text:
+        text = text.replace("%40", "@")
+    if "[" in text or "(" in text or "{" in text or "<" in text:
+        text = _OBFUSCATED_AT.sub("@", text)
+        text = _OBFUSCATED_DOT.sub(".", text)
+    return text
+
+
+def normalize_email(email: str) -> str:
+    """Lower-case the domain and strip trailing dots, keeping the local part as-is."""
+    local, _, domain = email.rpartition("@")
+    return f"{local}@{domain.lower().rstrip('.')}"
+
+
+class EmailExtractor:
+    """Single-pass email extractor with a pluggable domain blocklist."""
+
+    def __init__(self, blocklist: Iterable[str] | Callable[[str], bool] = DEFAULT_BLOCKLIST):
+        """Initialize the extractor.
+
+        Args:
+            blocklist: Domains to reject (subdomains included), or a predicate
+                returning True for domains that should be rejected
+        """
+        if callable(blocklist):
+            self._is_blocked = blocklist
+        else:
+            blocked = frozenset(domain.lower() for domain in blocklist)
+            self._is_blocked = lambda domain: domain in blocked or any(
+                domain.endswith(f".{b}") for b in blocked
+            )
+
+    def extract(self, *texts: str) -> list[str]:
+        """Extract unique, normalized email addresses.
+
+        All texts are joined and scanned once with a precompiled pattern.
+
+        Args:
+            *texts: Texts to scan (e.g. title, description and URL of a result)
+
+        Returns:
+            Sorted list of email addresses
+        """
+        text = deobfuscate("\n".join(t for t in texts if t))
+        emails = set()
+        for match in EMAIL_PATTERN.finditer(text):
+            email = normalize_email(match.group())
+            domain = email.rpartition("@")[2]
+            if domain.endswith(_ASSET_SUFFIXES) or self._is_blocked(domain):
+                continue
+            emails.add(email)
+        return sorted(emails)
+
+
+_default_extractor = EmailExtractor()
+
+
+def extract_emails(*texts: str) -> list[str]:
+    """Extract emails with the default blocklist (see ``EmailExtractor.extract``)."""
+    return _default_extractor.extract(*texts)
@@ -1,5 +1,33 @@
 """Common exceptions for the application."""
 
+from datetime import timedelta
+
+from temporalio.exceptions import ApplicationError
+
+
 class NoRetryException(Exception):
     """Exception that should not be retried by Temporal."""
     pass
+
+
+class RateLimitExceededError(ApplicationError):
+    """Raised when a rate-limited call would have to wait longer than allowed.
+
+    Deliberately retryable: raised from an activity, it asks Temporal to
+    retry once the limit resets (``next_retry_delay``) instead of holding
+    the activity open for the whole wait.
+    """
+
+    def __init__(self, message: str, retry_after: float | None = None) -> None:
+        """Initialize the error.
+
+        Args:
+            message: Error message
+            retry_after: Seconds until a permit is expected to be available
+        """
+        super().__init__(
+            message,
+            type=type(self).__name__,
+            next_retry_delay=timedelta(seconds=retry_after) if retry_after else None,
+        )
+        self.retry_after = retry_after
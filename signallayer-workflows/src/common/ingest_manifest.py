@@ -0,0 +1,100 @@
+"""Persistent record of ingested streets and ingest checkpoints."""
+
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+
+MANIFEST_FILENAME = ".ingest_manifest.sqlite"
+
+
+@dataclass(frozen=True)
+class StreetRecord:
+    """Last successful fetch of a street."""
+
+    street: str
+    sha256: str
+    fetched_at: float
+
+    def is_fresh(self, max_age_seconds: float, now: float | None = None) -> bool:
+        """Return True if the street was fetched within ``max_age_seconds``."""
+        return (now if now is not None else time.time()) - self.fetched_at < max_age_seconds
+
+
+class IngestManifest:
+    """SQLite manifest stored next to the ingested files.
+
+    Tracks a content hash and fetch time per street, so unchanged responses
+    are not rewritten and recently fetched streets can be skipped, plus a
+    resume cursor per streets file so an interrupted ingest can pick up
+    where it stopped.
+    """
+
+    def __init__(self, directory: str | Path, db_path: str | Path | None = None):
+        """Open (or create) the manifest for an output directory.
+
+        Args:
+            directory: Directory holding the ingested files
+            db_path: Manifest database file (defaults to a hidden file in ``directory``)
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.db_path = Path(db_path) if db_path else self.directory / MANIFEST_FILENAME
+        self._lock = Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS streets (
+                    street TEXT PRIMARY KEY, sha256 TEXT NOT NULL, fetched_at REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS checkpoints (
+                    streets_file TEXT PRIMARY KEY, cursor INTEGER NOT NULL,
+                    updated_at REAL NOT NULL
+                );
+                """
+            )
+
+    def close(self) -> None:
+        """Close the manifest database."""
+        self._conn.close()
+
+    def get(self, street: str) -> StreetRecord | None:
+        """Return the last recorded fetch of a street, if any."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT street, sha256, fetched_at FROM streets WHERE street = ?", (street,)
+            ).fetchone()
+        return StreetRecord(*row) if row else None
+
+    def record(self, street: str, sha256: str, fetched_at: float | None = None) -> None:
+        """Record a successful fetch of a street."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO streets (street, sha256, fetched_at) VALUES (?, ?, ?)",
+                (street, sha256, fetched_at if fetched_at is not None else time.time()),
+            )
+
+    def get_checkpoint(self, streets_file: str) -> int:
+        """Return the resume cursor for a streets file (0 when there is none)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT cursor FROM checkpoints WHERE streets_file = ?", (streets_file,)
+            ).fetchone()
+        return int(row[0]) if row else 0
+
+    def set_checkpoint(self, streets_file: str, cursor: int | None) -> None:
+        """Store the resume cursor for a streets file, or clear it when ``cursor`` is None."""
+        with self._lock, self._conn:
+            if cursor is None:
+                self._conn.execute(
+                    "DELETE FROM checkpoints WHERE streets_file = ?", (streets_file,)
+                )
+            else:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO checkpoints (streets_file, cursor, updated_at) "
+                    "VALUES (?, ?, ?)",
+                    (streets_file, cursor, time.time()),
+                )
@@ -1,9 +1,47 @@
 """Dependency injection configuration."""
 
+from collections.abc import Callable
+from typing import Any, TypeVar
+
 import inject
+import structlog
 
 from ..worker.lib.registry import ActivityRegistry, WorkflowRegistry
 
+logger = structlog.get_logger()
+
+T = TypeVar("T")
+
+# Long-lived clients that own network resources and must be closed on shutdown
+_closeables: list[Any] = []
+
+
+def _closeable(constructor: Callable[[], T]) -> Callable[[], T]:
+    """Wrap a constructor so the created instance is closed by ``close_clients``."""
+
+    def construct() -> T:
+        instance = constructor()
+        _closeables.append(instance)
+        return instance
+
+    return construct
+
+
+async def close_clients() -> None:
+    """Close every long-lived client created by the container.
+
+    Called by the worker and web application on shutdown so pooled
+    connections are released cleanly.
+    """
+    while _closeables:
+        instance = _closeables.pop()
+        try:
+            await instance.aclose()
+        except Exception as e:
+            logger.warning(
+                "client_close_failed", client=type(instance).__name__, error=str(e)
+            )
+
 
 def configure_inject():
     """Configure the shared dependency injection container."""
@@ -16,29 +54,42 @@ def configure_inject():
         from ..web.config import WebSettings
         from ..worker.config import WorkerSettings
 
+        from .config.brave import BraveSearchSettings
         from .config.github import GitHubSettings
+        from .config.scrape_cache import ScrapeCacheSettings
         from .config.scrapingbee import ScrapingBeeSettings
 
         binder.bind_to_constructor(WorkerSettings, WorkerSettings)
         binder.bind_to_constructor(WebSettings, WebSettings)
         binder.bind_to_constructor(GitHubSettings, GitHubSettings)
+        binder.bind_to_constructor(BraveSearchSettings, BraveSearchSettings)
         binder.bind_to_constructor(ScrapingBeeSettings, ScrapingBeeSettings)
+        binder.bind_to_constructor(ScrapeCacheSettings, ScrapeCacheSettings)
 
         # External Clients
-        from scrapingbee import ScrapingBeeClient  # type: ignore
+        from .clients.brave import BraveSearchClient
+        from .clients.scrapingbee import AsyncScrapingBeeClient
+
+        binder.bind_to_constructor(AsyncScrapingBeeClient, _closeable(AsyncScrapingBeeClient))
+        binder.bind_to_constructor(BraveSearchClient, _closeable(BraveSearchClient))
+
+        # Caches
+        from .scrape_cache import ScrapeCache
+
+        binder.bind_to_constructor(ScrapeCache, ScrapeCache)
 
-        def provide_scrapingbee_client() -> ScrapingBeeClient:
-            settings = ScrapingBeeSettings()
-            return ScrapingBeeClient(api_key=settings.api_key)
+        from ..web.result_cache import WorkflowResultCache
 
-        binder.bind_to_provider(ScrapingBeeClient, provide_scrapingbee_client)
+        binder.bind_to_constructor(WorkflowResultCache, WorkflowResultCache)
 
         # Collaboration platform clients
         from .clients.github import GitHubClient
         from .clients.reddit import RedditClient
+        from .clients.web_page import WebPageClient
 
-        binder.bind_to_constructor(GitHubClient, GitHubClient)
+        binder.bind_to_constructor(GitHubClient, _closeable(GitHubClient))
         binder.bind_to_constructor(RedditClient, RedditClient)
+        binder.bind_to_constructor(WebPageClient, _closeable(WebPageClient))
 
         # Contexts
         from ..contexts.collaboration import CollaborationContext
@@ -0,0 +1,270 @@
+"""Payload codecs applied by the Temporal data converter."""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import time
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass
+from typing import Literal
+
+import structlog
+from temporalio.api.common.v1 import Payload
+from temporalio.converter import PayloadCodec
+
+from .blob_store import BlobLedger, BlobStore
+
+logger = structlog.get_logger()
+
+try:
+    import zstandard  # type: ignore
+except ImportError:  # pragma: no cover - depends on the environment
+    zstandard = None
+
+ENCODING_ZSTD = b"binary/zstd"
+ENCODING_GZIP = b"binary/gzip"
+ENCODING_CLAIM_CHECK = b"claim-check/v1"
+
+CompressionAlgorithm = Literal["zstd", "gzip"]
+
+
+@dataclass
+class CodecMetrics:
+    """Counters for a payload codec."""
+
+    encoded: int = 0
+    """Payloads that were compressed."""
+
+    passed_through: int = 0
+    """Payloads left as-is (below the threshold or not smaller once compressed)."""
+
+    decoded: int = 0
+    """Payloads that were decompressed."""
+
+    bytes_in: int = 0
+    """Serialized size of the compressed payloads before compression."""
+
+    bytes_out: int = 0
+    """Size of the compressed payloads."""
+
+    encode_seconds: float = 0.0
+    decode_seconds: float = 0.0
+
+    @property
+    def bytes_saved(self) -> int:
+        """Bytes kept out of Temporal by compression."""
+        return self.bytes_in - self.bytes_out
+
+    def as_dict(self) -> dict[str, float]:
+        """Return the counters, including bytes saved, for logging."""
+        return {**asdict(self), "bytes_saved": self.bytes_saved}
+
+
+class CompressionCodec(PayloadCodec):
+    """Compresses payloads above a size threshold.
+
+    The whole serialized payload (metadata included) is compressed and wrapped
+    in a new payload whose ``encoding`` names the algorithm, so decoding
+    restores the original exactly. Payloads that would not shrink are left
+    untouched, and payloads from other encodings pass through on decode.
+    """
+
+    def __init__(
+        self,
+        threshold_bytes: int = 4096,
+        algorithm: CompressionAlgorithm = "gzip",
+        level: int | None = None,
+    ) -> None:
+        """Initialize the codec.
+
+        Args:
+            threshold_bytes: Minimum payload size to compress
+            algorithm: "gzip" or "zstd" (requires the zstandard package)
+            level: Compression level (None for the algorithm's default)
+
+        Raises:
+            ValueError: If zstd is requested but the zstandard package is missing
+        """
+        if algorithm == "zstd" and zstandard is None:
+            raise ValueError("zstd payload compression requires the zstandard package")
+
+        self.threshold_bytes = threshold_bytes
+        self.algorithm = algorithm
+        self.level = level
+        self.metrics = CodecMetrics()
+
+    async def encode(self, payloads: Sequence[Payload]) -> list[Payload]:
+        """Compress payloads at or above the threshold."""
+        start = time.perf_counter()
+        encoded = [self._encode(payload) for payload in payloads]
+        self.metrics.encode_seconds += time.perf_counter() - start
+        return encoded
+
+    async def decode(self, payloads: Sequence[Payload]) -> list[Payload]:
+        """Decompress payloads produced by ``encode``."""
+        start = time.perf_counter()
+        decoded = [self._decode(payload) for payload in payloads]
+        self.metrics.decode_seconds += time.perf_counter() - start
+        return decoded
+
+    def _encode(self, payload: Payload) -> Payload:
+        if payload.ByteSize() < self.threshold_bytes:
+            self.metrics.passed_through += 1
+            return payload
+
+        raw = payload.SerializeToString()
+        if self.algorithm == "zstd":
+            compressor = zstandard.ZstdCompressor(level=self.level or 3)
+            data, encoding = compressor.compress(raw), ENCODING_ZSTD
+        else:
+            level = self.level if self.level is not None else 6
+            data, encoding = gzip.compress(raw, compresslevel=level, mtime=0), ENCODING_GZIP
+
+        if len(data) >= len(raw):
+            self.metrics.passed_through += 1
+            return payload
+
+        self.metrics.encoded += 1
+        self.metrics.bytes_in += len(raw)
+        self.metrics.bytes_out += len(data)
+        return Payload(metadata={"encoding": encoding}, data=data)
+
+    def _decode(self, payload: Payload) -> Payload:
+        encoding = payload.metadata.get("encoding")
+        if encoding == ENCODING_ZSTD:
+            if zstandard is None:
+                raise ValueError("Cannot decode zstd payload: zstandard package not installed")
+            raw = zstandard.ZstdDecompressor().decompress(payload.data)
+        elif encoding == ENCODING_GZIP:
+            raw = gzip.decompress(payload.data)
+        else:
+            return payload
+
+        self.metrics.decoded += 1
+        return Payload.FromString(raw)
+
+
+class ClaimCheckCodec(PayloadCodec):
+    """Offloads payloads above a size threshold to a blob store.
+
+    The serialized payload is stored under its SHA-256, and history only
+    records a small reference payload. Identical payloads share one blob.
+    Offloading a blob again more than ``refresh_seconds`` after its last
+    write rewrites it, and garbage collection only deletes blobs the store
+    reports as not written for ``ttl_seconds + refresh_seconds``, so every
+    reference stays readable for at least ``ttl_seconds``, which should
+    cover the namespace's history retention.
+
+    A write is only recorded once its upload succeeds, and concurrent
+    encodes of the same payload wait for the one upload in flight, so no
+    reference is returned before its blob is stored.
+    """
+
+    def __init__(
+        self,
+        store: BlobStore,
+        ledger: BlobLedger,
+        threshold_bytes: int = 256 * 1024,
+        ttl_seconds: float = 30 * 24 * 60 * 60,
+        refresh_seconds: float = 24 * 60 * 60,
+    ) -> None:
+        """Initialize the codec.
+
+        Args:
+            store: Where offloaded payloads are kept
+            ledger: Local record of blob writes, used to skip re-uploads and for garbage collection
+            threshold_bytes: Minimum payload size to offload
+            ttl_seconds: Seconds an offloaded payload is kept after its last reference
+            refresh_seconds: Minimum seconds between rewrites of the same blob
+        """
+        self.store = store
+        self.ledger = ledger
+        self.threshold_bytes = threshold_bytes
+        self.ttl_seconds = ttl_seconds
+        self.refresh_seconds = refresh_seconds
+        self.metrics = CodecMetrics()
+        self._uploads: dict[str, asyncio.Task[None]] = {}
+
+    async def encode(self, payloads: Sequence[Payload]) -> list[Payload]:
+        """Replace payloads at or above the threshold with blob references."""
+        start = time.perf_counter()
+        encoded = [await self._encode(payload) for payload in payloads]
+        self.metrics.encode_seconds += time.perf_counter() - start
+        return encoded
+
+    async def decode(self, payloads: Sequence[Payload]) -> list[Payload]:
+        """Fetch the payloads behind blob references."""
+        start = time.perf_counter()
+        decoded = [await self._decode(payload) for payload in payloads]
+        self.metrics.decode_seconds += time.perf_counter() - start
+        return decoded
+
+    def collect_garbage(self) -> int:
+        """Delete blobs no longer referenced by live histories; returns the number deleted."""
+        deleted = self.ledger.collect_garbage(self.store, self.ttl_seconds + self.refresh_seconds)
+        logger.info("claim_check_garbage_collected", deleted=deleted)
+        return deleted
+
+    async def _encode(self, payload: Payload) -> Payload:
+        if payload.ByteSize() < self.threshold_bytes:
+            self.metrics.passed_through += 1
+            return payload
+
+        raw = payload.SerializeToString()
+        key = hashlib.sha256(raw).hexdigest()
+        upload = self._uploads.get(key)
+        if upload is None and self.ledger.needs_write(key, self.refresh_seconds):
+            upload = asyncio.ensure_future(self._upload(key, raw))
+            self._uploads[key] = upload
+        if upload is not None:
+            # Shielded: a cancelled encode must not abort an upload others are waiting on
+            await asyncio.shield(upload)
+
+        reference = json.dumps({"key": key, "size": len(raw)}).encode()
+        self.metrics.encoded += 1
+        self.metrics.bytes_in += len(raw)
+        self.metrics.bytes_out += len(reference)
+        return Payload(metadata={"encoding": ENCODING_CLAIM_CHECK}, data=reference)
+
+    async def _upload(self, key: str, raw: bytes) -> None:
+        try:
+            await asyncio.to_thread(self.store.put_object, key, raw)
+            self.ledger.record_write(key)
+        finally:
+            del self._uploads[key]
+
+    async def _decode(self, payload: Payload) -> Payload:
+        if payload.metadata.get("encoding") != ENCODING_CLAIM_CHECK:
+            return payload
+
+        key = json.loads(payload.data)["key"]
+        raw = await asyncio.to_thread(self.store.get_object, key)
+        self.metrics.decoded += 1
+        return Payload.FromString(raw)
+
+
+class CodecChain(PayloadCodec):
+    """Applies several codecs in order on encode and in reverse on decode."""
+
+    def __init__(self, codecs: Sequence[PayloadCodec]) -> None:
+        """Initialize the chain.
+
+        Args:
+            codecs: Codecs in encoding order
+        """
+        self.codecs = list(codecs)
+
+    async def encode(self, payloads: Sequence[Payload]) -> list[Payload]:
+        """Encode with each codec in turn."""
+        result = list(payloads)
+        for codec in self.codecs:
+            result = await codec.encode(result)
+        return result
+
+    async def decode(self, payloads: Sequence[Payload]) -> list[Payload]:
+        """Decode with each codec in reverse order."""
+        result = list(payloads)
+        for codec in reversed(self.codecs):
+            result = await codec.decode(result)
+        return result
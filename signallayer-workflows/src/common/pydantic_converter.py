@@ -1,19 +1,41 @@
 """Custom Temporal data converter for Pydantic models."""
 
+from threading import Lock
 from typing import Any
 
-from pydantic import BaseModel
+import structlog
+from pydantic import BaseModel, TypeAdapter
 from temporalio.api.common.v1 import Payload
 from temporalio.converter import (
     CompositePayloadConverter,
     DataConverter,
     DefaultPayloadConverter,
     JSONPlainPayloadConverter,
+    PayloadCodec,
 )
 
+from .blob_store import BlobLedger, create_blob_store
+from .config.payloads import PayloadSettings
+from .payload_codec import ClaimCheckCodec, CodecChain, CompressionCodec
+
+logger = structlog.get_logger()
+
 
 class PydanticJSONPayloadConverter(JSONPlainPayloadConverter):
-    """Custom JSON payload converter that handles Pydantic models."""
+    """Custom JSON payload converter that handles Pydantic models.
+
+    Models are serialized straight to JSON bytes (as ``model_dump_json`` does)
+    and typed payloads are decoded with ``TypeAdapter.validate_json`` from the
+    payload bytes, with no intermediate dict either way. One
+    adapter is built per type hint and reused, so the pydantic-core validator
+    is not rebuilt for every payload.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the converter with an empty adapter cache."""
+        super().__init__()
+        self._adapters: dict[Any, TypeAdapter[Any] | None] = {}
+        self._lock = Lock()
 
     def to_payload(self, value: Any) -> Payload | None:
         """Convert a Pydantic model to a Temporal payload.
@@ -24,10 +46,12 @@ class PydanticJSONPayloadConverter(JSONPlainPayloadConverter):
         Returns:
             Temporal payload or None if not handled
         """
-        # If it's a Pydantic model, serialize it to dict first
+        # Serialize models straight to JSON bytes, without an intermediate dict
         if isinstance(value, BaseModel):
-            # Use model_dump() to convert to dict with proper serialization
-            value = value.model_dump(mode="json")
+            return Payload(
+                metadata={"encoding": self.encoding.encode()},
+                data=value.__pydantic_serializer__.to_json(value),
+            )
 
         # Let the parent class handle the JSON serialization
         return super().to_payload(value)
@@ -42,20 +66,44 @@ class PydanticJSONPayloadConverter(JSONPlainPayloadConverter):
         Returns:
             Deserialized value (Pydantic-validated instance if possible)
         """
-        # First deserialize from JSON to basic types (dict, list, int, etc.)
-        value = super().from_payload(payload, type_hint=None)
-
-        # If we have a type hint, attempt to use Pydantic to validate/instantiate it
-        if type_hint is not None:
+        adapter = self.adapter_for(type_hint) if type_hint is not None else None
+        if adapter is not None:
             try:
-                from pydantic import TypeAdapter
-
-                return TypeAdapter(type_hint).validate_python(value)
+                return adapter.validate_json(payload.data)
             except Exception:
-                # If validation fails or TypeAdapter can't handle it, return the value as-is
+                # If validation fails, fall back to the plain JSON value
                 pass
 
-        return value
+        return super().from_payload(payload, type_hint=None)
+
+    def adapter_for(self, type_hint: Any) -> TypeAdapter[Any] | None:
+        """Return the cached TypeAdapter for a type hint, building it on first use.
+
+        Args:
+            type_hint: Type hint to validate against
+
+        Returns:
+            The adapter, or None if Pydantic cannot handle the type
+        """
+        try:
+            return self._adapters[type_hint]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable hint: build an adapter without caching it
+            return self._build_adapter(type_hint)
+
+        adapter = self._build_adapter(type_hint)
+        with self._lock:
+            self._adapters.setdefault(type_hint, adapter)
+        return adapter
+
+    @staticmethod
+    def _build_adapter(type_hint: Any) -> TypeAdapter[Any] | None:
+        try:
+            return TypeAdapter(type_hint)
+        except Exception:
+            return None
 
 
 class PydanticPayloadConverter(CompositePayloadConverter):
@@ -75,7 +123,83 @@ class PydanticPayloadConverter(CompositePayloadConverter):
         super().__init__(*converters)
 
 
+def create_data_converter(settings: PayloadSettings | None = None) -> DataConverter:
+    """Build the data converter shared by the worker and the web API.
+
+    Payloads are compressed first (if enabled), and whatever is still above
+    the claim-check threshold is then offloaded to the blob store (if enabled).
+
+    Args:
+        settings: Payload encoding settings (read from the environment when omitted)
+
+    Returns:
+        Data converter with Pydantic support and the configured payload codecs
+    """
+    settings = settings or PayloadSettings()
+    codecs: list[PayloadCodec] = []
+    if settings.compression_enabled:
+        codecs.append(
+            CompressionCodec(
+                threshold_bytes=settings.compression_threshold_bytes,
+                algorithm=settings.compression_algorithm,
+                level=settings.compression_level,
+            )
+        )
+    if settings.claim_check_enabled:
+        codecs.append(
+            ClaimCheckCodec(
+                store=create_blob_store(
+                    settings.claim_check_backend,
+                    path=settings.claim_check_path,
+                    bucket=settings.claim_check_bucket,
+                    endpoint_url=settings.claim_check_endpoint_url,
+                ),
+                ledger=BlobLedger(settings.claim_check_index_path),
+                threshold_bytes=settings.claim_check_threshold_bytes,
+                ttl_seconds=settings.claim_check_ttl_seconds,
+                refresh_seconds=settings.claim_check_refresh_seconds,
+            )
+        )
+
+    codec: PayloadCodec | None = None
+    if len(codecs) == 1:
+        codec = codecs[0]
+    elif codecs:
+        codec = CodecChain(codecs)
+    return DataConverter(payload_converter_class=PydanticPayloadConverter, payload_codec=codec)
+
+
+def payload_codecs(converter: DataConverter | None = None) -> list[PayloadCodec]:
+    """Return the codecs applied by a data converter, in encoding order."""
+    codec = (converter or pydantic_data_converter).payload_codec
+    if codec is None:
+        return []
+    return list(codec.codecs) if isinstance(codec, CodecChain) else [codec]
+
+
+def log_payload_metrics() -> None:
+    """Log the counters of the default data converter's payload codecs."""
+    for codec in payload_codecs():
+        if isinstance(codec, CompressionCodec):
+            logger.info(
+                "payload_codec_metrics", algorithm=codec.algorithm, **codec.metrics.as_dict()
+            )
+        elif isinstance(codec, ClaimCheckCodec):
+            logger.info("payload_codec_metrics", algorithm="claim-check", **codec.metrics.as_dict())
+
+
+def collect_payload_garbage() -> int:
+    """Delete claim-check blobs of the default data converter that are past their TTL.
+
+    Returns:
+        Number of blobs deleted
+    """
+    return sum(
+        codec.collect_garbage()
+        for codec in payload_codecs()
+        if isinstance(codec, ClaimCheckCodec)
+    )
+
+
 # Create a default data converter instance with Pydantic support
-pydantic_data_converter = DataConverter(
-    payload_converter_class=PydanticPayloadConverter,
-)
+pydantic_data_converter = create_data_converter()
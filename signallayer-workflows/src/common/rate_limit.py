@@ -0,0 +1,129 @@
+"""Async token-bucket rate limiter shared by outbound API clients."""
+
+import asyncio
+import time
+from dataclasses import dataclass
+
+from .exceptions import RateLimitExceededError
+
+
+@dataclass
+class RateLimiterMetrics:
+    """Counters describing how callers were throttled."""
+
+    acquired: int = 0
+    """Total number of permits handed out."""
+
+    delayed: int = 0
+    """Number of permits that had to wait."""
+
+    total_wait_seconds: float = 0.0
+    """Cumulative time callers spent waiting for a permit."""
+
+    max_wait_seconds: float = 0.0
+    """Longest single wait for a permit."""
+
+    queue_depth: int = 0
+    """Number of callers currently waiting for a permit."""
+
+    max_queue_depth: int = 0
+    """Highest number of simultaneous waiters observed."""
+
+    @property
+    def mean_wait_seconds(self) -> float:
+        """Average wait per permit."""
+        return self.total_wait_seconds / self.acquired if self.acquired else 0.0
+
+
+class RateLimiter:
+    """Token bucket that queues callers instead of failing them.
+
+    Permits are granted in FIFO order at ``rate`` per second with bursts of
+    up to ``burst``. Servers can additionally pause the bucket (e.g. from a
+    ``Retry-After`` header) via ``pause_for``; waits longer than
+    ``max_wait_seconds`` (such as a quota pause lasting until its reset)
+    raise ``RateLimitExceededError`` carrying the remaining wait, so a
+    Temporal activity is retried once the permit is due rather than failing.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        max_wait_seconds: float | None = None,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            rate: Sustained permits per second
+            burst: Maximum permits available at once
+            max_wait_seconds: Longest a caller may be queued (None for unbounded)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self.max_wait_seconds = max_wait_seconds
+        self.metrics = RateLimiterMetrics()
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> float:
+        """Wait for a permit.
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            RateLimitExceededError: If the wait would exceed ``max_wait_seconds``
+        """
+        start = time.monotonic()
+        self.metrics.queue_depth += 1
+        self.metrics.max_queue_depth = max(self.metrics.max_queue_depth, self.metrics.queue_depth)
+        try:
+            async with self._lock:
+                while True:
+                    now = time.monotonic()
+                    self._refill(now)
+                    if self._paused_until > now:
+                        delay = self._paused_until - now
+                    elif self._tokens >= 1:
+                        self._tokens -= 1
+                        break
+                    else:
+                        delay = (1 - self._tokens) / self.rate
+
+                    waited = now - start
+                    if self.max_wait_seconds is not None and waited + delay > self.max_wait_seconds:
+                        raise RateLimitExceededError(
+                            f"Rate limit wait of {waited + delay:.1f}s exceeds "
+                            f"{self.max_wait_seconds:.1f}s",
+                            retry_after=delay,
+                        )
+                    await asyncio.sleep(delay)
+        finally:
+            self.metrics.queue_depth -= 1
+
+        wait = time.monotonic() - start
+        self.metrics.acquired += 1
+        if wait > 0.001:
+            self.metrics.delayed += 1
+        self.metrics.total_wait_seconds += wait
+        self.metrics.max_wait_seconds = max(self.metrics.max_wait_seconds, wait)
+        return wait
+
+    def pause_for(self, seconds: float) -> None:
+        """Stop granting permits for ``seconds`` (extends, never shortens, a pause)."""
+        self._paused_until = max(self._paused_until, time.monotonic() + max(seconds, 0.0))
+
+    def set_rate(self, rate: float) -> None:
+        """Change the sustained rate, e.g. to spread a remaining quota until reset."""
+        self._refill(time.monotonic())
+        self.rate = max(rate, 1e-6)
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._updated_at = now
@@ -0,0 +1,105 @@
+"""Content-addressed cache for scraped pages."""
+
+import hashlib
+import json
+import zlib
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import inject
+import structlog
+
+from .cache import CacheBackend, CacheStats, create_cache
+from .config.scrape_cache import ScrapeCacheSettings
+
+logger = structlog.get_logger()
+
+# Marks whether a stored entry is zlib-compressed
+_RAW = b"\x00"
+_ZLIB = b"\x01"
+
+
+class ScrapeCache:
+    """Cache of scraped page bodies keyed by URL and extraction parameters.
+
+    Keys are the SHA-256 of the canonical JSON of ``(url, params)``, so the
+    same page scraped with different extraction rules is cached separately.
+    Bodies are zlib-compressed before being written to the backend.
+    """
+
+    @inject.params(settings=ScrapeCacheSettings)
+    def __init__(
+        self,
+        settings: ScrapeCacheSettings,
+        backend: CacheBackend | None = None,
+    ):
+        """Initialize the scrape cache.
+
+        Args:
+            settings: Scrape cache settings (injected via DI)
+            backend: Optional storage backend; built from settings when omitted
+        """
+        self.settings = settings
+        self.backend = backend or create_cache(
+            settings.backend,
+            namespace="scrapes",
+            path=settings.path,
+            max_entries=settings.max_entries,
+            ttl=settings.ttl_seconds,
+        )
+
+    @property
+    def stats(self) -> CacheStats:
+        """Hit/miss/eviction counters of the underlying backend."""
+        return self.backend.stats
+
+    @staticmethod
+    def key(url: str, params: dict[str, Any] | None = None) -> str:
+        """Return the content address for a URL and its extraction parameters."""
+        canonical = json.dumps([url, params or {}], sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def get(self, url: str, params: dict[str, Any] | None = None) -> str | None:
+        """Return a cached page body, or None on a miss."""
+        if not self.settings.enabled:
+            return None
+        data = self.backend.get(self.key(url, params))
+        if data is None:
+            return None
+        marker, body = data[:1], data[1:]
+        return (zlib.decompress(body) if marker == _ZLIB else body).decode()
+
+    def set(self, url: str, body: str, params: dict[str, Any] | None = None) -> None:
+        """Store a page body."""
+        if not self.settings.enabled:
+            return
+        raw = body.encode()
+        level = self.settings.compression_level
+        data = _ZLIB + zlib.compress(raw, level) if level > 0 else _RAW + raw
+        self.backend.set(self.key(url, params), data)
+
+    async def get_or_fetch(
+        self,
+        url: str,
+        fetch: Callable[[], Awaitable[str]],
+        params: dict[str, Any] | None = None,
+    ) -> str:
+        """Return a cached page body, fetching and storing it on a miss.
+
+        Args:
+            url: Page URL
+            fetch: Coroutine factory performing the actual scrape
+            params: Extraction parameters that affect the body
+
+        Returns:
+            The page body
+        """
+        cached = self.get(url, params)
+        if cached is not None:
+            logger.debug("scrape_cache_hit", url=url, hits=self.stats.hits)
+            return cached
+
+        body = await fetch()
+        self.set(url, body, params)
+        logger.debug("scrape_cache_miss", url=url, misses=self.stats.misses)
+        return body
@@ -1,5 +1,7 @@
 """Collaboration context using Strategy Pattern for platform delegation."""
 
+from collections.abc import AsyncIterator
+
 import inject
 
 from src.common.clients.github import GitHubClient
@@ -44,6 +46,43 @@ class CollaborationContext:
         else:
             raise ValueError(f"Unsupported platform: {platform}")
 
+    async def iter_issues_by_label(
+        self,
+        platform: str,
+        repository: str,
+        label: str,
+        state: str = "open",
+        chunk_size: int = 100,
+    ) -> AsyncIterator[list[IssueReference]]:
+        """Stream issues filtered by label in bounded-size chunks.
+
+        Args:
+            platform: Platform name ('github', 'linear', etc.)
+            repository: Repository or project identifier
+            label: Label to filter by
+            state: Issue state filter
+            chunk_size: Maximum number of issues per yielded chunk
+
+        Yields:
+            Lists of at most ``chunk_size`` issue references
+
+        Raises:
+            ValueError: If platform is not supported
+        """
+        if platform == "github":
+            issues = self.github_client.iter_issues_by_label(repository, label, state)
+        else:
+            raise ValueError(f"Unsupported platform: {platform}")
+
+        chunk: list[IssueReference] = []
+        async for issue in issues:
+            chunk.append(issue)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
     async def fetch_issue_details(
         self, platform: str, repository: str, issue_number: int
     ) -> IssueDetails:
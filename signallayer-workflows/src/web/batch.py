@@ -0,0 +1,167 @@
+"""Bulk validation and bounded-concurrency starts for batch submissions."""
+
+import asyncio
+import json
+from collections.abc import AsyncIterator, Callable, Coroutine
+from typing import Any
+
+import structlog
+from fastapi import HTTPException
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from .models import BatchItemResult, WorkflowHandleResponse
+
+logger = structlog.get_logger()
+
+NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+
+def parse_batch(
+    body: bytes,
+    content_type: str,
+    input_model: type[BaseModel],
+    adapter: TypeAdapter[list[Any]],
+    max_items: int,
+) -> list[BaseModel | str]:
+    """Validate a batch of workflow inputs.
+
+    The whole batch is validated in one pass with ``adapter`` (a
+    ``TypeAdapter(list[input_model])``); only if that fails are items
+    validated one by one to report which ones are invalid.
+
+    Args:
+        body: Request body, a JSON array or newline-delimited JSON objects
+        content_type: Request content type, selecting NDJSON or JSON parsing
+        input_model: Workflow input model
+        adapter: Cached adapter for a list of ``input_model``
+        max_items: Maximum number of items accepted
+
+    Returns:
+        For each item, the validated input or a validation error message
+
+    Raises:
+        HTTPException: 422 if the body is not a JSON array or has too many items
+    """
+    if content_type.split(";")[0].strip().lower() in NDJSON_MEDIA_TYPES:
+        lines = [line for line in body.splitlines() if line.strip()]
+        _check_size(len(lines), max_items)
+        try:
+            return list(adapter.validate_json(b"[" + b",".join(lines) + b"]"))
+        except ValidationError:
+            return [_validate(input_model.model_validate_json, line) for line in lines]
+
+    try:
+        items = list(adapter.validate_json(body))
+    except ValidationError:
+        pass
+    else:
+        _check_size(len(items), max_items)
+        return items
+
+    try:
+        raw = json.loads(body)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=f"Body is not valid JSON: {e}") from e
+    if not isinstance(raw, list):
+        raise HTTPException(status_code=422, detail="Body must be a JSON array of inputs")
+    _check_size(len(raw), max_items)
+    return [_validate(input_model.model_validate, item) for item in raw]
+
+
+async def stream_batch_starts(
+    items: list[BaseModel | str],
+    start: Callable[[BaseModel], Coroutine[Any, Any, WorkflowHandleResponse]],
+    concurrency: int,
+    workflow_name: str,
+) -> AsyncIterator[str]:
+    """Start a workflow per valid item and yield one NDJSON result line per item.
+
+    At most ``concurrency`` starts are in flight at once. Lines are yielded
+    as starts complete, so they are not in input order; each carries the
+    item's index.
+
+    Args:
+        items: Validated inputs, or error messages for invalid items
+        start: Coroutine function starting one workflow
+        concurrency: Maximum number of concurrent start RPCs
+        workflow_name: Workflow name and version, for logging
+
+    Yields:
+        JSON-encoded BatchItemResult lines
+    """
+    pending: dict[asyncio.Task[WorkflowHandleResponse], int] = {}
+    started = failed = 0
+    try:
+        for index, item in enumerate(items):
+            if isinstance(item, str):
+                failed += 1
+                yield _line(BatchItemResult(index=index, error=item))
+                continue
+
+            if len(pending) >= concurrency:
+                for result in await _completed(pending):
+                    started += result.error is None
+                    failed += result.error is not None
+                    yield _line(result)
+
+            pending[asyncio.create_task(start(item))] = index
+
+        while pending:
+            for result in await _completed(pending):
+                started += result.error is None
+                failed += result.error is not None
+                yield _line(result)
+    finally:
+        # The client went away: stop starting workflows
+        for task in pending:
+            task.cancel()
+        logger.info(
+            "batch_submitted",
+            workflow=workflow_name,
+            items=len(items),
+            started=started,
+            failed=failed,
+        )
+
+
+def _check_size(count: int, max_items: int) -> None:
+    if count > max_items:
+        raise HTTPException(
+            status_code=422, detail=f"Batch has {count} items, the maximum is {max_items}"
+        )
+
+
+def _validate(validate: Callable[[Any], BaseModel], value: Any) -> BaseModel | str:
+    """Validate one item, returning the error message if it is invalid."""
+    try:
+        return validate(value)
+    except ValidationError as e:
+        return "; ".join(
+            f"{'.'.join(str(part) for part in error['loc']) or 'input'}: {error['msg']}"
+            for error in e.errors(include_url=False)
+        )
+
+
+async def _completed(
+    pending: dict["asyncio.Task[WorkflowHandleResponse]", int],
+) -> list[BatchItemResult]:
+    """Wait for at least one start to finish and return the finished items' results.
+
+    Args:
+        pending: Running start tasks mapped to item indexes; finished ones are removed
+    """
+    done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+    return [_result(task, pending.pop(task)) for task in done]
+
+
+def _result(task: "asyncio.Task[WorkflowHandleResponse]", index: int) -> BatchItemResult:
+    """Turn a finished start task into the item's result."""
+    try:
+        handle = task.result()
+    except Exception as e:
+        return BatchItemResult(index=index, error=str(e) or type(e).__name__)
+    return BatchItemResult(index=index, **handle.model_dump())
+
+
+def _line(result: BatchItemResult) -> str:
+    return result.model_dump_json(exclude_none=True) + "\n"
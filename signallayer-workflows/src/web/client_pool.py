@@ -0,0 +1,183 @@
+"""Pool of Temporal client connections for the web API."""
+
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+
+import structlog
+from temporalio.client import Client
+
+from ..common.temporal_client import connect_temporal
+from .config import WebSettings
+
+logger = structlog.get_logger()
+
+
+class TemporalUnavailableError(RuntimeError):
+    """Raised when no Temporal connection in the pool is usable."""
+
+
+class TemporalClientPool:
+    """Round-robin pool of Temporal clients with health checks and reconnection.
+
+    Each slot holds its own connection. A background task probes every
+    connection with the gRPC health check; a slot whose probe fails is taken
+    out of rotation and reconnected with exponential backoff while the other
+    slots keep serving requests.
+    """
+
+    def __init__(
+        self,
+        settings: WebSettings,
+        connect: Callable[[WebSettings], Awaitable[Client]] = connect_temporal,
+    ) -> None:
+        """Initialize an empty pool.
+
+        Args:
+            settings: Web settings with the Temporal connection and pool options
+            connect: Coroutine function opening one connection
+        """
+        self.settings = settings
+        self.size = max(settings.temporal_pool_size, 1)
+        self._connect = connect
+        self._clients: list[Client | None] = [None] * self.size
+        self._next = 0
+        self._reconnecting: dict[int, asyncio.Task[None]] = {}
+        self._monitor: asyncio.Task[None] | None = None
+        self._ready: tuple[float, bool] | None = None
+        self._ready_lock = asyncio.Lock()
+
+    @property
+    def connected(self) -> int:
+        """Number of slots holding a usable connection."""
+        return sum(client is not None for client in self._clients)
+
+    async def start(self) -> None:
+        """Open every connection and start the health monitor.
+
+        Slots that fail to connect are retried in the background.
+
+        Raises:
+            Exception: The connection error if no slot could connect
+        """
+        results = await asyncio.gather(
+            *(self._connect(self.settings) for _ in range(self.size)), return_exceptions=True
+        )
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if len(errors) == self.size:
+            raise errors[0]
+
+        for index, result in enumerate(results):
+            if isinstance(result, BaseException):
+                self._schedule_reconnect(index)
+            else:
+                self._clients[index] = result
+        self._monitor = asyncio.create_task(self._monitor_loop())
+        logger.info("temporal_pool_started", size=self.size, connected=self.connected)
+
+    async def close(self) -> None:
+        """Stop the health monitor and pending reconnections."""
+        tasks = [*self._reconnecting.values(), *([self._monitor] if self._monitor else [])]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._reconnecting.clear()
+        self._monitor = None
+
+    async def get(self) -> Client:
+        """Return the next usable client in round-robin order.
+
+        Raises:
+            TemporalUnavailableError: If every slot is disconnected
+        """
+        for _ in range(self.size):
+            index = self._next
+            self._next = (index + 1) % self.size
+            client = self._clients[index]
+            if client is not None:
+                return client
+        raise TemporalUnavailableError("No Temporal connection is available")
+
+    def mark_broken(self, client: Client) -> None:
+        """Take a client out of rotation and reconnect its slot."""
+        for index, slot in enumerate(self._clients):
+            if slot is client:
+                self._clients[index] = None
+                self._ready = None
+                self._schedule_reconnect(index)
+
+    async def check_ready(self) -> bool:
+        """Return whether Temporal is reachable, probing at most once per cache period.
+
+        Load balancer probes arriving while a result is cached (or while a
+        probe is running) share it instead of each hitting Temporal.
+        """
+        async with self._ready_lock:
+            now = time.monotonic()
+            if self._ready is not None and now - self._ready[0] < self.settings.ready_cache_seconds:
+                return self._ready[1]
+
+            try:
+                client = await self.get()
+            except TemporalUnavailableError:
+                ready = False
+            else:
+                ready = await self._probe(client)
+                if not ready:
+                    self.mark_broken(client)
+            self._ready = (time.monotonic(), ready)
+            return ready
+
+    async def _probe(self, client: Client) -> bool:
+        """Run the gRPC health check against one connection."""
+        try:
+            return await client.service_client.check_health(
+                timeout=timedelta(seconds=self.settings.health_check_timeout)
+            )
+        except Exception as e:
+            logger.warning("temporal_health_check_failed", error=str(e))
+            return False
+
+    async def _monitor_loop(self) -> None:
+        """Periodically probe every connection and replace broken ones."""
+        while True:
+            await asyncio.sleep(self.settings.health_check_interval)
+            for client in list(self._clients):
+                if client is not None and not await self._probe(client):
+                    self.mark_broken(client)
+
+    def _schedule_reconnect(self, index: int) -> None:
+        if index not in self._reconnecting:
+            self._reconnecting[index] = asyncio.create_task(self._reconnect(index))
+
+    async def _reconnect(self, index: int) -> None:
+        """Reconnect one slot, backing off exponentially (with jitter) between attempts."""
+        attempt = 0
+        try:
+            while True:
+                try:
+                    client = await self._connect(self.settings)
+                except Exception as e:
+                    delay = min(
+                        self.settings.reconnect_backoff_initial * 2**attempt,
+                        self.settings.reconnect_backoff_max,
+                    ) * random.uniform(0.5, 1.0)
+                    attempt += 1
+                    logger.warning(
+                        "temporal_reconnect_failed",
+                        slot=index,
+                        attempt=attempt,
+                        retry_in=round(delay, 2),
+                        error=str(e),
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+
+                self._clients[index] = client
+                self._ready = None
+                logger.info("temporal_reconnected", slot=index, attempts=attempt + 1)
+                return
+        finally:
+            self._reconnecting.pop(index, None)
@@ -1,5 +1,7 @@
 """Web application configuration."""
 
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class WebSettings(BaseSettings):
@@ -24,10 +26,39 @@ class WebSettings(BaseSettings):
     temporal_local: bool = True
     temporal_api_key: str | None = None
     temporal_timeout: int = 30
+    """Seconds a synchronous request waits for a result before returning 202 with the handle."""
     task_queue: str = "default"
+    temporal_pool_size: int = 1
+    """Temporal connections used round-robin by the API (raise for high request rates)."""
+    health_check_interval: float = 15.0
+    health_check_timeout: float = 2.0
+    ready_cache_seconds: float = 5.0
+    """How long a /health/ready result is reused before Temporal is probed again."""
+    reconnect_backoff_initial: float = 0.5
+    reconnect_backoff_max: float = 30.0
 
     # API settings
     api_prefix: str = "/api/v1"
+    openapi_cache_path: str | None = None
+    """File the rendered OpenAPI schema is saved to and reloaded from at startup."""
+    sync_max_in_flight: int = 20
+    """Synchronous requests that may wait on each workflow type at once; others get 202."""
+
+    # Batch endpoint settings
+    batch_max_items: int = 10000
+    batch_start_concurrency: int = 32
+
+    # Result cache settings
+    result_cache_enabled: bool = True
+    result_cache_max_entries: int = 1024
+    result_cache_shared_backend: Literal["sqlite", "file"] | None = None
+    """Shared tier for results across API processes (None keeps them in-process only)."""
+    result_cache_path: str = "data/cache/results.db"
+    result_cache_shared_max_entries: int = 10_000
+
+    # Status endpoint settings
+    status_max_wait: float = 60.0
+    events_poll_interval: float = 2.0
 
 
 # Global settings instance
@@ -3,11 +3,14 @@
 from collections.abc import Awaitable, Callable
 
 import inject
+from fastapi import HTTPException
 from temporalio.client import Client
 
 from ..worker.lib.registry import ActivityRegistry, WorkflowRegistry
+from .client_pool import TemporalUnavailableError
 from .config import WebSettings
 from .config import settings as default_settings
+from .result_cache import WorkflowResultCache
 
 # Import the global client getter from main
 # This will be set during application startup
@@ -24,6 +27,11 @@ def get_activity_registry() -> ActivityRegistry:
     return inject.instance(ActivityRegistry)
 
 
+def get_result_cache() -> WorkflowResultCache:
+    """FastAPI dependency that provides the shared WorkflowResultCache."""
+    return inject.instance(WorkflowResultCache)
+
+
 def set_client_getter(getter: Callable[[], Awaitable[Client]]) -> None:
     """Set the global client getter function.
 
@@ -50,6 +58,7 @@ async def get_temporal_client() -> Client:
 
     Raises:
         RuntimeError: If client getter is not configured
+        HTTPException: 503 if no Temporal connection is currently usable
 
     Example:
         ```python
@@ -64,4 +73,7 @@ async def get_temporal_client() -> Client:
     """
     if _client_getter is None:
         raise RuntimeError("Temporal client getter not configured")
-    return await _client_getter()
+    try:
+        return await _client_getter()
+    except TemporalUnavailableError as e:
+        raise HTTPException(status_code=503, detail=str(e)) from e
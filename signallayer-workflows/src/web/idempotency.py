@@ -0,0 +1,112 @@
+"""Deterministic workflow IDs for idempotent workflow starts.
+
+A request's idempotency key (the ``Idempotency-Key`` header, or a hash of the
+validated input for workflows registered with ``idempotent=True``) is mapped
+to a fixed workflow ID. Temporal's ID policies then do the deduplication: a
+retry while the first run is still going attaches to it, and a retry after it
+completed gets that run's handle, and so its stored result, instead of
+running the work again. Only failed runs may be re-run under the same key.
+
+Each run records the hash of its input in its memo, so reusing a
+client-supplied key with a different input is rejected with 409 instead of
+silently returning the other input's run.
+"""
+
+import hashlib
+from typing import TYPE_CHECKING, Any
+
+from fastapi import HTTPException
+from pydantic import BaseModel
+from temporalio.client import Client, WorkflowHandle
+from temporalio.common import WorkflowIDConflictPolicy, WorkflowIDReusePolicy
+from temporalio.exceptions import WorkflowAlreadyStartedError
+
+if TYPE_CHECKING:
+    from ..worker.lib.models import WorkflowMetadata
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+INPUT_HASH_MEMO = "input_hash"
+
+
+def input_hash(metadata: "WorkflowMetadata", input_data: BaseModel) -> str:
+    """Hash a workflow's name, version and canonical JSON input.
+
+    Args:
+        metadata: Workflow metadata
+        input_data: Validated workflow input
+
+    Returns:
+        Hex SHA-256 digest, equal for equal inputs to the same workflow version
+    """
+    digest = hashlib.sha256(f"{metadata.name}-{metadata.version}:".encode())
+    digest.update(input_data.__pydantic_serializer__.to_json(input_data))
+    return digest.hexdigest()
+
+
+def idempotent_workflow_id(metadata: "WorkflowMetadata", key: str) -> str:
+    """Map an idempotency key to the workflow ID of its run.
+
+    Args:
+        metadata: Workflow metadata
+        key: Client-supplied idempotency key or input hash
+
+    Returns:
+        Workflow ID, the same for every request with this key
+    """
+    digest = hashlib.sha256(f"{metadata.version}:{key}".encode()).hexdigest()
+    return f"{metadata.name}-{digest[:32]}"
+
+
+async def start_or_reuse_workflow(
+    client: Client,
+    metadata: "WorkflowMetadata",
+    input_data: BaseModel,
+    workflow_id: str,
+    task_queue: str,
+    verify_input: bool = True,
+) -> tuple[WorkflowHandle[Any, Any], bool]:
+    """Start a workflow under an idempotent ID, or return the run already using it.
+
+    Args:
+        client: Temporal client
+        metadata: Workflow metadata
+        input_data: Validated workflow input
+        workflow_id: ID from idempotent_workflow_id
+        task_queue: Task queue to start the workflow on
+        verify_input: Check that a run found under the ID was started with the
+            same input; unnecessary when the key is itself the input hash
+
+    Returns:
+        The workflow handle, and whether it belongs to a run that had already closed
+
+    Raises:
+        HTTPException: 409 if the ID's run was started with a different input
+    """
+    run = metadata.workflow_class.run  # type: ignore[attr-defined]
+    digest = input_hash(metadata, input_data)
+    reused = False
+    try:
+        handle = await client.start_workflow(
+            run,
+            input_data,
+            id=workflow_id,
+            task_queue=task_queue,
+            id_reuse_policy=WorkflowIDReusePolicy.ALLOW_DUPLICATE_FAILED_ONLY,
+            id_conflict_policy=WorkflowIDConflictPolicy.USE_EXISTING,
+            memo={INPUT_HASH_MEMO: digest},
+        )
+    except WorkflowAlreadyStartedError as e:
+        # A run under this ID has already completed: reuse it and its result
+        handle = client.get_workflow_handle_for(run, workflow_id, run_id=e.run_id)
+        reused = True
+
+    if verify_input:
+        # USE_EXISTING may have attached to a running execution, so check either way
+        description = await handle.describe()
+        stored = await description.memo_value(INPUT_HASH_MEMO, None)
+        if stored is not None and stored != digest:
+            raise HTTPException(
+                status_code=409,
+                detail=f"{IDEMPOTENCY_HEADER} was already used with a different input",
+            )
+    return handle, reused
@@ -1,5 +1,7 @@
 """FastAPI web application for workflow execution."""
 
+import asyncio
+import time
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
@@ -7,6 +9,7 @@ import inject
 import structlog
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from temporalio.client import Client
 
 from ..common.env import setup_environment
@@ -19,29 +22,31 @@ setup_environment()
 # Configure injection before any other imports that might use it
 configure_inject()
 
+from .client_pool import TemporalClientPool  # noqa: E402
 from .config import settings
 from .dependencies import set_client_getter
+from .openapi import prerender_openapi  # noqa: E402
 from .routes import generate_workflow_routes
 
 logger = structlog.get_logger()
 
-# Global client instance
-_temporal_client: Client | None = None
+# Global pool of Temporal connections
+_client_pool: TemporalClientPool | None = None
 
 
 async def _get_temporal_client() -> Client:
-    """Get or create Temporal client instance.
+    """Get the next Temporal client from the pool.
 
     Returns:
         Connected Temporal client
 
     Raises:
-        RuntimeError: If client is not initialized
+        RuntimeError: If the pool is not initialized
+        TemporalUnavailableError: If no connection is currently usable
     """
-    global _temporal_client
-    if _temporal_client is None:
+    if _client_pool is None:
         raise RuntimeError("Temporal client not initialized")
-    return _temporal_client
+    return await _client_pool.get()
 
 
 @inject.params(workflow_registry=WorkflowRegistry)
@@ -53,7 +58,8 @@ async def lifespan(app: FastAPI, workflow_registry: WorkflowRegistry) -> AsyncIt
         app: FastAPI application instance
         workflow_registry: Injected workflow registry
     """
-    global _temporal_client
+    global _client_pool
+    started_at = time.perf_counter()
 
     # Startup
     logger.info(
@@ -62,36 +68,58 @@ async def lifespan(app: FastAPI, workflow_registry: WorkflowRegistry) -> AsyncIt
         namespace=settings.temporal_namespace,
     )
 
+    # Connect to Temporal while routes and the OpenAPI schema are built
+    _client_pool = TemporalClientPool(settings)
+    connecting = asyncio.create_task(_client_pool.start())
     try:
-        from ..common.temporal_client import connect_temporal
-        _temporal_client = await connect_temporal(settings)
-
-        # Set the client getter for dependencies
-        set_client_getter(_get_temporal_client)
-
         # Import workflows to ensure they are registered in the WorkflowRegistry
         from ..worker import workflows  # noqa: F401
 
-        # Generate and mount workflow routes
-        workflow_router = generate_workflow_routes(workflow_registry)
+        # Generate and mount workflow routes from a frozen registry snapshot
+        snapshot = workflow_registry.snapshot()
+        workflow_router = generate_workflow_routes(workflow_registry, snapshot)
         app.include_router(workflow_router, prefix=settings.api_prefix)
+        routes_ready_at = time.perf_counter()
 
-        workflow_count = len(workflow_registry.get_all())
         logger.info(
             "workflow_routes_mounted",
-            workflow_count=workflow_count,
+            workflow_count=len(snapshot),
             prefix=settings.api_prefix,
         )
 
+        openapi_cached = prerender_openapi(app, snapshot, settings.openapi_cache_path)
+        openapi_ready_at = time.perf_counter()
+
+        await connecting
+
+        # Set the client getter for dependencies
+        set_client_getter(_get_temporal_client)
+
     except Exception as e:
+        connecting.cancel()
         logger.error("startup_failed", error=str(e))
         raise
 
+    logger.info(
+        "web_startup_complete",
+        startup_ms=round((time.perf_counter() - started_at) * 1000, 1),
+        routes_ms=round((routes_ready_at - started_at) * 1000, 1),
+        openapi_ms=round((openapi_ready_at - routes_ready_at) * 1000, 1),
+        openapi_cached=openapi_cached,
+    )
+
     yield
 
     # Shutdown
     logger.info("shutting_down_web_application")
-    # Temporal client connections are closed automatically
+    # Stop health checks and reconnections; the connections themselves are closed automatically
+    if _client_pool is not None:
+        await _client_pool.close()
+    from ..common.injection import close_clients
+    from ..common.pydantic_converter import log_payload_metrics
+
+    await close_clients()
+    log_payload_metrics()
 
 
 def create_app() -> FastAPI:
@@ -136,6 +164,26 @@ def create_app() -> FastAPI:
             "workflow_count": workflow_count,
         }
 
+    @app.get("/health/ready", responses={503: {"description": "Temporal is unreachable"}})
+    async def readiness_check() -> JSONResponse:
+        """Readiness check endpoint.
+
+        Probes Temporal through the client pool; results are cached for
+        WEB_READY_CACHE_SECONDS so frequent load balancer probes stay cheap.
+
+        Returns:
+            Readiness status and pool connection counts (503 when not ready)
+        """
+        ready = _client_pool is not None and await _client_pool.check_ready()
+        return JSONResponse(
+            {
+                "status": "ready" if ready else "unavailable",
+                "temporal_connections": _client_pool.connected if _client_pool else 0,
+                "pool_size": _client_pool.size if _client_pool else 0,
+            },
+            status_code=200 if ready else 503,
+        )
+
     return app
 
 
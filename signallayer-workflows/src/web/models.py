@@ -1,5 +1,8 @@
 """Response models for workflow API."""
 
+from datetime import datetime
+from typing import Any
+
 from pydantic import BaseModel, Field
 
 
@@ -19,6 +22,24 @@ class WorkflowHandleResponse(BaseModel):
     )
 
 
+class WorkflowStatusResponse(BaseModel):
+    """Response model for the workflow status endpoint.
+
+    ``result`` is set once the workflow has completed and ``error`` once it
+    has failed, been cancelled, terminated or timed out.
+    """
+
+    workflow_id: str = Field(..., description="Unique identifier for the workflow instance")
+    run_id: str = Field(..., description="Temporal run ID of the latest execution")
+    status: str = Field(
+        ..., description="Execution status", examples=["RUNNING", "COMPLETED", "FAILED"]
+    )
+    start_time: datetime | None = Field(default=None, description="When the execution started")
+    close_time: datetime | None = Field(default=None, description="When the execution closed")
+    result: Any = Field(default=None, description="Workflow output, once completed")
+    error: str | None = Field(default=None, description="Failure message, once failed")
+
+
 class ErrorResponse(BaseModel):
     """Standard error response model.
 
@@ -30,3 +51,17 @@ class ErrorResponse(BaseModel):
     details: dict[str, object] | None = Field(
         None, description="Additional error details"
     )
+
+
+class BatchItemResult(BaseModel):
+    """One line of the batch submission response stream.
+
+    Either the handle fields are set (the workflow was started) or ``error``
+    is (the input was invalid or the start failed).
+    """
+
+    index: int = Field(..., description="Position of the input in the submitted batch")
+    workflow_id: str | None = Field(default=None, description="ID of the started workflow")
+    run_id: str | None = Field(default=None, description="Temporal run ID of the started workflow")
+    status_url: str | None = Field(default=None, description="URL to check workflow status")
+    error: str | None = Field(default=None, description="Why the item was not started")
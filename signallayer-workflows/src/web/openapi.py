@@ -0,0 +1,114 @@
+"""OpenAPI schema pre-rendering for the web API.
+
+FastAPI renders the schema lazily on the first ``/openapi.json`` or
+``/docs`` request, walking every generated route and pydantic model. The
+schema is rendered during startup instead and can be kept on disk, keyed by
+a fingerprint of the registered workflows, the source files they were
+loaded from and the web settings written into the schema, so a restart
+with unchanged code and configuration skips rendering entirely.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from importlib.metadata import version
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import structlog
+from fastapi import FastAPI
+
+from .config import settings
+
+if TYPE_CHECKING:
+    from ..worker.lib.models import WorkflowMetadata
+
+logger = structlog.get_logger()
+
+
+def schema_fingerprint(app: FastAPI, workflows: "tuple[WorkflowMetadata, ...]") -> str:
+    """Fingerprint everything the rendered schema depends on.
+
+    Args:
+        app: FastAPI application
+        workflows: Registry snapshot the routes were generated from
+
+    Returns:
+        Hex digest that changes when the workflows, their source files, the
+        application's routes, the web settings or the FastAPI/pydantic versions change
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{version('fastapi')}:{version('pydantic')}:{app.version}".encode())
+    # Limits such as status_max_wait and batch_max_items are rendered into the schema
+    digest.update(settings.model_dump_json().encode())
+    for metadata in workflows:
+        digest.update(f"{metadata.name}-{metadata.version}\n".encode())
+    for route in app.routes:
+        digest.update(f"{getattr(route, 'path', '')}\n".encode())
+
+    package = __name__.split(".", 1)[0]
+    for name in sorted(sys.modules):
+        if name != package and not name.startswith(package + "."):
+            continue
+        path = getattr(sys.modules[name], "__file__", None)
+        if path is None:
+            continue
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        digest.update(f"{path}:{stat.st_mtime_ns}:{stat.st_size}\n".encode())
+    return digest.hexdigest()
+
+
+def prerender_openapi(
+    app: FastAPI,
+    workflows: "tuple[WorkflowMetadata, ...]",
+    cache_path: str | None = None,
+) -> bool:
+    """Render the app's OpenAPI schema now, or load it from a matching cache file.
+
+    Args:
+        app: FastAPI application with all routes mounted
+        workflows: Registry snapshot the routes were generated from
+        cache_path: JSON file to load the schema from and save it to (None to skip)
+
+    Returns:
+        True if the schema was loaded from the cache file
+    """
+    if cache_path is None:
+        app.openapi()
+        return False
+
+    fingerprint = schema_fingerprint(app, workflows)
+    cached = _load(Path(cache_path))
+    if cached is not None and cached.get("fingerprint") == fingerprint:
+        app.openapi_schema = cached["schema"]
+        return True
+
+    _save(Path(cache_path), {"fingerprint": fingerprint, "schema": app.openapi()})
+    return False
+
+
+def _load(path: Path) -> dict[str, Any] | None:
+    try:
+        return json.loads(path.read_bytes())  # type: ignore[no-any-return]
+    except FileNotFoundError:
+        return None
+    except ValueError as e:
+        logger.warning("openapi_cache_unreadable", path=str(path), error=str(e))
+        return None
+
+
+def _save(path: Path, data: dict[str, Any]) -> None:
+    """Write the cache file atomically; failures only cost the next startup a render."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent)
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.warning("openapi_cache_write_failed", path=str(path), error=str(e))
@@ -0,0 +1,99 @@
+"""Cache of workflow results served by the web API.
+
+Results of workflows registered with ``workflow_api(cache_ttl=...)`` are kept
+in an in-process LRU and, optionally, a shared backend (SQLite or file) so
+every API process sees them. Repeated synchronous requests with the same
+input are answered from the cache without touching Temporal.
+"""
+
+import asyncio
+import struct
+import time
+
+import inject
+import structlog
+
+from ..common.cache import CacheBackend, CacheStats, MemoryCache, create_cache
+from .config import WebSettings
+
+logger = structlog.get_logger()
+
+# Entries start with their absolute expiry time, so a shared-tier hit can be
+# copied into the local tier without outliving the original TTL
+_EXPIRES_AT = struct.Struct("!d")
+
+
+class WorkflowResultCache:
+    """Two-tier cache of serialized workflow results keyed by input hash."""
+
+    @inject.params(settings=WebSettings)
+    def __init__(
+        self,
+        settings: WebSettings,
+        local: CacheBackend | None = None,
+        shared: CacheBackend | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            settings: Web settings (injected via DI)
+            local: Optional in-process tier; built from settings when omitted
+            shared: Optional shared tier; built from settings when omitted
+        """
+        self.settings = settings
+        self.local = local or MemoryCache(max_entries=settings.result_cache_max_entries)
+        if shared is None and settings.result_cache_shared_backend is not None:
+            shared = create_cache(
+                settings.result_cache_shared_backend,
+                namespace="workflow_results",
+                path=settings.result_cache_path,
+                max_entries=settings.result_cache_shared_max_entries,
+            )
+        self.shared = shared
+
+    @property
+    def stats(self) -> CacheStats:
+        """Hit/miss/eviction counters of the in-process tier."""
+        return self.local.stats
+
+    async def get(self, key: str) -> bytes | None:
+        """Return a cached result as JSON bytes, or None on a miss."""
+        if not self.settings.result_cache_enabled:
+            return None
+        entry = self.local.get(key)
+        if entry is None and self.shared is not None:
+            try:
+                # The shared tier does disk I/O; keep it off the event loop
+                entry = await asyncio.to_thread(self.shared.get, key)
+            except Exception as e:
+                # Treat an unreadable shared tier as a miss
+                logger.warning("result_cache_read_failed", error=str(e))
+                entry = None
+            if entry is not None:
+                (expires_at,) = _EXPIRES_AT.unpack_from(entry)
+                ttl = expires_at - time.time()
+                if ttl <= 0:
+                    return None
+                self.local.set(key, entry, ttl=ttl)
+        if entry is None:
+            return None
+        return entry[_EXPIRES_AT.size :]
+
+    def set(self, key: str, result: bytes, ttl: float) -> None:
+        """Store a result's JSON bytes for ``ttl`` seconds in both tiers."""
+        if not self.settings.result_cache_enabled:
+            return
+        entry = _EXPIRES_AT.pack(time.time() + ttl) + result
+        self.local.set(key, entry, ttl=ttl)
+        if self.shared is not None:
+            try:
+                self.shared.set(key, entry, ttl=ttl)
+            except Exception as e:
+                # The local tier still serves this process
+                logger.warning("result_cache_write_failed", error=str(e))
+
+    def delete(self, key: str) -> None:
+        """Remove a result from both tiers."""
+        self.local.delete(key)
+        if self.shared is not None:
+            self.shared.delete(key)
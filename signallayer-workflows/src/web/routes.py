@@ -1,30 +1,57 @@
 """Dynamic route generation for workflow endpoints."""
 
+import asyncio
 import uuid
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from fastapi import APIRouter, Depends, Query
-from temporalio.client import Client
+import structlog
+from fastapi import APIRouter, Depends, Header, Query, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, TypeAdapter
+from temporalio.client import Client, WorkflowHandle
 
 if TYPE_CHECKING:
-    from ..worker.lib.registry import WorkflowMetadata, WorkflowRegistry
+    from ..worker.lib.models import WorkflowMetadata
+    from ..worker.lib.registry import WorkflowRegistry
 
+from .batch import parse_batch, stream_batch_starts
 from .config import settings
-from .dependencies import get_temporal_client
-from .models import ErrorResponse, WorkflowHandleResponse
+from .dependencies import get_result_cache, get_temporal_client
+from .idempotency import (
+    IDEMPOTENCY_HEADER,
+    idempotent_workflow_id,
+    input_hash,
+    start_or_reuse_workflow,
+)
+from .models import ErrorResponse, WorkflowHandleResponse, WorkflowStatusResponse
+from .result_cache import WorkflowResultCache
+from .status import get_workflow_status, stream_workflow_events
 
+logger = structlog.get_logger()
 
-def generate_workflow_routes(workflow_registry: "WorkflowRegistry") -> APIRouter:
-    """Generate FastAPI routes for all registered workflows."""
-    router = APIRouter(prefix="/workflow", tags=["workflows"])
 
-    # Get all registered workflows
-    workflows = workflow_registry.get_all()
+def generate_workflow_routes(
+    workflow_registry: "WorkflowRegistry",
+    snapshot: "tuple[WorkflowMetadata, ...] | None" = None,
+) -> APIRouter:
+    """Generate FastAPI routes for all registered workflows.
+
+    Routes are built once from a snapshot of the registry, in key order, so
+    the route table (and the OpenAPI schema rendered from it) is stable and
+    unaffected by later registrations.
+
+    Args:
+        workflow_registry: Registry of API-exposed workflows
+        snapshot: Registry snapshot already taken by the caller (taken here when omitted)
+    """
+    router = APIRouter(prefix="/workflow", tags=["workflows"])
 
-    for metadata in workflows:
-        # Create route for this workflow
+    for metadata in snapshot if snapshot is not None else workflow_registry.snapshot():
+        # Create routes for this workflow
         _add_workflow_route(router, metadata)
+        _add_batch_route(router, metadata)
+        _add_status_routes(router, metadata)
 
     return router
 
@@ -40,7 +67,8 @@ def _add_workflow_route(router: APIRouter, metadata: "WorkflowMetadata") -> None
     input_model = metadata.input_model
     output_model = metadata.output_model
     workflow_name = f"{metadata.name}-{metadata.version}"
-    workflow_class = metadata.workflow_class
+    sync_slots = asyncio.Semaphore(metadata.max_sync_waits or settings.sync_max_in_flight)
+    cache_ttl = metadata.cache_ttl
 
     async def execute_workflow_endpoint(
         input_data: input_model,  # type: ignore[valid-type]
@@ -49,52 +77,91 @@ def _add_workflow_route(router: APIRouter, metadata: "WorkflowMetadata") -> None
             alias="async",
             description="Execute workflow asynchronously and return handle",
         ),
+        idempotency_key: str | None = Header(
+            None,
+            alias=IDEMPOTENCY_HEADER,
+            description="Requests with the same key share one workflow run and its result",
+        ),
         client: Client = Depends(get_temporal_client),
-    ) -> output_model | WorkflowHandleResponse:  # type: ignore[valid-type]
+        result_cache: WorkflowResultCache = Depends(get_result_cache),
+    ) -> BaseModel | Response:
         """Execute workflow with the provided input.
 
         Args:
             input_data: Validated input data matching workflow input model
             async_execution: Whether to execute asynchronously
+            idempotency_key: Optional client-supplied idempotency key
             client: Temporal client for workflow execution
+            result_cache: Cache of results of cacheable workflows
 
         Returns:
-            Workflow result (sync mode) or workflow handle (async mode)
+            Workflow result (sync mode, possibly a cached JSON response) or
+            workflow handle (async mode, or sync mode when the result is not ready
+            in time or too many requests are waiting)
         """
-        # Generate unique workflow ID
-        timestamp = datetime.now(UTC).strftime("%Y%m%d-%H%M%S")
-        workflow_id = f"{metadata.name}-{timestamp}-{uuid.uuid4().hex[:8]}"
-
-        if async_execution:
-            # Start workflow asynchronously
-            handle = await client.start_workflow(
-                workflow_class.run,  # type: ignore[attr-defined]
-                input_data,
-                id=workflow_id,
-                task_queue=settings.task_queue,
-            )
+        cache_key = None
+        if cache_ttl is not None and not async_execution:
+            cache_key = input_hash(metadata, input_data)
+            cached = await result_cache.get(cache_key)
+            if cached is not None:
+                return Response(cached, media_type="application/json", headers={"X-Cache": "HIT"})
 
-            # Return handle information
-            status_url = (
-                f"{settings.api_prefix}/workflow/{workflow_name}/status/{workflow_id}"
+        # Keys derived from the input cannot be reused with a different input
+        verify_input = idempotency_key is not None
+        if idempotency_key is None and metadata.idempotent:
+            idempotency_key = cache_key or input_hash(metadata, input_data)
+
+        # Only wait for the result if this workflow type has a free sync slot;
+        # checking and acquiring without an await in between cannot block
+        waiting = not async_execution and not sync_slots.locked()
+        if waiting:
+            await sync_slots.acquire()
+        try:
+            handle = await _start_workflow(
+                client, metadata, input_data, idempotency_key, verify_input
             )
-            return WorkflowHandleResponse(
-                workflow_id=handle.id,
+            workflow_id = handle.id
+            status_url = _status_url(workflow_name, workflow_id)
+            handle_response = WorkflowHandleResponse(
+                workflow_id=workflow_id,
                 run_id=handle.result_run_id or "",
                 status_url=status_url,
             )
-        else:
-            # Execute workflow synchronously and wait for result
-            # Use task queue from settings or metadata
-            task_queue = metadata.task_queue or settings.task_queue
-
-            result = await client.execute_workflow(
-                workflow_class.run,  # type: ignore[attr-defined]
-                input_data,
-                id=workflow_id,
-                task_queue=task_queue,
-            )
-            return result  # type: ignore[no-any-return]
+            if async_execution:
+                return handle_response
+
+            if waiting:
+                try:
+                    result = await asyncio.wait_for(
+                        handle.result(), timeout=settings.temporal_timeout
+                    )
+                except TimeoutError:
+                    logger.info(
+                        "sync_wait_timed_out", workflow=workflow_name, workflow_id=workflow_id
+                    )
+                else:
+                    output = output_model.model_validate(result)
+                    if cache_key is not None and cache_ttl is not None:
+                        result_cache.set(
+                            cache_key,
+                            output.__pydantic_serializer__.to_json(output),
+                            cache_ttl.total_seconds(),
+                        )
+                    return output
+            else:
+                logger.info(
+                    "sync_waits_saturated", workflow=workflow_name, workflow_id=workflow_id
+                )
+        finally:
+            if waiting:
+                sync_slots.release()
+
+        # The workflow keeps running; hand the caller its status URL instead
+        return JSONResponse(
+            handle_response.model_dump(),
+            status_code=202,
+            headers={"Location": status_url},
+        )
 
     # Set endpoint metadata
     execute_workflow_endpoint.__name__ = f"execute_{metadata.name.replace('-', '_')}"
@@ -116,15 +183,217 @@ def _add_workflow_route(router: APIRouter, metadata: "WorkflowMetadata") -> None
                 "model": output_model,
             },
             202: {
-                "description": "Workflow started successfully (async mode)",
+                "description": (
+                    "Workflow started but its result is not ready yet (sync mode timed out "
+                    "or too many requests are waiting)"
+                ),
                 "model": WorkflowHandleResponse,
             },
+            409: {
+                "description": f"{IDEMPOTENCY_HEADER} was already used with a different input",
+                "model": ErrorResponse,
+            },
             422: {"description": "Invalid input data", "model": ErrorResponse},
         },
         summary=f"Execute {workflow_name} workflow",
         description=(
             f"Execute the {workflow_name} workflow with the provided input data.\n\n"
-            f"**Sync Mode (default):** Returns workflow result directly.\n"
+            f"**Sync Mode (default):** Returns workflow result directly, or 202 with the "
+            f"handle if it is not ready within {settings.temporal_timeout}s.\n"
             f"**Async Mode (async=true):** Starts workflow and returns handle for tracking."
         ),
     )
+
+
+def _add_batch_route(router: APIRouter, metadata: "WorkflowMetadata") -> None:
+    """Add the batch submission route for a workflow.
+
+    Args:
+        router: FastAPI router to add the route to
+        metadata: Workflow metadata containing models and configuration
+    """
+    input_model = metadata.input_model
+    workflow_name = f"{metadata.name}-{metadata.version}"
+    batch_adapter = TypeAdapter(list[input_model])  # type: ignore[valid-type]
+
+    async def submit_batch_endpoint(
+        request: Request,
+        client: Client = Depends(get_temporal_client),
+    ) -> StreamingResponse:
+        """Start one workflow per input and stream back a result line per item."""
+        items = parse_batch(
+            await request.body(),
+            request.headers.get("content-type", ""),
+            input_model,
+            batch_adapter,
+            settings.batch_max_items,
+        )
+
+        async def start(input_data: BaseModel) -> WorkflowHandleResponse:
+            key = input_hash(metadata, input_data) if metadata.idempotent else None
+            handle = await _start_workflow(client, metadata, input_data, key, verify_input=False)
+            return WorkflowHandleResponse(
+                workflow_id=handle.id,
+                run_id=handle.result_run_id or "",
+                status_url=_status_url(workflow_name, handle.id),
+            )
+
+        return StreamingResponse(
+            stream_batch_starts(items, start, settings.batch_start_concurrency, workflow_name),
+            media_type="application/x-ndjson",
+        )
+
+    submit_batch_endpoint.__name__ = f"submit_batch_{metadata.name.replace('-', '_')}"
+
+    # Nested models are already in the components of the single-item route
+    input_schema = input_model.model_json_schema(ref_template="#/components/schemas/{model}")
+    input_schema.pop("$defs", None)
+    router.add_api_route(
+        f"/{workflow_name}/batch",
+        submit_batch_endpoint,
+        methods=["POST"],
+        response_class=StreamingResponse,
+        responses={
+            200: {
+                "description": "One JSON BatchItemResult per line, in completion order",
+                "content": {"application/x-ndjson": {}},
+            },
+            422: {"description": "Body is not a JSON array or NDJSON", "model": ErrorResponse},
+        },
+        openapi_extra={
+            "requestBody": {
+                "required": True,
+                "content": {
+                    "application/json": {"schema": {"type": "array", "items": input_schema}},
+                    "application/x-ndjson": {"schema": input_schema},
+                },
+            }
+        },
+        summary=f"Start a batch of {workflow_name} workflows",
+        description=(
+            f"Start one {workflow_name} workflow per input. The body is a JSON array "
+            f"or newline-delimited JSON (`Content-Type: application/x-ndjson`) of up to "
+            f"{settings.batch_max_items} inputs. Inputs are validated together and started "
+            f"{settings.batch_start_concurrency} at a time; the response streams one "
+            f"`BatchItemResult` line per item with its handle or error."
+        ),
+    )
+
+
+def _add_status_routes(router: APIRouter, metadata: "WorkflowMetadata") -> None:
+    """Add the status and event-stream routes for a workflow.
+
+    Args:
+        router: FastAPI router to add the routes to
+        metadata: Workflow metadata containing models and configuration
+    """
+    workflow_name = f"{metadata.name}-{metadata.version}"
+    workflow_class = metadata.workflow_class
+    endpoint_name = metadata.name.replace("-", "_")
+
+    async def workflow_status_endpoint(
+        workflow_id: str,
+        wait: float = Query(
+            0.0,
+            ge=0.0,
+            le=settings.status_max_wait,
+            description="Seconds to wait for a running workflow to finish (long-poll)",
+        ),
+        client: Client = Depends(get_temporal_client),
+    ) -> WorkflowStatusResponse:
+        """Return the status of a workflow, with its result once completed."""
+        return await get_workflow_status(client, workflow_class, workflow_id, wait)
+
+    async def workflow_events_endpoint(
+        workflow_id: str,
+        client: Client = Depends(get_temporal_client),
+    ) -> StreamingResponse:
+        """Stream status changes and the final result as Server-Sent Events."""
+        # Fail with 404 before the stream starts if the workflow does not exist
+        await get_workflow_status(client, workflow_class, workflow_id)
+        return StreamingResponse(
+            stream_workflow_events(
+                client, workflow_class, workflow_id, settings.events_poll_interval
+            ),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    workflow_status_endpoint.__name__ = f"status_{endpoint_name}"
+    workflow_events_endpoint.__name__ = f"events_{endpoint_name}"
+
+    router.add_api_route(
+        f"/{workflow_name}/status/{{workflow_id}}",
+        workflow_status_endpoint,
+        methods=["GET"],
+        response_model=WorkflowStatusResponse,
+        responses={404: {"description": "Workflow not found", "model": ErrorResponse}},
+        summary=f"Get {workflow_name} workflow status",
+        description=(
+            "Return the workflow's status, plus its result or error once it has closed.\n\n"
+            "Pass `wait` to long-poll until the workflow closes or the wait elapses."
+        ),
+    )
+    router.add_api_route(
+        f"/{workflow_name}/status/{{workflow_id}}/events",
+        workflow_events_endpoint,
+        methods=["GET"],
+        response_class=StreamingResponse,
+        responses={
+            200: {"description": "Server-Sent Events stream", "content": {"text/event-stream": {}}},
+            404: {"description": "Workflow not found", "model": ErrorResponse},
+        },
+        summary=f"Stream {workflow_name} workflow events",
+        description=(
+            "Server-Sent Events stream of `status` events on every status change, "
+            "ending with a `result` or `error` event."
+        ),
+    )
+
+
+async def _start_workflow(
+    client: Client,
+    metadata: "WorkflowMetadata",
+    input_data: BaseModel,
+    idempotency_key: str | None = None,
+    verify_input: bool = True,
+) -> WorkflowHandle[Any, Any]:
+    """Start a workflow, reusing the run of an earlier request with the same idempotency key.
+
+    Args:
+        client: Temporal client
+        metadata: Workflow metadata
+        input_data: Validated workflow input
+        idempotency_key: Idempotency key, or None to always start a new run
+        verify_input: Reject a reused key whose run was started with another input
+
+    Returns:
+        Handle of the started (or reused) workflow
+    """
+    task_queue = metadata.task_queue or settings.task_queue
+    if idempotency_key is None:
+        return await client.start_workflow(
+            metadata.workflow_class.run,  # type: ignore[attr-defined]
+            input_data,
+            id=_new_workflow_id(metadata),
+            task_queue=task_queue,
+        )
+
+    workflow_id = idempotent_workflow_id(metadata, idempotency_key)
+    handle, reused = await start_or_reuse_workflow(
+        client, metadata, input_data, workflow_id, task_queue, verify_input
+    )
+    if reused:
+        logger.info("idempotent_run_reused", workflow=metadata.name, workflow_id=workflow_id)
+    return handle
+
+
+def _new_workflow_id(metadata: "WorkflowMetadata") -> str:
+    """Generate a unique workflow ID for a new run."""
+    timestamp = datetime.now(UTC).strftime("%Y%m%d-%H%M%S")
+    return f"{metadata.name}-{timestamp}-{uuid.uuid4().hex[:8]}"
+
+
+def _status_url(workflow_name: str, workflow_id: str) -> str:
+    """Return the status route URL of a workflow."""
+    return f"{settings.api_prefix}/workflow/{workflow_name}/status/{workflow_id}"
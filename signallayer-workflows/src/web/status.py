@@ -0,0 +1,151 @@
+"""Workflow status lookups and event streams for the web API."""
+
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+import structlog
+from fastapi import HTTPException
+from pydantic import BaseModel
+from temporalio.client import Client, WorkflowExecutionStatus, WorkflowFailureError, WorkflowHandle
+from temporalio.service import RPCError, RPCStatusCode
+
+from .models import WorkflowStatusResponse
+
+logger = structlog.get_logger()
+
+
+async def get_workflow_status(
+    client: Client,
+    workflow_class: type,
+    workflow_id: str,
+    wait: float = 0.0,
+) -> WorkflowStatusResponse:
+    """Describe a workflow, including its result or error once it has closed.
+
+    Args:
+        client: Temporal client
+        workflow_class: Workflow class, used to decode the result
+        workflow_id: Workflow ID
+        wait: Seconds to wait for a running workflow to close (long-poll)
+
+    Returns:
+        Current status of the workflow
+
+    Raises:
+        HTTPException: 404 if the workflow does not exist or is of another type
+    """
+    handle = client.get_workflow_handle_for(workflow_class.run, workflow_id)  # type: ignore[attr-defined]
+    workflow_type = _workflow_type(workflow_class)
+    status = await _describe(handle, workflow_type)
+    if status.status != WorkflowExecutionStatus.RUNNING.name or wait <= 0:
+        return await _with_outcome(handle, status)
+
+    try:
+        result, error = await asyncio.wait_for(_outcome(handle), timeout=wait)
+    except TimeoutError:
+        return status
+    status = await _describe(handle, workflow_type)
+    return status.model_copy(update={"result": result, "error": error})
+
+
+async def stream_workflow_events(
+    client: Client,
+    workflow_class: type,
+    workflow_id: str,
+    poll_interval: float = 2.0,
+) -> AsyncIterator[str]:
+    """Yield Server-Sent Events for a workflow until it closes.
+
+    A ``status`` event is sent whenever the status changes, followed by a
+    final ``result`` or ``error`` event. The result is awaited with Temporal's
+    long-poll, so no request is held on the synchronous execution path.
+
+    Args:
+        client: Temporal client
+        workflow_class: Workflow class, used to decode the result
+        workflow_id: Workflow ID
+        poll_interval: Seconds between status checks and keep-alive comments
+
+    Yields:
+        Encoded SSE messages
+    """
+    handle = client.get_workflow_handle_for(workflow_class.run, workflow_id)  # type: ignore[attr-defined]
+    workflow_type = _workflow_type(workflow_class)
+    outcome = asyncio.create_task(_outcome(handle))
+    last_status = None
+    try:
+        while True:
+            status = await _describe(handle, workflow_type)
+            if status.status != last_status:
+                last_status = status.status
+                yield _sse("status", status.model_dump(mode="json", exclude={"result", "error"}))
+
+            if status.status != WorkflowExecutionStatus.RUNNING.name:
+                final = await _with_outcome(handle, status, outcome)
+                if final.error is not None:
+                    yield _sse("error", {"workflow_id": workflow_id, "error": final.error})
+                else:
+                    yield _sse("result", {"workflow_id": workflow_id, "result": final.result})
+                return
+
+            done, _ = await asyncio.wait({outcome}, timeout=poll_interval)
+            if not done:
+                yield ": keep-alive\n\n"
+    finally:
+        outcome.cancel()
+
+
+def _workflow_type(workflow_class: type) -> str:
+    """Return the Temporal workflow type name of a ``@workflow.defn`` class."""
+    definition = getattr(workflow_class, "__temporal_workflow_definition")  # noqa: B009
+    return str(definition.name)
+
+
+async def _describe(handle: WorkflowHandle[Any, Any], workflow_type: str) -> WorkflowStatusResponse:
+    """Describe a workflow, translating a missing workflow (or one of another type) into a 404."""
+    try:
+        description = await handle.describe()
+    except RPCError as e:
+        if e.status == RPCStatusCode.NOT_FOUND:
+            raise HTTPException(status_code=404, detail=f"Workflow {handle.id} not found") from e
+        raise
+    if description.workflow_type != workflow_type:
+        # The route is per workflow type; its output model cannot decode another type's result
+        raise HTTPException(status_code=404, detail=f"Workflow {handle.id} not found")
+    return WorkflowStatusResponse(
+        workflow_id=description.id,
+        run_id=description.run_id,
+        status=description.status.name if description.status else "UNKNOWN",
+        start_time=description.start_time,
+        close_time=description.close_time,
+    )
+
+
+async def _outcome(handle: WorkflowHandle[Any, Any]) -> tuple[Any, str | None]:
+    """Wait for a workflow to close and return ``(result, error)``."""
+    try:
+        result = await handle.result()
+    except WorkflowFailureError as e:
+        return None, str(e.cause or e)
+    if isinstance(result, BaseModel):
+        result = result.model_dump(mode="json")
+    return result, None
+
+
+async def _with_outcome(
+    handle: WorkflowHandle[Any, Any],
+    status: WorkflowStatusResponse,
+    outcome: "asyncio.Task[tuple[Any, str | None]] | None" = None,
+) -> WorkflowStatusResponse:
+    """Attach the result or error to the status of a closed workflow."""
+    if status.status == WorkflowExecutionStatus.RUNNING.name:
+        return status
+    result, error = await (outcome or _outcome(handle))
+    return status.model_copy(update={"result": result, "error": error})
+
+
+def _sse(event: str, data: dict[str, Any]) -> str:
+    """Encode one Server-Sent Event."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
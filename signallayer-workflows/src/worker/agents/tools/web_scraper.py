@@ -1,8 +1,8 @@
 """Web scraping tools for agents (non-Temporal versions)."""
 
-import httpx
-from bs4 import BeautifulSoup
-from markdownify import markdownify as md
+import inject
+
+from src.common.clients.web_page import WebPageClient
 
 
 async def get_page_content(url: str) -> str:
@@ -18,33 +18,8 @@ async def get_page_content(url: str) -> str:
     Returns:
         Markdown content of the page
     """
-    async with httpx.AsyncClient(follow_redirects=True, timeout=30.0) as client:
-        try:
-            response = await client.get(
-                url,
-                headers={
-                    "User-Agent": (
-                        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-                    )
-                },
-            )
-            response.raise_for_status()
-
-            # Parse HTML
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # Remove script and style elements
-            for script in soup(["script", "style", "nav", "footer", "header"]):
-                script.decompose()
-
-            # Convert to markdown
-            markdown_content = md(str(soup), heading_style="ATX")
-
-            # Clean up excessive whitespace
-            lines = [line.strip() for line in markdown_content.split("\n")]
-            cleaned = "\n".join(line for line in lines if line)
-
-            return cleaned
-
-        except Exception as e:
-            return f"Error fetching {url}: {str(e)}"
+    pages = inject.instance(WebPageClient)
+    try:
+        return await pages.get_markdown(url)
+    except Exception as e:
+        return f"Error fetching {url}: {str(e)}"
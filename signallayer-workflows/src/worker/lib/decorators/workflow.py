@@ -1,5 +1,6 @@
 import re
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
+from datetime import timedelta
 from typing import TypeVar
 
 from ..models import WorkflowMetadata
@@ -11,7 +12,11 @@ T = TypeVar("T")
 def workflow_api(
     name: str | None = None,
     version: str = "v2",
-    task_queue: str | None = None
+    task_queue: str | None = None,
+    max_sync_waits: int | None = None,
+    idempotent: bool = False,
+    cache_ttl: timedelta | None = None,
+    child_workflows: Sequence[type] = (),
 ) -> Callable[[type[T]], type[T]]:
     """Decorator to register a Temporal workflow for API exposure.
 
@@ -19,6 +24,13 @@ def workflow_api(
         name: API endpoint name (defaults to kebab-case class name)
         version: API version (default: "v2")
         task_queue: Default task queue for this workflow
+        max_sync_waits: Maximum synchronous API requests waiting on this workflow at once
+            (defaults to WEB_SYNC_MAX_IN_FLIGHT)
+        idempotent: Deduplicate API starts with identical input, reusing the existing run
+        cache_ttl: How long the API may serve this workflow's result for a repeated input
+            (None disables result caching; only for workflows whose output depends on input alone)
+        child_workflows: Internal child workflows run by this one; they are registered with
+            the worker alongside it but get no API routes
     """
 
     def decorator(workflow_class: type[T]) -> type[T]:
@@ -46,6 +58,10 @@ def workflow_api(
             output_model=output_model,
             version=version,
             task_queue=task_queue,
+            max_sync_waits=max_sync_waits,
+            idempotent=idempotent,
+            cache_ttl=cache_ttl,
+            child_workflows=tuple(child_workflows),
         )
 
         # Register in global registry if injection is configured
@@ -17,6 +17,10 @@ class WorkflowMetadata:
     output_model: type[BaseModel]
     version: str
     task_queue: str | None = None
+    max_sync_waits: int | None = None
+    idempotent: bool = False
+    cache_ttl: timedelta | None = None
+    child_workflows: tuple[type[object], ...] = ()
 
 
 @dataclass(frozen=True)
@@ -37,6 +37,11 @@ class GenericRegistry(Generic[T]):
             return [i for i in items if i.task_queue == task_queue or i.task_queue is None]
         return items
 
+    def snapshot(self) -> tuple[T, ...]:
+        """Get an immutable copy of all registered items, ordered by key."""
+        with self._lock:
+            return tuple(self._items[key] for key in sorted(self._items))
+
     def clear(self) -> None:
         """Clear all registered items."""
         with self._lock:
@@ -61,6 +61,11 @@ class TemporalWorker:
 
         logger.info("temporal_client_connected")
 
+        # Drop claim-check blobs whose histories are past retention
+        from ...common.pydantic_converter import collect_payload_garbage
+
+        await asyncio.to_thread(collect_payload_garbage)
+
         workflows = self.workflows
         if not workflows:
             raise ValueError("No workflows provided to worker")
@@ -159,4 +164,9 @@ class TemporalWorker:
             raise
         finally:
             logger.info("worker_stopping")
+            from ...common.injection import close_clients
+            from ...common.pydantic_converter import log_payload_metrics
+
+            await close_clients()
+            log_payload_metrics()
             logger.info("worker_stopped")
@@ -32,7 +32,12 @@ async def main(
 
     # Discover registered components
     queue = settings.task_queue
-    workflows_list = [m.workflow_class for m in workflow_registry.get_all(task_queue=queue)]
+    workflows_list: list[type] = []
+    for metadata in workflow_registry.get_all(task_queue=queue):
+        # Internal child workflows run on the worker but are not exposed through the API
+        for workflow_class in (metadata.workflow_class, *metadata.child_workflows):
+            if workflow_class not in workflows_list:
+                workflows_list.append(workflow_class)
     activities_list = [m.activity_function for m in activity_registry.get_all(task_queue=queue)]
 
     # Create and run worker with discovered components
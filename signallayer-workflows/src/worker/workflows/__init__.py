@@ -2,6 +2,7 @@ from .example import ExampleInput, ExampleOutput, ExampleWorkflow
 from .process_github_issues import (
     ProcessGithubIssuesInput,
     ProcessGithubIssuesOutput,
+    ProcessGithubIssuesProgress,
     ProcessGithubIssuesWorkflow,
 )
 from .research_issue import ResearchIssueInput, ResearchIssueOutput, ResearchIssueWorkflow
@@ -13,6 +14,7 @@ __all__ = [
     "ProcessGithubIssuesWorkflow",
     "ProcessGithubIssuesInput",
     "ProcessGithubIssuesOutput",
+    "ProcessGithubIssuesProgress",
     "ResearchIssueWorkflow",
     "ResearchIssueInput",
     "ResearchIssueOutput",
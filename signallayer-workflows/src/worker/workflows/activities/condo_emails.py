@@ -1,16 +1,20 @@
 """Activities for finding condo contact emails using Brave Search."""
 
+import asyncio
 import json
-import os
-import re
 from datetime import timedelta
 from pathlib import Path
 from typing import Any
 
-import httpx
+import inject
 
+from src.common.clients.brave import BraveSearchClient
+from src.common.condo_index import CondoIndex, normalize_name
+from src.common.email_extraction import extract_emails
 from src.worker.lib.decorators import configured_activity
 
+CONDO_DISPLAY_TYPES = ("Executive Condominium", "Condominium")
+
 
 @configured_activity(
     name="brave_search_condo",
@@ -30,46 +34,17 @@ async def brave_search_condo(
     Returns:
         List of search results with title, url, and description
     """
-    api_key = os.getenv("BRAVE_SEARCH_API")
-    if not api_key:
-        raise ValueError("BRAVE_SEARCH_API environment variable not set")
+    brave = inject.instance(BraveSearchClient)
 
     # Search for contact information - Use full address if available
     search_term = condo_address if condo_address else condo_name
     query = f"{search_term} {location} email or contact"
 
-    async with httpx.AsyncClient() as client:
-        # 1. Web Search
-        web_response = await client.get(
-            "https://api.search.brave.com/res/v1/web/search",
-            headers={
-                "Accept": "application/json",
-                "X-Subscription-Token": api_key,
-            },
-            params={
-                "q": query,
-                "count": 10,
-            },
-            timeout=30.0,
-        )
-        web_response.raise_for_status()
-        web_data = web_response.json()
-
-        # 2. Local POI Search
-        local_response = await client.get(
-            "https://api.search.brave.com/res/v1/local/search",
-            headers={
-                "Accept": "application/json",
-                "X-Subscription-Token": api_key,
-            },
-            params={
-                "q": search_term,
-            },
-            timeout=30.0,
-        )
-        local_data = {}
-        if local_response.status_code == 200:
-            local_data = local_response.json()
+    # Web search and local POI search are independent, so issue them concurrently
+    web_data, local_data = await asyncio.gather(
+        brave.web_search(query, count=10),
+        brave.local_search(search_term),
+    )
 
     # Extract web results
     results = []
@@ -127,8 +102,11 @@ async def brave_search_condo(
 
     activity.logger.info(
         f"Brave Search Results: {web_results_count} web, {local_results_count} local "
-        f"({contact_info_found} with direct contact info)"
+        f"({contact_info_found} with direct contact info); mean latency "
+        f"web={brave.latency['web'].mean_seconds * 1000:.0f}ms "
+        f"local={brave.latency['local'].mean_seconds * 1000:.0f}ms"
     )
+    activity.logger.info(f"Brave quota: {brave.quota_report()}")
 
     return results
 
@@ -141,7 +119,7 @@ async def extract_emails_from_results(
     search_results: list[dict[str, str]],
 ) -> list[str]:
     """
-    Extract email addresses from search results using regex.
+    Extract email addresses from search results.
 
     Args:
         search_results: List of search results from Brave
@@ -149,27 +127,14 @@ async def extract_emails_from_results(
     Returns:
         List of extracted email addresses
     """
-    email_pattern = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
-    emails = set()
-
-    for result in search_results:
-        # Extract from title
-        emails.update(re.findall(email_pattern, result.get("title", "")))
-        # Extract from description
-        emails.update(re.findall(email_pattern, result.get("description", "")))
-        # Extract from URL (sometimes emails are in URLs)
-        emails.update(re.findall(email_pattern, result.get("url", "")))
-
-    # Filter out common spam/invalid patterns
-    filtered_emails = []
-    spam_domains = ["example.com", "test.com", "localhost"]
-
-    for email in emails:
-        domain = email.split("@")[1].lower()
-        if domain not in spam_domains:
-            filtered_emails.append(email)
-
-    return sorted(filtered_emails)
+    # Scan every field of every result in a single pass
+    return extract_emails(
+        *(
+            result.get(field, "")
+            for result in search_results
+            for field in ("title", "description", "url")
+        )
+    )
 
 
 @configured_activity(
@@ -192,13 +157,7 @@ async def save_condo_emails(
     Returns:
         Path to the saved file
     """
-    # Normalize condo name for filename
-    normalized_name = condo_name.lower()
-    normalized_name = re.sub(r"['\"]", "", normalized_name)
-    normalized_name = re.sub(r"[.\s-]+", "_", normalized_name)
-    normalized_name = re.sub(r"_+", "_", normalized_name)
-    normalized_name = normalized_name.strip("_")
-
+    normalized_name = normalize_name(condo_name)
     output_path = Path(output_dir) / f"condo.{normalized_name}.email.txt"
 
     # Ensure directory exists
@@ -227,54 +186,65 @@ async def load_condo_data(condo_name: str, data_dir: str = "data") -> dict[str,
     Returns:
         Condo data from JSON file
     """
-    # Normalize condo name for filename
-    normalized_name = condo_name.lower()
-    normalized_name = re.sub(r"['\"]", "", normalized_name)
-    normalized_name = re.sub(r"[.\s-]+", "_", normalized_name)
-    normalized_name = re.sub(r"_+", "_", normalized_name)
-    normalized_name = normalized_name.strip("_")
-
-    file_path = Path(data_dir) / f"condo.{normalized_name}.json"
-
-    if not file_path.exists():
-        raise FileNotFoundError(f"Condo data file not found: {file_path}")
-
-    with open(file_path, encoding="utf-8") as f:
-        return json.load(f)
+    return await asyncio.to_thread(_load_condo_file, condo_name, data_dir)
 
 
 @configured_activity(
     name="list_condo_names",
     start_to_close_timeout=timedelta(minutes=5),
 )
-async def list_condo_names(data_dir: str = "data/condos") -> list[dict[str, str]]:
+async def list_condo_names(
+    data_dir: str = "data/condos",
+    offset: int = 0,
+    limit: int | None = None,
+    after: str | None = None,
+) -> list[dict[str, str]]:
     """
     List all condo names and addresses from JSON files in the directory that match specific types.
 
+    Reads from the directory's persistent condo index. The first page of a
+    listing (no ``offset`` or ``after``) rescans the directory, parsing only
+    files added or changed since; later pages query the index as it is.
+
     Args:
         data_dir: Directory containing the JSON files
+        offset: Number of condos (in name order) to skip
+        limit: Maximum number of condos to return (None for all)
+        after: Only return condos whose name sorts after this one (keyset cursor)
 
     Returns:
         List of dicts with 'name' and 'address' keys
     """
-    path = Path(data_dir)
-    target_types = {"Executive Condominium", "Condominium"}
-    condos = []
-    seen_names = set()
-
-    for file_path in path.glob("*.json"):
-        try:
-            with open(file_path, encoding="utf-8") as f:
-                data = json.load(f)
-                if isinstance(data, list):
-                    for item in data:
-                        if item.get("displayType") in target_types:
-                            name = item.get("displayText")
-                            address = item.get("displayDescription")
-                            if name and name not in seen_names:
-                                condos.append({"name": name, "address": address or name})
-                                seen_names.add(name)
-        except Exception:
-            continue
-
-    return sorted(condos, key=lambda x: x["name"])
+    return await asyncio.to_thread(_list_condos, data_dir, offset, limit, after)
+
+
+def _load_condo_file(condo_name: str, data_dir: str) -> dict[str, Any]:
+    """Load the file named after a condo, falling back to its record in a street file."""
+    file_path = Path(data_dir) / f"condo.{normalize_name(condo_name)}.json"
+    if file_path.exists():
+        with open(file_path, encoding="utf-8") as f:
+            return json.load(f)
+
+    index = CondoIndex(data_dir)
+    try:
+        item = index.find_item(condo_name)
+        if item is None and index.refresh():
+            item = index.find_item(condo_name)
+    finally:
+        index.close()
+    if item is None:
+        raise FileNotFoundError(f"Condo data file not found: {file_path}")
+    return item
+
+
+def _list_condos(
+    data_dir: str, offset: int, limit: int | None, after: str | None = None
+) -> list[dict[str, str]]:
+    """Query the directory's condo index, refreshing it on a listing's first page."""
+    index = CondoIndex(data_dir)
+    try:
+        if offset == 0 and after is None:
+            index.refresh()
+        return index.list_condos(CONDO_DISPLAY_TYPES, offset, limit, after)
+    finally:
+        index.close()
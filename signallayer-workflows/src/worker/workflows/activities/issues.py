@@ -31,9 +31,13 @@ async def fetch_issues_by_label(
     """
     activity.logger.info(f"Fetching issues by label '{label}' from repository '{repository}'")
 
-    issues = await collaboration.fetch_issues_by_label(
+    # Stream pages in chunks so progress is reported while large repos are paged through
+    issues: list[IssueReference] = []
+    async for chunk in collaboration.iter_issues_by_label(
         platform="github", repository=repository, label=label, state="open"
-    )
+    ):
+        issues.extend(chunk)
+        activity.heartbeat(len(issues))
 
     activity.logger.info(f"Found {len(issues)} demand signals")
     return issues
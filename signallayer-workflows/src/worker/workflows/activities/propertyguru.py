@@ -1,18 +1,23 @@
 """Activities for PropertyGuru data ingestion."""
 
+import hashlib
 import json
-import re
 from datetime import timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import httpx
+import structlog
+
+from src.common.condo_index import CondoIndex, normalize_name
+from src.common.ingest_manifest import IngestManifest
 
 from ...lib.decorators import configured_activity
 
 if TYPE_CHECKING:
     from ...lib.decorators.activity import ExecutableActivity
 
+logger = structlog.get_logger()
 
 API_URL = "https://prefix-search.propertyguru.com/v1/sg/autocomplete"
 API_PARAMS = {
@@ -37,12 +42,7 @@ def normalize_street_name(street_name: str) -> str:
         "Ang Mo Kio Avenue 1" -> "ang_mo_kio_avenue_1"
         "St. George's Lane" -> "st_georges_lane"
     """
-    normalized = street_name.lower()
-    normalized = re.sub(r"['\"]", "", normalized)
-    normalized = re.sub(r"[.\s-]+", "_", normalized)
-    normalized = re.sub(r"_+", "_", normalized)
-    normalized = normalized.strip("_")
-    return normalized
+    return normalize_name(street_name)
 
 
 @configured_activity(
@@ -62,11 +62,7 @@ async def fetch_propertyguru_autocomplete(street_name: str) -> dict[str, Any]:
     Raises:
         httpx.HTTPError: If the API request fails
     """
-    async with httpx.AsyncClient() as client:
-        params = {**API_PARAMS, "query": street_name}
-        response = await client.get(API_URL, params=params, timeout=30.0)
-        response.raise_for_status()
-        return response.json()
+    return await _fetch_autocomplete(street_name)
 
 
 @configured_activity(
@@ -77,7 +73,9 @@ async def save_propertyguru_data(
     street_name: str, data: dict[str, Any], output_dir: str = "data"
 ) -> str:
     """
-    Save PropertyGuru data to a JSON file.
+    Save PropertyGuru data to a JSON file and record it in the directory's condo index.
+
+    The file is only rewritten when its content changed since the last save.
 
     Args:
         street_name: The street name (used for filename)
@@ -87,39 +85,189 @@ async def save_propertyguru_data(
     Returns:
         Path to the saved file
     """
-    normalized_name = normalize_street_name(street_name)
-    output_path = Path(output_dir) / f"condo.{normalized_name}.json"
+    return _write_street_file(street_name, data, output_dir)
 
-    # Ensure directory exists
-    output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Save the data
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+@configured_activity(
+    name="fetch_and_save_propertyguru_data",
+    start_to_close_timeout=timedelta(seconds=40),
+)
+async def fetch_and_save_propertyguru_data(
+    street_name: str, output_dir: str = "data", freshness_seconds: float | None = None
+) -> str:
+    """
+    Fetch PropertyGuru autocomplete data for a street and save it in one step.
 
-    return str(output_path)
+    Unlike calling ``fetch_propertyguru_autocomplete`` followed by
+    ``save_propertyguru_data``, the response never leaves the worker: only
+    the street name and the saved path pass through workflow history.
+
+    Args:
+        street_name: The street name to query
+        output_dir: Directory to save the file in
+        freshness_seconds: Skip the fetch if the street was fetched this recently
+
+    Returns:
+        Path to the saved file
+
+    Raises:
+        httpx.HTTPError: If the API request fails
+    """
+    if freshness_seconds is not None:
+        output_path = _street_file_path(street_name, output_dir)
+        manifest = IngestManifest(output_dir)
+        try:
+            record = manifest.get(street_name)
+        finally:
+            manifest.close()
+        if record and record.is_fresh(freshness_seconds) and output_path.exists():
+            logger.debug("propertyguru_street_fresh", street=street_name)
+            return str(output_path)
+
+    data = await _fetch_autocomplete(street_name)
+    return _write_street_file(street_name, data, output_dir)
 
 
 @configured_activity(
     name="load_streets_list",
     start_to_close_timeout=timedelta(seconds=5),
 )
-async def load_streets_list(file_path: str = "data/singapore.streets.json") -> list[str]:
+async def load_streets_list(
+    file_path: str = "data/singapore.streets.json",
+    offset: int = 0,
+    limit: int | None = None,
+) -> list[str]:
     """
     Load the list of streets from a JSON file.
 
     Args:
         file_path: Path to the streets JSON file
+        offset: Index of the first street to return
+        limit: Maximum number of streets to return (None for all)
 
     Returns:
         List of street names
     """
     with open(file_path, encoding="utf-8") as f:
-        return json.load(f)
+        streets = json.load(f)
+    end = None if limit is None else offset + limit
+    return streets[offset:end]
+
+
+@configured_activity(
+    name="count_streets",
+    start_to_close_timeout=timedelta(seconds=5),
+)
+async def count_streets(file_path: str = "data/singapore.streets.json") -> int:
+    """
+    Count the streets in a JSON file without returning them.
+
+    Keeps the street list itself out of the parent workflow's history.
+
+    Args:
+        file_path: Path to the streets JSON file
+
+    Returns:
+        Number of streets
+    """
+    with open(file_path, encoding="utf-8") as f:
+        return len(json.load(f))
+
+
+@configured_activity(
+    name="load_ingest_checkpoint",
+    start_to_close_timeout=timedelta(seconds=5),
+)
+async def load_ingest_checkpoint(streets_file: str, output_dir: str = "data") -> int:
+    """
+    Load the resume cursor left by an interrupted ingest.
+
+    Args:
+        streets_file: Path to the streets JSON file being ingested
+        output_dir: Directory holding the ingested files
+
+    Returns:
+        Index of the first street not yet ingested (0 when starting fresh)
+    """
+    manifest = IngestManifest(output_dir)
+    try:
+        return manifest.get_checkpoint(streets_file)
+    finally:
+        manifest.close()
+
+
+@configured_activity(
+    name="save_ingest_checkpoint",
+    start_to_close_timeout=timedelta(seconds=5),
+)
+async def save_ingest_checkpoint(
+    streets_file: str, output_dir: str = "data", cursor: int | None = None
+) -> None:
+    """
+    Record how far an ingest has progressed.
+
+    Args:
+        streets_file: Path to the streets JSON file being ingested
+        output_dir: Directory holding the ingested files
+        cursor: Index of the first street not yet ingested, or None to clear it
+    """
+    manifest = IngestManifest(output_dir)
+    try:
+        manifest.set_checkpoint(streets_file, cursor)
+    finally:
+        manifest.close()
+
+
+async def _fetch_autocomplete(street_name: str) -> dict[str, Any]:
+    """Query the autocomplete API for a street."""
+    async with httpx.AsyncClient() as client:
+        params = {**API_PARAMS, "query": street_name}
+        response = await client.get(API_URL, params=params, timeout=30.0)
+        response.raise_for_status()
+        return response.json()
+
+
+def _street_file_path(street_name: str, output_dir: str) -> Path:
+    """Return the file a street's autocomplete data is saved to."""
+    return Path(output_dir) / f"condo.{normalize_street_name(street_name)}.json"
+
+
+def _write_street_file(street_name: str, data: dict[str, Any], output_dir: str) -> str:
+    """Write a street's autocomplete data if it changed, and record the fetch.
+
+    The content hash and fetch time go to the directory's ingest manifest;
+    changed files are also recorded in the condo index.
+    """
+    output_path = _street_file_path(street_name, output_dir)
+    content = json.dumps(data, indent=2, ensure_ascii=False)
+    digest = hashlib.sha256(content.encode()).hexdigest()
+
+    manifest = IngestManifest(output_path.parent)
+    try:
+        record = manifest.get(street_name)
+        if record is None or record.sha256 != digest or not output_path.exists():
+            output_path.write_text(content, encoding="utf-8")
+
+            index = CondoIndex(output_path.parent)
+            try:
+                index.index_file(output_path, data)
+            finally:
+                index.close()
+        else:
+            logger.debug("propertyguru_street_unchanged", street=street_name)
+        manifest.record(street_name, digest)
+    finally:
+        manifest.close()
+
+    return str(output_path)
 
 
 # Type hints for IDE support
 if TYPE_CHECKING:
     fetch_propertyguru_autocomplete: ExecutableActivity[[str], dict[str, Any]]
     save_propertyguru_data: ExecutableActivity[[str, dict[str, Any], str], str]
-    load_streets_list: ExecutableActivity[[str], list[str]]
+    fetch_and_save_propertyguru_data: ExecutableActivity[[str, str, float | None], str]
+    load_streets_list: ExecutableActivity[[str, int, int | None], list[str]]
+    count_streets: ExecutableActivity[[str], int]
+    load_ingest_checkpoint: ExecutableActivity[[str, str], int]
+    save_ingest_checkpoint: ExecutableActivity[[str, str, int | None], None]
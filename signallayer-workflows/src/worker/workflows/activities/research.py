@@ -8,6 +8,7 @@ from src.common.clients.reddit import (
     RedditCommunityPost,
     RedditSearchResult,
 )
+from src.common.clients.web_page import WebPageClient
 from src.worker.lib.decorators import configured_activity
 
 
@@ -19,7 +20,7 @@ async def find_subreddits(query: str) -> list[RedditCommunityPost]:
     """Find subreddits matching a query using Reddit search."""
     reddit = inject.instance(RedditClient)
     activity.logger.info(f"Finding subreddits for: {query}")
-    response = reddit.list_communities(query)
+    response = await reddit.list_communities(query)
     return response.body.data
 
 
@@ -31,7 +32,7 @@ async def get_latest_posts(subreddit: str) -> list[RedditCommunityPost]:
     """Get latest posts from a subreddit."""
     reddit = inject.instance(RedditClient)
     activity.logger.info(f"Getting latest posts from: {subreddit}")
-    response = reddit.latest_community_posts(subreddit)
+    response = await reddit.latest_community_posts(subreddit)
     return response.body.data
 
 
@@ -43,7 +44,7 @@ async def search_in_subreddit(query: str, subreddit: str) -> list[RedditSearchRe
     """Search for posts within a specific subreddit."""
     reddit = inject.instance(RedditClient)
     activity.logger.info(f"Searching in {subreddit} for: {query}")
-    response = reddit.search_community(query, subreddit)
+    response = await reddit.search_community(query, subreddit)
     return response.body.data
 
 
@@ -55,7 +56,7 @@ async def get_post_content(subreddit: str, post_id: str) -> str:
     """Get markdown content of a post."""
     reddit = inject.instance(RedditClient)
     activity.logger.info(f"Getting content for {post_id} in {subreddit}")
-    return reddit.get_community_post_markdown(subreddit, post_id)
+    return await reddit.get_community_post_markdown(subreddit, post_id)
 
 
 @configured_activity(
@@ -64,40 +65,11 @@ async def get_post_content(subreddit: str, post_id: str) -> str:
 )
 async def get_post_content_by_url(url: str) -> str:
     """Get markdown content from a URL."""
-    import httpx
-    from bs4 import BeautifulSoup
-    from markdownify import markdownify as md
-
+    pages = inject.instance(WebPageClient)
     activity.logger.info(f"Fetching content from: {url}")
 
-    async with httpx.AsyncClient(follow_redirects=True, timeout=30.0) as client:
-        try:
-            response = await client.get(
-                url,
-                headers={
-                    "User-Agent": (
-                        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-                    )
-                },
-            )
-            response.raise_for_status()
-
-            # Parse HTML
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # Remove script and style elements
-            for script in soup(["script", "style", "nav", "footer", "header"]):
-                script.decompose()
-
-            # Convert to markdown
-            markdown_content = md(str(soup), heading_style="ATX")
-
-            # Clean up excessive whitespace
-            lines = [line.strip() for line in markdown_content.split("\n")]
-            cleaned = "\n".join(line for line in lines if line)
-
-            return cleaned
-
-        except Exception as e:
-            activity.logger.error(f"Error fetching {url}: {e}")
-            return f"Error fetching {url}: {str(e)}"
+    try:
+        return await pages.get_markdown(url)
+    except Exception as e:
+        activity.logger.error(f"Error fetching {url}: {e}")
+        return f"Error fetching {url}: {str(e)}"
@@ -1,7 +1,7 @@
 """Workflow for batch processing condo email extraction."""
 
 import asyncio
-from typing import Optional
+from collections import deque
 
 from pydantic import BaseModel, Field
 from temporalio import workflow
@@ -10,9 +10,13 @@ from src.worker.lib.decorators import workflow_api
 from src.worker.workflows.activities.condo_emails import list_condo_names
 from src.worker.workflows.find_condo_emails import (
     FindCondoEmailsInput,
+    FindCondoEmailsOutput,
     FindCondoEmailsWorkflow,
 )
 
+SLIDING_WINDOW_PATCH = "sliding-window-batch"
+"""Patch marking runs that schedule children through the sliding window."""
+
 
 class BatchProcessCondosInput(BaseModel):
     """Input for batch process condos workflow."""
@@ -21,10 +25,23 @@ class BatchProcessCondosInput(BaseModel):
         default="data/condos", description="Directory containing condo JSON files"
     )
     location: str = Field(default="Singapore", description="Location to use for all condos")
-    batch_size: int = Field(default=5, description="Number of concurrent child workflows")
-    limit: Optional[int] = Field(
+    batch_size: int = Field(default=5, ge=1, description="Number of child workflows kept in flight")
+    limit: int | None = Field(
         default=None, description="Max number of condos to process (for testing)"
     )
+    page_size: int = Field(default=50, ge=1, description="Condos listed per catalog query")
+    completions_per_run: int = Field(
+        default=100,
+        ge=1,
+        description="Condos handled before continuing as new to keep history bounded",
+    )
+
+    # Checkpoint carried across continue-as-new; not meant to be set by callers
+    after: str | None = Field(
+        default=None, description="Name of the last condo started by earlier runs"
+    )
+    started: int = Field(default=0, ge=0, description="Condos started by earlier runs")
+    total_processed: int = Field(default=0, description="Condos processed in earlier runs")
 
 
 class BatchProcessCondosOutput(BaseModel):
@@ -37,47 +54,99 @@ class BatchProcessCondosOutput(BaseModel):
 @workflow_api(name="batch-process-condos", version="v1")
 @workflow.defn
 class BatchProcessCondosWorkflow:
-    """Workflow that lists condos and triggers FindCondoEmailsWorkflow for each."""
+    """Workflow that lists condos and triggers FindCondoEmailsWorkflow for each.
+
+    Children are scheduled through a sliding window: ``batch_size`` run at
+    once and a new one starts as soon as any finishes, so a slow condo only
+    holds up its own slot. The catalog is read in pages of ``page_size``
+    keyed by the last condo name started, and the next page is fetched while
+    the window is still full, so page boundaries neither stall the window nor
+    skip or repeat condos when the catalog changes. Each run starts at most
+    ``completions_per_run`` condos, waits for them, then continues as new
+    with the keyset cursor.
+
+    Runs started before the sliding window was introduced replay the
+    original fixed-batch path, guarded by ``SLIDING_WINDOW_PATCH``.
+    """
 
     @workflow.run
     async def run(self, input: BatchProcessCondosInput) -> BatchProcessCondosOutput:
         """Execute the batch process condos workflow."""
-        workflow.logger.info("Starting batch condo processing...")
+        if not workflow.patched(SLIDING_WINDOW_PATCH):
+            return await self._run_fixed_batches(input)
+
+        workflow.logger.info(f"Starting batch condo processing after {input.after!r}")
+
+        started = input.started
+        total_processed = input.total_processed
+        after = input.after
+        page: deque[dict[str, str]] = deque()
+        exhausted = False
+        started_this_run = 0
+        pending: set[asyncio.Task[FindCondoEmailsOutput]] = set()
+
+        while True:
+            # Top the window up, fetching the next page as soon as this one runs out
+            while len(pending) < input.batch_size and not self._run_full(input, started_this_run):
+                remaining = None if input.limit is None else input.limit - started
+                if remaining is not None and remaining <= 0:
+                    exhausted = True
+                    break
+                if not page:
+                    if exhausted:
+                        break
+                    page_size = input.page_size
+                    if remaining is not None:
+                        page_size = min(page_size, remaining)
+                    page.extend(await list_condo_names.execute(input.data_dir, 0, page_size, after))
+                    exhausted = len(page) < page_size
+                    workflow.logger.info(f"Listed {len(page)} condos after {after!r}")
+                    if not page:
+                        break
+
+                condo = page.popleft()
+                after = condo["name"]
+                pending.add(self._start_child(condo, input.location))
+                started += 1
+                started_this_run += 1
+
+            if not pending:
+                break
+            total_processed += await self._collect(pending)
+
+        if not exhausted or page:
+            workflow.logger.info(f"Continuing as new after condo {after!r}")
+            workflow.continue_as_new(
+                input.model_copy(
+                    update={
+                        "after": after,
+                        "started": started,
+                        "total_processed": total_processed,
+                    }
+                )
+            )
 
-        # Step 1: List all condo names and addresses
-        condos = await list_condo_names.execute(input.data_dir)
+        return BatchProcessCondosOutput(total_processed=total_processed, condos_found=started)
+
+    async def _run_fixed_batches(self, input: BatchProcessCondosInput) -> BatchProcessCondosOutput:
+        """List every condo up front and process them in fixed batches.
 
+        The path taken before the sliding window, kept so runs started on it
+        can replay.
+        """
+        condos = await list_condo_names.execute(input.data_dir)
         if input.limit:
             condos = condos[: input.limit]
 
         workflow.logger.info(f"Found {len(condos)} condos to process")
 
-        # Step 2: Process in batches
         total_processed = 0
-        batch_size = input.batch_size
-
-        for i in range(0, len(condos), batch_size):
-            batch = condos[i : i + batch_size]
-            workflow.logger.info(f"Processing batch {i // batch_size + 1} ({len(batch)} condos)")
-
-            tasks = []
-            for condo in batch:
-                name = condo["name"]
-                address = condo["address"]
-                # Use a safe ID for the child workflow
-                safe_name = name.lower().replace(" ", "-").replace("/", "-")
-                child_id = f"find-emails-{safe_name}"
-
-                task = workflow.execute_child_workflow(
-                    FindCondoEmailsWorkflow.run,
-                    FindCondoEmailsInput(condo_name=name, address=address, location=input.location),
-                    id=child_id,
-                )
-                tasks.append(task)
-
-            # Wait for the batch to complete
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
+        for i in range(0, len(condos), input.batch_size):
+            batch = condos[i : i + input.batch_size]
+            results = await asyncio.gather(
+                *(self._start_child(condo, input.location) for condo in batch),
+                return_exceptions=True,
+            )
             for res in results:
                 if isinstance(res, Exception):
                     workflow.logger.error(f"Child workflow failed: {res}")
@@ -85,3 +154,47 @@ class BatchProcessCondosWorkflow:
                     total_processed += 1
 
         return BatchProcessCondosOutput(total_processed=total_processed, condos_found=len(condos))
+
+    @staticmethod
+    def _run_full(input: BatchProcessCondosInput, started_this_run: int) -> bool:
+        """Whether this run has started enough children to continue as new."""
+        return (
+            started_this_run >= input.completions_per_run
+            or workflow.info().is_continue_as_new_suggested()
+        )
+
+    @staticmethod
+    def _start_child(condo: dict[str, str], location: str) -> asyncio.Task[FindCondoEmailsOutput]:
+        """Start the email search for one condo."""
+        name = condo["name"]
+        # Use a safe ID for the child workflow
+        safe_name = name.lower().replace(" ", "-").replace("/", "-")
+        return asyncio.create_task(
+            workflow.execute_child_workflow(
+                FindCondoEmailsWorkflow.run,
+                FindCondoEmailsInput(condo_name=name, address=condo["address"], location=location),
+                id=f"find-emails-{safe_name}",
+            )
+        )
+
+    @staticmethod
+    async def _collect(pending: set[asyncio.Task[FindCondoEmailsOutput]]) -> int:
+        """Wait for at least one child to finish.
+
+        Args:
+            pending: Running child tasks; finished ones are removed
+
+        Returns:
+            Number of children that finished successfully
+        """
+        done, _ = await workflow.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        processed = 0
+        for task in done:
+            pending.discard(task)
+            try:
+                task.result()
+            except Exception as e:
+                workflow.logger.error(f"Child workflow failed: {e}")
+            else:
+                processed += 1
+        return processed
@@ -1,5 +1,7 @@
 """Example workflows demonstrating the workflow API."""
 
+from datetime import timedelta
+
 from pydantic import BaseModel, Field
 from temporalio import workflow
 
@@ -22,7 +24,7 @@ class ExampleOutput(BaseModel):
     iterations: int = Field(..., description="Number of iterations performed")
 
 
-@workflow_api(name="example-workflow", version="v2")
+@workflow_api(name="example-workflow", version="v2", cache_ttl=timedelta(hours=1))
 @workflow.defn
 class ExampleWorkflow:
     """Example workflow that demonstrates basic functionality."""
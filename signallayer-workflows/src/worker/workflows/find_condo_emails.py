@@ -1,11 +1,12 @@
 """Workflow for finding condo contact emails."""
 
-import re
+from datetime import timedelta
 
 from agents import Runner
 from pydantic import BaseModel, Field
 from temporalio import workflow
 
+from src.common.email_extraction import extract_emails
 from src.worker.agents import email_extractor
 from src.worker.lib.decorators import workflow_api
 from src.worker.workflows.activities.condo_emails import (
@@ -36,7 +37,7 @@ class FindCondoEmailsOutput(BaseModel):
     used_agent: bool = Field(..., description="Whether AI agent was used for extraction")
 
 
-@workflow_api(name="find-condo-emails", version="v1")
+@workflow_api(name="find-condo-emails", version="v1", cache_ttl=timedelta(days=1))
 @workflow.defn
 class FindCondoEmailsWorkflow:
     """Workflow that finds contact emails for a condo using Brave Search.
@@ -153,10 +154,5 @@ Focus on official emails from property management, sales offices, or official co
         # Run the agent in the workflow context
         result = await Runner.run(email_extractor, context, max_turns=15)
 
-        # Extract emails from the agent's output
-        output = result.final_output
-        email_pattern = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
-        emails = re.findall(email_pattern, output)
-
-        # Deduplicate and return
-        return sorted(set(emails))
+        # Extract, deduplicate and return emails from the agent's output
+        return extract_emails(result.final_output)
@@ -7,11 +7,21 @@ from temporalio import workflow
 
 from src.worker.lib.decorators import workflow_api
 from src.worker.workflows.activities.propertyguru import (
+    count_streets,
+    fetch_and_save_propertyguru_data,
     fetch_propertyguru_autocomplete,
+    load_ingest_checkpoint,
     load_streets_list,
+    save_ingest_checkpoint,
     save_propertyguru_data,
 )
 
+SHARDED_INGEST_PATCH = "sharded-ingest"
+"""Patch marking runs that ingest through shard child workflows."""
+
+FAILED_STREETS_SAMPLE_SIZE = 100
+"""Most failed street names carried across continue-as-new and returned."""
+
 
 class IngestPropertyGuruInput(BaseModel):
     """Input for PropertyGuru ingestion workflow."""
@@ -21,7 +31,44 @@ class IngestPropertyGuruInput(BaseModel):
         description="Path to the JSON file containing street names",
     )
     output_dir: str = Field(default="data", description="Directory to save the output files")
-    max_concurrent: int = Field(default=10, description="Maximum number of concurrent API requests")
+    max_concurrent: int = Field(
+        default=10,
+        ge=1,
+        description="Maximum number of concurrent API requests, split across running shards",
+    )
+    shard_size: int = Field(default=100, ge=1, description="Number of streets per shard workflow")
+    max_parallel_shards: int = Field(
+        default=4, ge=1, description="Maximum number of shard workflows running at once"
+    )
+    shards_per_run: int = Field(
+        default=20,
+        ge=1,
+        description="Shards completed before continuing as new to keep history bounded",
+    )
+    fused: bool = Field(
+        default=True,
+        description="Fetch and save each street in one activity so responses stay out of history",
+    )
+    freshness_seconds: float | None = Field(
+        default=None,
+        description="Skip streets fetched within this many seconds (fused mode; None fetches all)",
+    )
+    resume: bool = Field(
+        default=True, description="Resume an interrupted ingest of the same streets file"
+    )
+
+    # Checkpoint carried across continue-as-new; not meant to be set by callers
+    cursor: int = Field(default=0, ge=0, description="Index of the next street to schedule")
+    successful: int = Field(default=0, description="Successful fetches in earlier runs")
+    failed: int = Field(default=0, description="Failed fetches in earlier runs")
+    failed_sample: list[str] = Field(
+        default_factory=list,
+        max_length=FAILED_STREETS_SAMPLE_SIZE,
+        description="Sample of the streets that failed in earlier runs",
+    )
+    failed_shards: list[int] = Field(
+        default_factory=list, description="Offsets of shards that failed in earlier runs"
+    )
 
 
 class IngestPropertyGuruOutput(BaseModel):
@@ -31,22 +78,220 @@ class IngestPropertyGuruOutput(BaseModel):
     successful: int = Field(..., description="Number of successful fetches")
     failed: int = Field(..., description="Number of failed fetches")
     failed_streets: list[str] = Field(
-        default_factory=list, description="List of streets that failed"
+        default_factory=list,
+        description=(
+            f"List of streets that failed (the first {FAILED_STREETS_SAMPLE_SIZE} when sharded)"
+        ),
+    )
+    failed_shards: list[int] = Field(
+        default_factory=list, description="Offsets of shards whose workflow failed outright"
     )
 
 
-@workflow_api(name="ingest-propertyguru", version="v1")
+class IngestPropertyGuruShardInput(BaseModel):
+    """Input for a single PropertyGuru ingestion shard."""
+
+    streets_file: str = Field(..., description="Path to the JSON file containing street names")
+    output_dir: str = Field(..., description="Directory to save the output files")
+    offset: int = Field(..., ge=0, description="Index of the first street in this shard")
+    limit: int = Field(..., ge=1, description="Number of streets in this shard")
+    max_concurrent: int = Field(default=10, ge=1, description="Maximum concurrent API requests")
+    fused: bool = Field(default=True, description="Use the combined fetch-and-save activity")
+    freshness_seconds: float | None = Field(
+        default=None, description="Skip streets fetched within this many seconds"
+    )
+
+
+@workflow.defn
+class IngestPropertyGuruShardWorkflow:
+    """Workflow that ingests one contiguous slice of the streets list."""
+
+    @workflow.run
+    async def run(self, input: IngestPropertyGuruShardInput) -> IngestPropertyGuruOutput:
+        """Fetch and save every street in the shard.
+
+        Args:
+            input: Shard boundaries and configuration
+
+        Returns:
+            Ingestion results for this shard
+        """
+        streets = await load_streets_list.execute(input.streets_file, input.offset, input.limit)
+
+        # Create a semaphore to limit concurrency
+        semaphore = asyncio.Semaphore(input.max_concurrent)
+
+        async def process_street(street_name: str) -> tuple[str, bool]:
+            """Process a single street with semaphore control."""
+            async with semaphore:
+                try:
+                    workflow.logger.info(f"Fetching data for: {street_name}")
+
+                    if input.fused:
+                        output_path = await fetch_and_save_propertyguru_data.execute(
+                            street_name, input.output_dir, input.freshness_seconds
+                        )
+                    else:
+                        # Fetch the data
+                        data = await fetch_propertyguru_autocomplete.execute(street_name)
+
+                        # Save the data
+                        output_path = await save_propertyguru_data.execute(
+                            street_name, data, input.output_dir
+                        )
+
+                    workflow.logger.info(f"✓ Saved {street_name} to {output_path}")
+                    return street_name, True
+
+                except Exception as e:
+                    workflow.logger.error(f"✗ Failed to process {street_name}: {e}")
+                    return street_name, False
+
+        results = await asyncio.gather(*(process_street(street) for street in streets))
+        failed_streets = [street for street, success in results if not success]
+
+        return IngestPropertyGuruOutput(
+            total_streets=len(streets),
+            successful=len(streets) - len(failed_streets),
+            failed=len(failed_streets),
+            failed_streets=failed_streets,
+        )
+
+
+@workflow_api(
+    name="ingest-propertyguru",
+    version="v1",
+    child_workflows=[IngestPropertyGuruShardWorkflow],
+)
 @workflow.defn
 class IngestPropertyGuruWorkflow:
     """Workflow that ingests PropertyGuru autocomplete data.
 
-    Processes all Singapore streets in parallel.
+    Splits the streets list into shards of ``shard_size`` streets, each run as
+    a child workflow so the work spreads across workers. At most
+    ``max_parallel_shards`` shards run at once, sharing ``max_concurrent``
+    requests between them, and after ``shards_per_run`` shards the workflow
+    continues as new with a cursor, so no single history grows with the size
+    of the streets list. Only a sample of failed street names is kept.
+
+    With ``resume`` enabled, the index of the first street not yet ingested is
+    checkpointed to the output directory's ingest manifest, and a new run
+    over the same streets file starts from there.
+
+    Runs started before sharding was introduced replay the original
+    single-history path, guarded by ``SHARDED_INGEST_PATCH``.
     """
 
+    def __init__(self) -> None:
+        self._successful = 0
+        self._failed = 0
+        self._failed_sample: list[str] = []
+        self._failed_shards: list[int] = []
+        self._completed: set[int] = set()
+        self._watermark = 0
+
     @workflow.run
     async def run(self, input: IngestPropertyGuruInput) -> IngestPropertyGuruOutput:
         """Execute the PropertyGuru ingestion workflow.
 
+        Args:
+            input: Workflow input with configuration and checkpoint
+
+        Returns:
+            Ingestion results with success/failure counts
+        """
+        if not workflow.patched(SHARDED_INGEST_PATCH):
+            return await self._run_unsharded(input)
+
+        total_streets = await count_streets.execute(input.streets_file)
+
+        cursor = input.cursor
+        if input.resume and cursor == 0 and workflow.info().continued_run_id is None:
+            cursor = await load_ingest_checkpoint.execute(input.streets_file, input.output_dir)
+            if cursor:
+                workflow.logger.info(f"Resuming interrupted ingest at street {cursor}")
+
+        workflow.logger.info(
+            f"Ingesting {total_streets} streets from {input.streets_file} starting at {cursor}"
+        )
+
+        self._successful = input.successful
+        self._failed = input.failed
+        self._failed_sample = list(input.failed_sample)
+        self._failed_shards = list(input.failed_shards)
+        self._watermark = cursor
+        workflow_id = workflow.info().workflow_id
+
+        # Split the request budget so running shards together stay within max_concurrent
+        parallel_shards = min(input.max_parallel_shards, input.max_concurrent)
+        shard_concurrency = input.max_concurrent // parallel_shards
+
+        # Shards handled by this run; the rest is left for the continued run
+        offsets = list(range(cursor, total_streets, input.shard_size))
+        run_offsets = offsets[: input.shards_per_run]
+
+        pending: dict[asyncio.Task[IngestPropertyGuruOutput], int] = {}
+        for offset in run_offsets:
+            if len(pending) >= parallel_shards:
+                await self._collect(input, pending)
+
+            shard = IngestPropertyGuruShardInput(
+                streets_file=input.streets_file,
+                output_dir=input.output_dir,
+                offset=offset,
+                limit=input.shard_size,
+                max_concurrent=shard_concurrency,
+                fused=input.fused,
+                freshness_seconds=input.freshness_seconds,
+            )
+            task = asyncio.create_task(
+                workflow.execute_child_workflow(
+                    IngestPropertyGuruShardWorkflow.run,
+                    shard,
+                    id=f"{workflow_id}-shard-{offset}",
+                )
+            )
+            pending[task] = offset
+
+        while pending:
+            await self._collect(input, pending)
+
+        if len(offsets) > len(run_offsets):
+            workflow.logger.info(f"Continuing as new at street {self._watermark}")
+            workflow.continue_as_new(
+                input.model_copy(
+                    update={
+                        "cursor": self._watermark,
+                        "successful": self._successful,
+                        "failed": self._failed,
+                        "failed_sample": self._failed_sample,
+                        "failed_shards": self._failed_shards,
+                    }
+                )
+            )
+
+        if input.resume:
+            await save_ingest_checkpoint.execute(input.streets_file, input.output_dir, None)
+
+        workflow.logger.info(
+            f"Ingestion complete: {self._successful} successful, "
+            f"{self._failed} failed, {len(self._failed_shards)} shards failed "
+            f"out of {total_streets} total"
+        )
+
+        return IngestPropertyGuruOutput(
+            total_streets=total_streets,
+            successful=self._successful,
+            failed=self._failed,
+            failed_streets=self._failed_sample,
+            failed_shards=self._failed_shards,
+        )
+
+    async def _run_unsharded(self, input: IngestPropertyGuruInput) -> IngestPropertyGuruOutput:
+        """Ingest every street in this workflow's own history.
+
+        The path taken before sharding, kept so runs started on it can replay.
+
         Args:
             input: Workflow input with configuration
 
@@ -55,61 +300,76 @@ class IngestPropertyGuruWorkflow:
         """
         workflow.logger.info(f"Starting PropertyGuru ingestion from {input.streets_file}")
 
-        # Load the list of streets
         streets = await load_streets_list.execute(input.streets_file)
         total_streets = len(streets)
 
         workflow.logger.info(f"Loaded {total_streets} streets to process")
 
-        # Process streets in parallel with concurrency control
-        successful = 0
-        failed = 0
-        failed_streets = []
-
-        # Create a semaphore to limit concurrency
         semaphore = asyncio.Semaphore(input.max_concurrent)
 
         async def process_street(street_name: str) -> tuple[str, bool]:
             """Process a single street with semaphore control."""
             async with semaphore:
                 try:
-                    workflow.logger.info(f"Fetching data for: {street_name}")
-
-                    # Fetch the data
                     data = await fetch_propertyguru_autocomplete.execute(street_name)
-
-                    # Save the data
                     output_path = await save_propertyguru_data.execute(
                         street_name, data, input.output_dir
                     )
-
                     workflow.logger.info(f"✓ Saved {street_name} to {output_path}")
                     return street_name, True
-
                 except Exception as e:
                     workflow.logger.error(f"✗ Failed to process {street_name}: {e}")
                     return street_name, False
 
-        # Process all streets in parallel
-        tasks = [process_street(street) for street in streets]
-        results = await asyncio.gather(*tasks, return_exceptions=False)
-
-        # Count successes and failures
-        for street_name, success in results:
-            if success:
-                successful += 1
-            else:
-                failed += 1
-                failed_streets.append(street_name)
+        results = await asyncio.gather(*(process_street(street) for street in streets))
+        failed_streets = [street for street, success in results if not success]
 
         workflow.logger.info(
-            f"Ingestion complete: {successful} successful, "
-            f"{failed} failed out of {total_streets} total"
+            f"Ingestion complete: {total_streets - len(failed_streets)} successful, "
+            f"{len(failed_streets)} failed out of {total_streets} total"
         )
 
         return IngestPropertyGuruOutput(
             total_streets=total_streets,
-            successful=successful,
-            failed=failed,
+            successful=total_streets - len(failed_streets),
+            failed=len(failed_streets),
             failed_streets=failed_streets,
         )
+
+    async def _collect(
+        self,
+        input: IngestPropertyGuruInput,
+        pending: dict[asyncio.Task[IngestPropertyGuruOutput], int],
+    ) -> None:
+        """Wait for at least one shard to finish, fold in its results and checkpoint.
+
+        Args:
+            input: Workflow input (shard size and checkpoint settings)
+            pending: Running shard tasks mapped to their offsets; finished ones are removed
+        """
+        done, _ = await workflow.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            offset = pending.pop(task)
+            self._completed.add(offset)
+            try:
+                result = task.result()
+            except Exception as e:
+                workflow.logger.error(f"✗ Shard at {offset} failed: {e}")
+                self._failed_shards.append(offset)
+                continue
+            self._successful += result.successful
+            self._failed += result.failed
+            room = FAILED_STREETS_SAMPLE_SIZE - len(self._failed_sample)
+            self._failed_sample.extend(result.failed_streets[:room])
+
+        # Shards finish out of order; only checkpoint past a contiguous prefix
+        watermark = self._watermark
+        while watermark in self._completed:
+            self._completed.discard(watermark)
+            watermark += input.shard_size
+        if watermark != self._watermark:
+            self._watermark = watermark
+            if input.resume:
+                await save_ingest_checkpoint.execute(
+                    input.streets_file, input.output_dir, watermark
+                )
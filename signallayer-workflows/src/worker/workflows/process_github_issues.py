@@ -1,11 +1,21 @@
 """Workflow for processing GitHub issues."""
 
+import asyncio
+
 from pydantic import BaseModel, Field
 from temporalio import workflow
+from temporalio.exceptions import WorkflowAlreadyStartedError
 
 from src.worker.workflows.activities.issues import fetch_issues_by_label
 from src.worker.lib.decorators import workflow_api
-from src.worker.workflows.research_issue import ResearchIssueInput, ResearchIssueWorkflow
+from src.worker.workflows.research_issue import (
+    ResearchIssueInput,
+    ResearchIssueOutput,
+    ResearchIssueWorkflow,
+)
+
+MAX_IN_FLIGHT_PATCH = "research-max-in-flight"
+"""Patch marking runs that cap concurrent research workflows at ``max_in_flight``."""
 
 
 class ProcessGithubIssuesInput(BaseModel):
@@ -13,6 +23,9 @@ class ProcessGithubIssuesInput(BaseModel):
 
     repository: str = Field(..., description="Repository to scan (e.g., 'owner/repo')")
     label: str = Field(default="check-demand", description="Label to filter issues by")
+    max_in_flight: int = Field(
+        default=5, ge=1, description="Maximum number of research workflows running at once"
+    )
 
 
 class ProcessGithubIssuesOutput(BaseModel):
@@ -20,6 +33,19 @@ class ProcessGithubIssuesOutput(BaseModel):
 
     signals_found: int = Field(..., description="Number of issues discovered")
     signals_processed: int = Field(..., description="Number of issues successfully processed")
+    signals_skipped: int = Field(
+        default=0, description="Number of issues whose research was already running"
+    )
+
+
+class ProcessGithubIssuesProgress(BaseModel):
+    """Progress of a process GitHub issues run, returned by the ``progress`` query."""
+
+    signals_found: int = Field(default=0, description="Number of issues discovered")
+    in_flight: int = Field(default=0, description="Research workflows currently running")
+    processed: int = Field(default=0, description="Issues successfully processed")
+    failed: int = Field(default=0, description="Issues whose research failed")
+    skipped: int = Field(default=0, description="Issues whose research was already running")
 
 
 @workflow_api(name="process-github-issues", version="v1")
@@ -28,15 +54,28 @@ class ProcessGithubIssuesWorkflow:
     """Scheduled workflow that processes GitHub issues from collaboration platforms.
 
     Queries GitHub issues labeled with 'check-demand' and triggers ResearchIssueWorkflow
-    for each discovered signal.
+    for each discovered signal. At most ``max_in_flight`` research workflows
+    run at once; issues whose research workflow is already running (e.g.
+    started by an overlapping scheduled run) are skipped.
+
+    Runs started before the cap was introduced replay with every research
+    workflow started at once, guarded by ``MAX_IN_FLIGHT_PATCH``.
     """
 
+    def __init__(self) -> None:
+        self._progress = ProcessGithubIssuesProgress()
+
+    @workflow.query
+    def progress(self) -> ProcessGithubIssuesProgress:
+        """Return how many issues have been found, are running, and have finished."""
+        return self._progress
+
     @workflow.run
     async def run(self, input: ProcessGithubIssuesInput) -> ProcessGithubIssuesOutput:
         """Execute the process GitHub issues workflow.
 
         Args:
-            input: Workflow input with repository and label
+            input: Workflow input with repository, label and concurrency limit
 
         Returns:
             Summary of discovered and processed issues
@@ -47,6 +86,7 @@ class ProcessGithubIssuesWorkflow:
 
         # Fetch issues with the demand signal label
         issues = await fetch_issues_by_label.execute(input.repository, input.label)
+        self._progress.signals_found = len(issues)
 
         workflow.logger.info(f"Found {len(issues)} issues")
 
@@ -54,11 +94,19 @@ class ProcessGithubIssuesWorkflow:
             workflow.logger.info("No issues found")
             return ProcessGithubIssuesOutput(signals_found=0, signals_processed=0)
 
-        workflow.logger.info(f"Triggering research for {len(issues)} issues in parallel")
+        max_in_flight = input.max_in_flight
+        if not workflow.patched(MAX_IN_FLIGHT_PATCH):
+            max_in_flight = len(issues)
+
+        workflow.logger.info(
+            f"Triggering research for {len(issues)} issues, {max_in_flight} at a time"
+        )
 
-        # Create a list of child workflow tasks
-        tasks = []
+        pending: dict[asyncio.Task[ResearchIssueOutput], int] = {}
         for issue_ref in issues:
+            if len(pending) >= max_in_flight:
+                await self._collect(pending)
+
             # Safely get repository and number for the workflow ID, supporting both dict and object
             repo = getattr(issue_ref, "repository", None) or issue_ref.get("repository")  # type: ignore
             number = getattr(issue_ref, "number", None) or issue_ref.get("number")  # type: ignore
@@ -69,29 +117,48 @@ class ProcessGithubIssuesWorkflow:
                 issue_ref.model_dump() if hasattr(issue_ref, "model_dump") else issue_ref
             )
 
-            task = workflow.execute_child_workflow(
-                ResearchIssueWorkflow.run,
-                ResearchIssueInput(issue_ref=issue_ref_dict),  # type: ignore
-                id=f"research-issue-{repo.replace('/', '-')}-{number}",
+            task = asyncio.create_task(
+                workflow.execute_child_workflow(
+                    ResearchIssueWorkflow.run,
+                    ResearchIssueInput(issue_ref=issue_ref_dict),  # type: ignore
+                    id=f"research-issue-{repo.replace('/', '-')}-{number}",
+                )
             )
-            tasks.append(task)
-
-        # Execute all child workflows in parallel and wait for results
-        # We use asyncio.gather (supported by Temporal's async environment) to run them concurrently
-        import asyncio
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+            pending[task] = number
+            self._progress.in_flight = len(pending)
 
-        processed_count = 0
-        for i, result in enumerate(results):
-            issue_ref = issues[i]
-            if isinstance(result, Exception):
-                workflow.logger.error(f"Failed to process issue #{issue_ref.number}: {str(result)}")
-            else:
-                processed_count += 1
+        while pending:
+            await self._collect(pending)
 
-        workflow.logger.info(f"Completed: {processed_count}/{len(issues)} issues processed")
+        progress = self._progress
+        workflow.logger.info(
+            f"Completed: {progress.processed}/{len(issues)} issues processed, "
+            f"{progress.skipped} already running"
+        )
 
         return ProcessGithubIssuesOutput(
-            signals_found=len(issues), signals_processed=processed_count
+            signals_found=len(issues),
+            signals_processed=progress.processed,
+            signals_skipped=progress.skipped,
         )
+
+    async def _collect(self, pending: dict[asyncio.Task[ResearchIssueOutput], int]) -> None:
+        """Wait for at least one research workflow to finish and update progress.
+
+        Args:
+            pending: Running child tasks mapped to issue numbers; finished ones are removed
+        """
+        done, _ = await workflow.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            number = pending.pop(task)
+            try:
+                task.result()
+            except WorkflowAlreadyStartedError:
+                workflow.logger.info(f"Research for issue #{number} is already running")
+                self._progress.skipped += 1
+            except Exception as e:
+                workflow.logger.error(f"Failed to process issue #{number}: {str(e)}")
+                self._progress.failed += 1
+            else:
+                self._progress.processed += 1
+        self._progress.in_flight = len(pending)
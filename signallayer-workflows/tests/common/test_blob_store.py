@@ -0,0 +1,70 @@
+import os
+import time
+
+import pytest
+
+from src.common.blob_store import (
+    BlobLedger,
+    BlobNotFoundError,
+    FileBlobStore,
+    create_blob_store,
+)
+
+
+@pytest.mark.parametrize("backend", ["file", "memory"])
+def test_put_get_delete(tmp_path, backend):
+    store = create_blob_store(backend, path=str(tmp_path))
+    store.put_object("abc123", b"payload")
+    assert store.get_object("abc123") == b"payload"
+
+    store.delete_object("abc123")
+    with pytest.raises(BlobNotFoundError):
+        store.get_object("abc123")
+
+
+def test_file_store_rejects_path_like_keys(tmp_path):
+    with pytest.raises(ValueError):
+        FileBlobStore(tmp_path).put_object("../escape", b"x")
+
+
+@pytest.mark.parametrize("backend", ["file", "memory"])
+def test_last_modified(tmp_path, backend):
+    store = create_blob_store(backend, path=str(tmp_path))
+    assert store.last_modified("abc123") is None
+
+    before = time.time()
+    store.put_object("abc123", b"payload")
+    modified = store.last_modified("abc123")
+    assert modified is not None and modified >= before - 1
+
+
+def test_ledger_skips_rewrites_until_refresh_is_due(tmp_path):
+    ledger = BlobLedger(tmp_path / "ledger.db")
+
+    assert ledger.needs_write("aa", refresh_seconds=60, now=1000)
+    ledger.record_write("aa", now=1000)
+    assert not ledger.needs_write("aa", refresh_seconds=60, now=1030)
+    assert ledger.needs_write("aa", refresh_seconds=60, now=1060)
+
+
+def test_garbage_collection_uses_the_store_write_time(tmp_path):
+    store = FileBlobStore(tmp_path / "blobs")
+    ledger = BlobLedger(tmp_path / "ledger.db")
+    now = time.time()
+
+    ledger.record_write("aa", now=now - 1000)
+    ledger.record_write("bb", now=now - 1000)
+    store.put_object("aa", b"a")
+    store.put_object("bb", b"b")
+    os.utime(store._path("aa"), (now - 1000, now - 1000))
+
+    # "bb" was rewritten by another process sharing the store, so only "aa" is old enough
+    assert ledger.collect_garbage(store, max_age=500, now=now) == 1
+    with pytest.raises(BlobNotFoundError):
+        store.get_object("aa")
+    assert store.get_object("bb") == b"b"
+
+    # Once the other process's write ages out too, "bb" goes
+    assert ledger.collect_garbage(store, max_age=500, now=now + 1000) == 1
+    with pytest.raises(BlobNotFoundError):
+        store.get_object("bb")
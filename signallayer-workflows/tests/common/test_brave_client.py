@@ -0,0 +1,129 @@
+"""Tests for BraveSearchClient."""
+
+import asyncio
+from collections.abc import Callable
+
+import httpx
+import pytest
+
+from src.common.clients.brave import BraveSearchClient
+from src.common.config.brave import BraveSearchSettings
+
+
+def _client_with_handler(
+    handler: Callable[[httpx.Request], httpx.Response],
+) -> BraveSearchClient:
+    """Create a Brave client whose requests are served by ``handler``."""
+    settings = BraveSearchSettings(api_key="test-key", cache_backend="memory")
+    return BraveSearchClient(settings=settings, transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+async def test_searches_record_per_endpoint_latency() -> None:
+    """Test that web and local searches hit their endpoints and record latency."""
+    paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        assert request.headers["X-Subscription-Token"] == "test-key"
+        if request.url.path.endswith("/web/search"):
+            return httpx.Response(200, json={"web": {"results": []}})
+        return httpx.Response(200, json={"results": []})
+
+    async with _client_with_handler(handler) as brave:
+        await brave.web_search("condo")
+        await brave.local_search("condo")
+
+    assert paths == ["/res/v1/web/search", "/res/v1/local/search"]
+    assert brave.latency["web"].calls == 1
+    assert brave.latency["local"].calls == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_searches_respect_the_plan_rate_by_default() -> None:
+    """Test that the default burst spaces one lookup's two searches to the plan rate."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"results": []})
+
+    settings = BraveSearchSettings(
+        api_key="test-key", cache_backend="memory", requests_per_second=50
+    )
+    async with BraveSearchClient(
+        settings=settings, transport=httpx.MockTransport(handler)
+    ) as brave:
+        await asyncio.gather(brave.web_search("condo"), brave.local_search("condo"))
+
+    assert brave.rate_limiter.metrics.delayed == 1
+
+
+@pytest.mark.asyncio
+async def test_burst_opt_in_sends_concurrent_searches_together() -> None:
+    """Test that a burst of 2 lets one lookup's two searches go out together."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"results": []})
+
+    settings = BraveSearchSettings(api_key="test-key", cache_backend="memory", burst=2)
+    async with BraveSearchClient(
+        settings=settings, transport=httpx.MockTransport(handler)
+    ) as brave:
+        await asyncio.gather(brave.web_search("condo"), brave.local_search("condo"))
+
+    assert brave.rate_limiter.metrics.delayed == 0
+
+
+@pytest.mark.asyncio
+async def test_local_search_failure_is_best_effort() -> None:
+    """Test that a failed local search returns an empty result."""
+    async with _client_with_handler(lambda request: httpx.Response(404)) as brave:
+        assert await brave.local_search("condo") == {}
+
+
+@pytest.mark.asyncio
+async def test_repeated_queries_are_served_from_cache() -> None:
+    """Test that normalized repeat queries do not spend quota."""
+    calls: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(
+            200,
+            json={"web": {"results": [{"title": "Condo"}]}},
+            headers={"X-RateLimit-Remaining": "1, 999", "X-RateLimit-Reset": "1, 1000"},
+        )
+
+    async with _client_with_handler(handler) as brave:
+        first = await brave.web_search("The  Condo Singapore")
+        second = await brave.web_search("the condo singapore")
+
+    assert first == second
+    assert len(calls) == 1
+    report = brave.quota_report()
+    assert report["credits_saved"] == 1
+    assert report["requests_sent"] == 1
+    assert report["monthly_remaining"] == 999
+
+
+@pytest.mark.asyncio
+async def test_too_many_requests_is_retried() -> None:
+    """Test that a 429 pauses the limiter and retries the search."""
+    responses = [
+        httpx.Response(429, headers={"X-RateLimit-Reset": "0, 1000"}),
+        httpx.Response(200, json={"web": {"results": []}}),
+    ]
+
+    async with _client_with_handler(lambda request: responses.pop(0)) as brave:
+        assert await brave.web_search("condo") == {"web": {"results": []}}
+
+    assert brave.latency["web"].calls == 2
+
+
+def test_missing_api_key_raises() -> None:
+    """Test that using the client without an API key fails clearly."""
+    brave = BraveSearchClient(
+        settings=BraveSearchSettings(api_key=None, cache_backend="memory")
+    )
+
+    with pytest.raises(ValueError):
+        _ = brave.client
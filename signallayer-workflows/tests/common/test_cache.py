@@ -0,0 +1,60 @@
+"""Tests for the shared cache backends."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.common.cache import MemoryCache, SQLiteCache
+
+
+def test_memory_cache_evicts_least_recently_used() -> None:
+    """Test that the in-memory cache evicts the least recently used entry."""
+    cache = MemoryCache(max_entries=2)
+    cache.set("a", b"1")
+    cache.set("b", b"2")
+    cache.get("a")
+    cache.set("c", b"3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1"
+    assert cache.get("c") == b"3"
+    assert cache.stats.evictions == 1
+
+
+def test_memory_cache_expires_entries() -> None:
+    """Test that entries are dropped once their TTL has elapsed."""
+    cache = MemoryCache(ttl=10)
+    with patch("src.common.cache.time.monotonic", return_value=100.0):
+        cache.set("a", b"1")
+    with patch("src.common.cache.time.monotonic", return_value=111.0):
+        assert cache.get("a") is None
+    assert cache.stats.misses == 1
+
+
+def test_sqlite_cache_persists_between_instances(tmp_path: Path) -> None:
+    """Test that the SQLite cache survives re-opening the database."""
+    path = tmp_path / "cache.db"
+    SQLiteCache(path).set("a", b"1")
+
+    cache = SQLiteCache(path)
+    assert cache.get("a") == b"1"
+    assert cache.stats.hits == 1
+
+
+def test_sqlite_cache_bounds_entries(tmp_path: Path) -> None:
+    """Test that the SQLite cache evicts the oldest entries when full."""
+    cache = SQLiteCache(tmp_path / "cache.db", max_entries=2)
+    with patch("src.common.cache.time.time", side_effect=[1.0, 2.0, 3.0]):
+        cache.set("a", b"1")
+        cache.set("b", b"2")
+        cache.set("c", b"3")
+
+    assert len(cache) == 2
+    assert cache.get("a") is None
+
+
+def test_sqlite_cache_rejects_invalid_table(tmp_path: Path) -> None:
+    """Test that table names are validated before being used in SQL."""
+    with pytest.raises(ValueError):
+        SQLiteCache(tmp_path / "cache.db", table="bad name")
@@ -0,0 +1,137 @@
+import json
+import os
+
+from src.common.condo_index import BUSY_TIMEOUT_MS, CondoIndex, normalize_name
+
+
+def _write(path, items):
+    path.write_text(json.dumps(items), encoding="utf-8")
+
+
+def test_normalize_name():
+    assert normalize_name("St. George's Lane") == "st_georges_lane"
+    assert normalize_name("Ang Mo Kio Avenue 1") == "ang_mo_kio_avenue_1"
+
+
+def test_lists_condos_by_display_type(tmp_path):
+    _write(
+        tmp_path / "a.json",
+        [
+            {"displayText": "Zeta", "displayType": "Condominium", "displayDescription": "1 Road"},
+            {"displayText": "Alpha", "displayType": "Executive Condominium"},
+            {"displayText": "Block 1", "displayType": "HDB"},
+        ],
+    )
+    _write(tmp_path / "b.json", [{"displayText": "Zeta", "displayType": "Condominium"}])
+
+    index = CondoIndex(tmp_path)
+    assert index.refresh() == 2
+    assert index.list_condos(["Condominium", "Executive Condominium"]) == [
+        {"name": "Alpha", "address": "Alpha"},
+        {"name": "Zeta", "address": "1 Road"},
+    ]
+    assert index.find_files("zeta") == [tmp_path / "a.json", tmp_path / "b.json"]
+
+
+def test_refresh_only_reparses_changed_files(tmp_path):
+    first = tmp_path / "a.json"
+    second = tmp_path / "b.json"
+    _write(first, [{"displayText": "One", "displayType": "Condominium"}])
+    _write(second, [{"displayText": "Two", "displayType": "Condominium"}])
+
+    index = CondoIndex(tmp_path)
+    assert index.refresh() == 2
+    assert index.refresh() == 0
+
+    # Touched without changing content: hash matches, no re-parse
+    stat = first.stat()
+    os.utime(first, (stat.st_atime, stat.st_mtime + 10))
+    assert index.refresh() == 0
+
+    _write(second, [{"displayText": "Three", "displayType": "Condominium"}])
+    os.utime(second, (stat.st_atime, stat.st_mtime + 20))
+    assert index.refresh() == 1
+    assert [c["name"] for c in index.list_condos(["Condominium"])] == ["One", "Three"]
+
+    first.unlink()
+    index.refresh()
+    assert [c["name"] for c in index.list_condos(["Condominium"])] == ["Three"]
+
+
+def test_index_file_skips_reparse(tmp_path):
+    path = tmp_path / "condo.street.json"
+    data = [{"displayText": "Listed", "displayType": "Condominium"}]
+    _write(path, data)
+
+    index = CondoIndex(tmp_path)
+    index.index_file(path, data)
+    assert index.refresh() == 0
+    assert index.list_condos(["Condominium"]) == [{"name": "Listed", "address": "Listed"}]
+
+    # The index persists across instances
+    index.close()
+    assert CondoIndex(tmp_path).list_condos(["Condominium"])[0]["name"] == "Listed"
+
+
+def test_dict_shaped_files_are_not_indexed(tmp_path):
+    data = {"data": {"items": [{"displayText": "Nested", "displayType": "Condominium"}]}}
+    _write(tmp_path / "condo.street.json", data)
+
+    index = CondoIndex(tmp_path)
+    index.refresh()
+    assert index.list_condos(["Condominium"]) == []
+
+
+def test_find_item_returns_the_matching_record(tmp_path):
+    _write(
+        tmp_path / "condo.street.json",
+        [
+            {"displayText": "The Pier", "displayType": "Condominium"},
+            {"displayText": "St. George's Court", "displayType": "Condominium", "id": 7},
+        ],
+    )
+    index = CondoIndex(tmp_path)
+    index.refresh()
+    assert index.find_item("st georges court") == {
+        "displayText": "St. George's Court",
+        "displayType": "Condominium",
+        "id": 7,
+    }
+    assert index.find_item("Missing") is None
+
+
+def test_database_uses_wal_and_busy_timeout(tmp_path):
+    index = CondoIndex(tmp_path)
+    assert index._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert index._conn.execute("PRAGMA busy_timeout").fetchone()[0] == BUSY_TIMEOUT_MS
+
+
+def test_list_condos_pages_in_name_order(tmp_path):
+    _write(
+        tmp_path / "a.json",
+        [{"displayText": name, "displayType": "Condominium"} for name in "DCBAE"],
+    )
+    index = CondoIndex(tmp_path)
+    index.refresh()
+    assert [c["name"] for c in index.list_condos(["Condominium"], 1, 2)] == ["B", "C"]
+    assert [c["name"] for c in index.list_condos(["Condominium"], 3)] == ["D", "E"]
+
+
+def test_list_condos_pages_by_keyset_across_catalog_changes(tmp_path):
+    _write(
+        tmp_path / "a.json",
+        [{"displayText": name, "displayType": "Condominium"} for name in "BDF"],
+    )
+    index = CondoIndex(tmp_path)
+    index.refresh()
+    first = index.list_condos(["Condominium"], limit=2)
+    assert [c["name"] for c in first] == ["B", "D"]
+
+    # A condo sorting before the cursor appears between pages: nothing is repeated or skipped
+    _write(
+        tmp_path / "b.json",
+        [{"displayText": name, "displayType": "Condominium"} for name in "AE"],
+    )
+    index.refresh()
+    rest = index.list_condos(["Condominium"], after=first[-1]["name"])
+    assert [c["name"] for c in rest] == ["E", "F"]
@@ -0,0 +1,39 @@
+"""Tests for the shared email extraction engine."""
+
+from src.common.email_extraction import EmailExtractor, extract_emails
+
+
+def test_extracts_across_fields_and_deduplicates() -> None:
+    """Test that emails from several fields are merged, normalized and sorted."""
+    emails = extract_emails(
+        "Contact sales@Condo.SG today",
+        "Management: mgmt@condo.sg, sales@condo.sg",
+        "https://condo.sg/contact",
+    )
+
+    assert emails == ["mgmt@condo.sg", "sales@condo.sg"]
+
+
+def test_deobfuscates_common_spellings() -> None:
+    """Test bracketed, HTML entity and mailto-encoded addresses."""
+    emails = extract_emails(
+        "office [at] condo [dot] sg",
+        "info&#64;condo.sg",
+        '<a href="mailto:hello%40condo.sg">Email us</a>',
+    )
+
+    assert emails == ["hello@condo.sg", "info@condo.sg", "office@condo.sg"]
+
+
+def test_blocklist_and_asset_names_are_filtered() -> None:
+    """Test that blocked domains, subdomains and image names are dropped."""
+    emails = extract_emails("a@example.com b@mail.test.com logo@2x.png real@condo.sg")
+
+    assert emails == ["real@condo.sg"]
+
+
+def test_custom_blocklist_predicate() -> None:
+    """Test that a predicate can replace the default blocklist."""
+    extractor = EmailExtractor(blocklist=lambda domain: domain.endswith(".sg"))
+
+    assert extractor.extract("a@condo.sg b@condo.com") == ["b@condo.com"]
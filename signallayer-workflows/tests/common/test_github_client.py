@@ -1,21 +1,23 @@
 """Tests for GitHubClient."""
 
-from datetime import datetime, timezone
-from unittest.mock import AsyncMock, MagicMock, patch
+import time
+from collections.abc import Callable
+from unittest.mock import patch
 
+import httpx
 import pytest
 
 from src.common.clients.github import GitHubClient
+from src.common.exceptions import RateLimitExceededError
 from src.common.models import IssueDetails, IssueReference
 
 
-@pytest.fixture
-def github_client() -> GitHubClient:
-    """Create a GitHub client for testing."""
+def _client_with_handler(handler: Callable[[httpx.Request], httpx.Response]) -> GitHubClient:
+    """Create a GitHub client whose requests are served by ``handler``."""
     from src.common.config.github import GitHubSettings
 
     settings = GitHubSettings(token="test-token")
-    return GitHubClient(settings=settings)
+    return GitHubClient(settings=settings, transport=httpx.MockTransport(handler))
 
 
 @pytest.fixture
@@ -35,7 +37,7 @@ def mock_github_issue_response() -> dict:
 
 
 @pytest.mark.asyncio
-async def test_fetch_issues_by_label(github_client: GitHubClient) -> None:
+async def test_fetch_issues_by_label() -> None:
     """Test fetching issues by label."""
     mock_response_data = [
         {
@@ -49,51 +51,179 @@ async def test_fetch_issues_by_label(github_client: GitHubClient) -> None:
             "html_url": "https://github.com/owner/repo/issues/2",
         },
     ]
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=mock_response_data)
+
+    github_client = _client_with_handler(handler)
+    issues = await github_client.fetch_issues_by_label("owner/repo", "check-demand")
+
+    assert len(issues) == 2
+    assert all(isinstance(issue, IssueReference) for issue in issues)
+    assert issues[0].number == 1
+    assert issues[0].title == "Issue 1"
+    assert issues[0].platform == "github"
+    assert issues[0].repository == "owner/repo"
+    assert requests[0].url.path == "/repos/owner/repo/issues"
+    assert requests[0].url.params["labels"] == "check-demand"
+    assert requests[0].headers["Authorization"] == "Bearer test-token"
+
 
-    with patch("src.common.clients.github.httpx.AsyncClient") as mock_client_class:
-        mock_response = MagicMock()
-        mock_response.json.return_value = mock_response_data
-        mock_response.raise_for_status = MagicMock()
+@pytest.mark.asyncio
+async def test_iter_issues_by_label_follows_link_header() -> None:
+    """Test that issue listing streams every page advertised via the Link header."""
+    pages = {
+        1: [{"number": 1, "title": "Issue 1", "html_url": "https://github.com/o/r/issues/1"}],
+        2: [{"number": 2, "title": "Issue 2", "html_url": "https://github.com/o/r/issues/2"}],
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params.get("page", 1))
+        headers = {}
+        if page < len(pages):
+            headers["Link"] = (
+                f'<https://api.github.com/repos/o/r/issues?labels=x&page={page + 1}>; rel="next"'
+            )
+        return httpx.Response(200, json=pages[page], headers=headers)
 
-        mock_client = AsyncMock()
-        mock_client.get = AsyncMock(return_value=mock_response)
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+    github_client = _client_with_handler(handler)
 
-        issues = await github_client.fetch_issues_by_label("owner/repo", "check-demand")
+    numbers = [issue.number async for issue in github_client.iter_issues_by_label("o/r", "x")]
+    assert numbers == [1, 2]
 
-        assert len(issues) == 2
-        assert all(isinstance(issue, IssueReference) for issue in issues)
-        assert issues[0].number == 1
-        assert issues[0].title == "Issue 1"
-        assert issues[0].platform == "github"
-        assert issues[0].repository == "owner/repo"
+    issues = await github_client.fetch_issues_by_label("o/r", "x")
+    assert [issue.number for issue in issues] == [1, 2]
 
 
 @pytest.mark.asyncio
-async def test_fetch_issue_details(
-    github_client: GitHubClient, mock_github_issue_response: dict
-) -> None:
+async def test_fetch_issue_details(mock_github_issue_response: dict) -> None:
     """Test fetching issue details."""
-    with patch("src.common.clients.github.httpx.AsyncClient") as mock_client_class:
-        mock_response = MagicMock()
-        mock_response.json.return_value = mock_github_issue_response
-        mock_response.raise_for_status = MagicMock()
-
-        mock_client = AsyncMock()
-        mock_client.get = AsyncMock(return_value=mock_response)
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-
-        details = await github_client.fetch_issue_details("owner/repo", 123)
-
-        assert isinstance(details, IssueDetails)
-        assert details.number == 123
-        assert details.title == "Test Issue"
-        assert details.body == "Test body"
-        assert details.platform == "github"
-        assert details.repository == "owner/repo"
-        assert details.labels == ["check-demand", "priority-high"]
-        assert details.author == "testuser"
-        assert details.state == "open"
+    github_client = _client_with_handler(
+        lambda request: httpx.Response(200, json=mock_github_issue_response)
+    )
+
+    details = await github_client.fetch_issue_details("owner/repo", 123)
+
+    assert isinstance(details, IssueDetails)
+    assert details.number == 123
+    assert details.title == "Test Issue"
+    assert details.body == "Test body"
+    assert details.platform == "github"
+    assert details.repository == "owner/repo"
+    assert details.labels == ["check-demand", "priority-high"]
+    assert details.author == "testuser"
+    assert details.state == "open"
+
+
+@pytest.mark.asyncio
+async def test_client_reuses_pooled_connection(mock_github_issue_response: dict) -> None:
+    """Test that one shared HTTP client serves every call until closed."""
+    github_client = _client_with_handler(
+        lambda request: httpx.Response(200, json=mock_github_issue_response)
+    )
+
+    await github_client.fetch_issue_details("owner/repo", 123)
+    first = github_client.client
+    await github_client.get_comment("owner/repo", 1)
+
+    assert github_client.client is first
+
+    await github_client.aclose()
+    assert first.is_closed
+    assert github_client.client is not first
+
+
+@pytest.mark.asyncio
+async def test_repeated_reads_use_conditional_requests(mock_github_issue_response: dict) -> None:
+    """Test that a 304 Not Modified is served from the ETag cache."""
+    seen_validators: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        etag = request.headers.get("If-None-Match")
+        seen_validators.append(etag)
+        if etag == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json=mock_github_issue_response, headers={"ETag": '"v1"'})
+
+    github_client = _client_with_handler(handler)
+
+    first = await github_client.fetch_issue_details("owner/repo", 123)
+    second = await github_client.fetch_issue_details("owner/repo", 123)
+
+    assert seen_validators == [None, '"v1"']
+    assert second == first
+    assert github_client.cache is not None
+    assert github_client.cache.stats.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_throttled_request_is_retried_after_retry_after() -> None:
+    """Test that a secondary rate limit response pauses and retries the request."""
+    responses = [
+        httpx.Response(403, headers={"Retry-After": "0"}),
+        httpx.Response(200, json={"id": 1, "body": "hello"}),
+    ]
+    github_client = _client_with_handler(lambda request: responses.pop(0))
+
+    body = await github_client.get_comment("owner/repo", 1)
+
+    assert body == "hello"
+    assert github_client.rate_limiter.metrics.acquired == 2
+
+
+@pytest.mark.asyncio
+async def test_secondary_rate_limit_without_headers_backs_off_within_wait_cap() -> None:
+    """Test that a throttled response with no reset time is retried, not rejected."""
+    from src.common.config.github import GitHubSettings
+
+    responses = [
+        httpx.Response(403, json={"message": "You have exceeded a secondary rate limit."}),
+        httpx.Response(429),
+        httpx.Response(200, json={"id": 1, "body": "hello"}),
+    ]
+    settings = GitHubSettings(
+        token="test-token",
+        secondary_rate_limit_backoff_seconds=0.01,
+        max_rate_limit_wait_seconds=1.0,
+    )
+    github_client = GitHubClient(
+        settings=settings, transport=httpx.MockTransport(lambda request: responses.pop(0))
+    )
+
+    assert await github_client.get_comment("owner/repo", 1) == "hello"
+    assert github_client.rate_limiter.metrics.acquired == 3
+
+    backoff = github_client._observe_rate_limit(httpx.Response(429), attempt=10)
+    assert backoff is not None and backoff < settings.max_rate_limit_wait_seconds
+
+
+@pytest.mark.asyncio
+async def test_exhausted_quota_schedules_a_retry_at_reset() -> None:
+    """Test that an exhausted primary quota becomes a Temporal retry at the reset time."""
+    reset_at = time.time() + 3600
+    calls: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(
+            403,
+            headers={
+                "X-RateLimit-Limit": "5000",
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": str(int(reset_at)),
+            },
+        )
+
+    github_client = _client_with_handler(handler)
+
+    with pytest.raises(RateLimitExceededError) as excinfo:
+        await github_client.get_comment("owner/repo", 1)
+
+    assert len(calls) == 1
+    delay = excinfo.value.next_retry_delay
+    assert delay is not None and 3590 < delay.total_seconds() <= 3600
 
 
 def test_github_client_requires_token() -> None:
@@ -0,0 +1,25 @@
+from src.common.ingest_manifest import IngestManifest
+
+
+def test_records_street_fetches(tmp_path):
+    manifest = IngestManifest(tmp_path)
+    assert manifest.get("Admiralty Drive") is None
+
+    manifest.record("Admiralty Drive", "abc", fetched_at=1000.0)
+    record = manifest.get("Admiralty Drive")
+    assert record.sha256 == "abc"
+    assert record.is_fresh(60, now=1030.0)
+    assert not record.is_fresh(60, now=1100.0)
+
+
+def test_checkpoints_persist_and_clear(tmp_path):
+    manifest = IngestManifest(tmp_path)
+    assert manifest.get_checkpoint("streets.json") == 0
+
+    manifest.set_checkpoint("streets.json", 300)
+    manifest.close()
+
+    manifest = IngestManifest(tmp_path)
+    assert manifest.get_checkpoint("streets.json") == 300
+    manifest.set_checkpoint("streets.json", None)
+    assert manifest.get_checkpoint("streets.json") == 0
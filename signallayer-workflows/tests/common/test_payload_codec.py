@@ -0,0 +1,141 @@
+import asyncio
+import threading
+
+import pytest
+from temporalio.api.common.v1 import Payload
+
+from src.common.config.payloads import PayloadSettings
+from src.common.payload_codec import ENCODING_GZIP, CompressionCodec
+from src.common.pydantic_converter import create_data_converter, payload_codecs
+
+
+def _payload(data: bytes) -> Payload:
+    return Payload(metadata={"encoding": b"json/plain"}, data=data)
+
+
+@pytest.mark.asyncio
+async def test_compresses_large_payloads_and_restores_them():
+    codec = CompressionCodec(threshold_bytes=100, algorithm="gzip")
+    large = _payload(b'"' + b"markdown " * 1000 + b'"')
+    small = _payload(b'"tiny"')
+
+    encoded = await codec.encode([large, small])
+
+    assert encoded[0].metadata["encoding"] == ENCODING_GZIP
+    assert len(encoded[0].data) < len(large.data)
+    assert encoded[1] is small
+    assert await codec.decode(encoded) == [large, small]
+    assert codec.metrics.encoded == 1
+    assert codec.metrics.passed_through == 1
+    assert codec.metrics.decoded == 1
+    assert codec.metrics.bytes_saved > 0
+
+
+@pytest.mark.asyncio
+async def test_incompressible_payloads_are_left_alone():
+    codec = CompressionCodec(threshold_bytes=10, algorithm="gzip")
+    payload = _payload(bytes(range(256)))
+    assert await codec.encode([payload]) == [payload]
+
+
+@pytest.mark.asyncio
+async def test_data_converter_round_trip_with_compression():
+    converter = create_data_converter(
+        PayloadSettings(compression_enabled=True, compression_threshold_bytes=64)
+    )
+    findings = "## Findings\n" * 500
+
+    payloads = await converter.encode([findings])
+    assert payloads[0].metadata["encoding"] != b"json/plain"
+    assert await converter.decode(payloads, [str]) == [findings]
+
+
+def test_compression_is_opt_in():
+    converter = create_data_converter(PayloadSettings(compression_enabled=False))
+    assert converter.payload_codec is None
+    assert PayloadSettings.model_fields["compression_enabled"].default is False
+
+
+def test_compression_defaults_to_gzip():
+    (codec,) = payload_codecs(create_data_converter(PayloadSettings(compression_enabled=True)))
+    assert codec.algorithm == "gzip"
+
+
+@pytest.mark.asyncio
+async def test_claim_check_offloads_large_payloads(tmp_path):
+    from src.common.blob_store import BlobLedger, FileBlobStore
+    from src.common.payload_codec import ENCODING_CLAIM_CHECK, ClaimCheckCodec
+
+    store = FileBlobStore(tmp_path / "blobs")
+    codec = ClaimCheckCodec(store, BlobLedger(tmp_path / "refs.db"), threshold_bytes=100)
+    large = _payload(b'"' + b"x" * 1000 + b'"')
+
+    encoded = await codec.encode([large, large, _payload(b'"tiny"')])
+
+    assert encoded[0].metadata["encoding"] == ENCODING_CLAIM_CHECK
+    assert encoded[0].ByteSize() < 200
+    assert encoded[0] == encoded[1]
+    assert len(list((tmp_path / "blobs").glob("*/*"))) == 1
+    assert (await codec.decode(encoded))[:2] == [large, large]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_encodes_share_one_upload(tmp_path):
+    from src.common.blob_store import BlobLedger, FileBlobStore
+    from src.common.payload_codec import ClaimCheckCodec
+
+    class SlowStore(FileBlobStore):
+        """File store whose uploads can be held open and failed."""
+
+        def __init__(self, root):
+            super().__init__(root)
+            self.release = threading.Event()
+            self.puts = 0
+            self.fail = False
+
+        def put_object(self, key, data):
+            self.puts += 1
+            self.release.wait(5)
+            if self.fail:
+                raise OSError("upload failed")
+            super().put_object(key, data)
+
+    store = SlowStore(tmp_path / "blobs")
+    ledger = BlobLedger(tmp_path / "refs.db")
+    codec = ClaimCheckCodec(store, ledger, threshold_bytes=100)
+    large = _payload(b'"' + b"x" * 1000 + b'"')
+
+    # The second encode waits for the first upload instead of returning a dangling reference
+    store.fail = True
+    encodes = [asyncio.create_task(codec.encode([large])) for _ in range(2)]
+    await asyncio.sleep(0.05)
+    assert not any(task.done() for task in encodes)
+    store.release.set()
+    results = await asyncio.gather(*encodes, return_exceptions=True)
+    assert all(isinstance(result, OSError) for result in results)
+    assert store.puts == 1
+
+    # Nothing was recorded, so the next encode uploads again
+    store.fail = False
+    (encoded,) = await codec.encode([large])
+    assert store.puts == 2
+    assert await codec.decode([encoded]) == [large]
+
+
+@pytest.mark.asyncio
+async def test_data_converter_chains_compression_and_claim_check(tmp_path):
+    converter = create_data_converter(
+        PayloadSettings(
+            compression_enabled=True,
+            compression_threshold_bytes=64,
+            claim_check_enabled=True,
+            claim_check_threshold_bytes=64,
+            claim_check_path=str(tmp_path / "blobs"),
+            claim_check_index_path=str(tmp_path / "refs.db"),
+        )
+    )
+    page = "".join(f"line {i}\n" for i in range(5000))
+
+    payloads = await converter.encode([page])
+    assert payloads[0].metadata["encoding"] == b"claim-check/v1"
+    assert await converter.decode(payloads, [str]) == [page]
@@ -0,0 +1,42 @@
+from pydantic import BaseModel
+
+from src.common.pydantic_converter import (
+    PydanticJSONPayloadConverter,
+    pydantic_data_converter,
+)
+
+
+class Item(BaseModel):
+    name: str
+    count: int = 0
+
+
+def test_models_round_trip_through_json_bytes():
+    converter = PydanticJSONPayloadConverter()
+    payload = converter.to_payload(Item(name="a", count=2))
+
+    assert payload.metadata["encoding"] == b"json/plain"
+    assert payload.data == b'{"name":"a","count":2}'
+    assert converter.from_payload(payload, Item) == Item(name="a", count=2)
+    assert converter.from_payload(converter.to_payload([{"name": "b"}]), list[Item]) == [
+        Item(name="b")
+    ]
+
+
+def test_adapters_are_cached_per_type():
+    converter = PydanticJSONPayloadConverter()
+    assert converter.adapter_for(Item) is converter.adapter_for(Item)
+    assert converter.adapter_for(list[Item]) is converter.adapter_for(list[Item])
+
+
+def test_invalid_payload_falls_back_to_plain_value():
+    converter = PydanticJSONPayloadConverter()
+    payload = converter.to_payload({"unexpected": True})
+    assert converter.from_payload(payload, Item) == {"unexpected": True}
+    assert converter.from_payload(payload) == {"unexpected": True}
+
+
+def test_data_converter_round_trip():
+    payloads = pydantic_data_converter.payload_converter.to_payloads([Item(name="x"), "plain"])
+    values = pydantic_data_converter.payload_converter.from_payloads(payloads, [Item, str])
+    assert values == [Item(name="x"), "plain"]
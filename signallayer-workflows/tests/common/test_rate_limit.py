@@ -0,0 +1,45 @@
+"""Tests for the token-bucket rate limiter."""
+
+import pytest
+
+from src.common.exceptions import RateLimitExceededError
+from src.common.rate_limit import RateLimiter
+
+
+@pytest.mark.asyncio
+async def test_burst_is_granted_without_waiting() -> None:
+    """Test that permits within the burst are handed out immediately."""
+    limiter = RateLimiter(rate=1, burst=3)
+
+    waits = [await limiter.acquire() for _ in range(3)]
+
+    assert max(waits) < 0.05
+    assert limiter.metrics.acquired == 3
+    assert limiter.metrics.queue_depth == 0
+
+
+@pytest.mark.asyncio
+async def test_callers_are_delayed_once_bucket_is_empty() -> None:
+    """Test that callers queue for a refill instead of failing."""
+    limiter = RateLimiter(rate=50, burst=1)
+
+    await limiter.acquire()
+    wait = await limiter.acquire()
+
+    assert wait >= 0.015
+    assert limiter.metrics.delayed == 1
+
+
+@pytest.mark.asyncio
+async def test_long_pause_raises_rate_limit_exceeded() -> None:
+    """Test that a wait beyond max_wait_seconds fails fast."""
+    limiter = RateLimiter(rate=10, burst=1, max_wait_seconds=0.5)
+    limiter.pause_for(60)
+
+    with pytest.raises(RateLimitExceededError) as excinfo:
+        await limiter.acquire()
+    assert limiter.metrics.queue_depth == 0
+    # Temporal retries the activity once the pause is over instead of failing it
+    delay = excinfo.value.next_retry_delay
+    assert delay is not None and 59 < delay.total_seconds() <= 60
+    assert not excinfo.value.non_retryable
@@ -0,0 +1,65 @@
+"""Tests for the scrape cache and the cached page fetcher."""
+
+from pathlib import Path
+
+import httpx
+import pytest
+
+from src.common.cache import MemoryCache
+from src.common.clients.web_page import WebPageClient
+from src.common.config.scrape_cache import ScrapeCacheSettings
+from src.common.scrape_cache import ScrapeCache
+
+
+@pytest.fixture
+def scrape_cache() -> ScrapeCache:
+    """Create an in-memory scrape cache."""
+    return ScrapeCache(settings=ScrapeCacheSettings(backend="memory"), backend=MemoryCache())
+
+
+def test_entries_are_keyed_by_url_and_params(scrape_cache: ScrapeCache) -> None:
+    """Test that different extraction parameters are cached separately."""
+    scrape_cache.set("https://example.com", "rules-a", {"extract_rules": "a"})
+
+    assert scrape_cache.get("https://example.com", {"extract_rules": "a"}) == "rules-a"
+    assert scrape_cache.get("https://example.com", {"extract_rules": "b"}) is None
+    assert scrape_cache.stats.hits == 1
+    assert scrape_cache.stats.misses == 1
+
+
+def test_bodies_are_compressed(scrape_cache: ScrapeCache) -> None:
+    """Test that stored bodies are compressed but round-trip unchanged."""
+    body = "markdown " * 1000
+    scrape_cache.set("https://example.com", body)
+
+    stored = scrape_cache.backend.get(ScrapeCache.key("https://example.com"))
+    assert stored is not None
+    assert len(stored) < len(body) / 10
+    assert scrape_cache.get("https://example.com") == body
+
+
+def test_file_backend_round_trip(tmp_path: Path) -> None:
+    """Test that the file backend persists pages to disk."""
+    settings = ScrapeCacheSettings(backend="file", path=str(tmp_path))
+    ScrapeCache(settings=settings).set("https://example.com", "page")
+
+    assert ScrapeCache(settings=settings).get("https://example.com") == "page"
+
+
+@pytest.mark.asyncio
+async def test_page_fetcher_serves_repeats_from_cache(scrape_cache: ScrapeCache) -> None:
+    """Test that a second fetch of the same page does not hit the network."""
+    calls: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, html="<html><script>x</script><h1>Title</h1></html>")
+
+    async with WebPageClient(
+        cache=scrape_cache, transport=httpx.MockTransport(handler)
+    ) as pages:
+        first = await pages.get_markdown("https://example.com")
+        second = await pages.get_markdown("https://example.com")
+
+    assert first == second == "# Title"
+    assert len(calls) == 1
@@ -0,0 +1,42 @@
+"""Tests for the async ScrapingBee client and RedditClient."""
+
+import json
+
+import httpx
+import pytest
+
+from src.common.clients.reddit import RedditClient
+from src.common.clients.scrapingbee import AsyncScrapingBeeClient, encode_params
+from src.common.config.scrapingbee import ScrapingBeeSettings
+
+
+def test_encode_params_matches_api_format() -> None:
+    """Test that structured and boolean parameters are encoded for the API."""
+    params = encode_params(
+        {"render_js": False, "extract_rules": {"a": "b"}, "wait": 100, "cookies": None}
+    )
+
+    assert params == {"render_js": "false", "extract_rules": '{"a": "b"}', "wait": "100"}
+
+
+@pytest.mark.asyncio
+async def test_reddit_client_scrapes_without_blocking() -> None:
+    """Test that RedditClient awaits the ScrapingBee HTML API."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        body = {"data": [{"title": "Post", "href": "/r/python/comments/1"}]}
+        return httpx.Response(200, json={"body": body, "headers": {}})
+
+    settings = ScrapingBeeSettings(api_key="key")
+    async with AsyncScrapingBeeClient(
+        settings=settings, transport=httpx.MockTransport(handler)
+    ) as sb_client:
+        reddit = RedditClient(client=sb_client, cache=None)
+        response = await reddit.search_community("jobs", "python")
+
+    assert response.body.data[0].title == "Post"
+    assert requests[0].url.params["url"] == "https://www.reddit.com/r/python/search/?q=jobs"
+    assert json.loads(requests[0].url.params["extract_rules"])["data"]["type"] == "list"
+    assert requests[0].headers["Authorization"] == "Bearer key"
@@ -54,10 +54,14 @@ def client_with_mocked_temporal(mock_temporal_client):
 def test_execute_example_workflow_api(client_with_mocked_temporal, mock_temporal_client):
     """Test that the ExampleWorkflow endpoint exists and works."""
     # Setup mock return
-    mock_temporal_client.execute_workflow.return_value = ExampleOutput(
+    mock_handle = AsyncMock()
+    mock_handle.id = "example-workflow-id"
+    mock_handle.result_run_id = "run-id"
+    mock_handle.result.return_value = ExampleOutput(
         result="Hello Test (iteration 1)",
         iterations=1
     )
+    mock_temporal_client.start_workflow.return_value = mock_handle
 
     # Post to the generated endpoint
     response = client_with_mocked_temporal.post(
@@ -71,8 +75,8 @@ def test_execute_example_workflow_api(client_with_mocked_temporal, mock_temporal
     assert "Hello Test" in data["result"]
     
     # Verify the correct workflow was called
-    mock_temporal_client.execute_workflow.assert_called_once()
-    args, kwargs = mock_temporal_client.execute_workflow.call_args
+    mock_temporal_client.start_workflow.assert_called_once()
+    args, kwargs = mock_temporal_client.start_workflow.call_args
     assert kwargs["id"].startswith("example-workflow")
 
 def test_execute_example_workflow_async_api(client_with_mocked_temporal, mock_temporal_client):
@@ -98,4 +102,4 @@ def test_execute_example_workflow_async_api(client_with_mocked_temporal, mock_te
     mock_temporal_client.start_workflow.assert_called_once()
     _, kwargs = mock_temporal_client.start_workflow.call_args
     assert kwargs["id"].startswith("example-workflow")
-    assert kwargs["id"] in data["status_url"]
+    assert data["workflow_id"] in data["status_url"]
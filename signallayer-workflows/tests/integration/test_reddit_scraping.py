@@ -2,8 +2,8 @@
 
 import os
 import pytest
-from scrapingbee import ScrapingBeeClient
 from src.common.clients.reddit import RedditClient
+from src.common.clients.scrapingbee import AsyncScrapingBeeClient
 from src.common.config.scrapingbee import ScrapingBeeSettings
 
 
@@ -14,7 +14,7 @@ def _get_reddit_client() -> RedditClient:
     except Exception:
         pytest.skip("ScrapingBeeSettings could not be initialized")
 
-    sb_client = ScrapingBeeClient(api_key=sb_settings.api_key)
+    sb_client = AsyncScrapingBeeClient(settings=sb_settings)
     return RedditClient(client=sb_client)
 
 
@@ -24,7 +24,7 @@ async def test_list_communities_live() -> None:
     """Test listing communities."""
     client = _get_reddit_client()
 
-    response = client.list_communities("python")
+    response = await client.list_communities("python")
 
     if not response.body.data:
         pytest.warns(UserWarning, match="No communities found")
@@ -40,7 +40,7 @@ async def test_latest_community_posts_live() -> None:
     """Test getting latest posts from a community."""
     client = _get_reddit_client()
 
-    response = client.latest_community_posts("python")
+    response = await client.latest_community_posts("python")
 
     if not response.body.data:
         pytest.warns(UserWarning, match="No posts found in community")
@@ -57,7 +57,7 @@ async def test_search_community_live() -> None:
     client = _get_reddit_client()
 
     # Search for 'jobs' in 'python' subreddit
-    response = client.search_community("jobs", "python")
+    response = await client.search_community("jobs", "python")
 
     # Verify results
     if response.body.data:
@@ -73,7 +73,7 @@ async def test_get_community_post_markdown_live() -> None:
     client = _get_reddit_client()
 
     # Fetch a post to get its ID/URL
-    response = client.latest_community_posts("python")
+    response = await client.latest_community_posts("python")
     if not response.body.data:
         pytest.skip("No posts found")
 
@@ -84,7 +84,7 @@ async def test_get_community_post_markdown_live() -> None:
         idx = parts.index("comments")
         post_id = "/".join(parts[idx:])
 
-        markdown = client.get_community_post_markdown("python", post_id)
+        markdown = await client.get_community_post_markdown("python", post_id)
         assert markdown
         assert isinstance(markdown, str)
     else:
@@ -0,0 +1,110 @@
+"""Tests for the Temporal client pool."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.web.client_pool import TemporalClientPool, TemporalUnavailableError
+from src.web.config import WebSettings
+
+
+def _client(healthy=True):
+    client = Mock()
+    client.service_client.check_health = AsyncMock(return_value=healthy)
+    return client
+
+
+def _settings(**overrides):
+    defaults = {
+        "temporal_pool_size": 2,
+        "health_check_interval": 60.0,
+        "reconnect_backoff_initial": 0.001,
+        "reconnect_backoff_max": 0.001,
+    }
+    return WebSettings(**{**defaults, **overrides})
+
+
+async def test_get_rotates_between_connections():
+    """Test that clients are handed out round-robin."""
+    clients = [_client(), _client()]
+    pool = TemporalClientPool(_settings(), connect=AsyncMock(side_effect=clients))
+    await pool.start()
+
+    handed_out = [await pool.get() for _ in range(4)]
+
+    assert handed_out == [clients[0], clients[1], clients[0], clients[1]]
+    await pool.close()
+
+
+async def test_start_fails_when_no_connection_succeeds():
+    """Test that startup fails if Temporal cannot be reached at all."""
+    pool = TemporalClientPool(_settings(), connect=AsyncMock(side_effect=OSError("refused")))
+
+    with pytest.raises(OSError):
+        await pool.start()
+
+
+async def test_broken_connection_is_replaced():
+    """Test that a broken client leaves rotation and its slot reconnects with backoff."""
+    first, second, replacement = _client(), _client(), _client()
+    connect = AsyncMock(side_effect=[first, second, OSError("refused"), replacement])
+    pool = TemporalClientPool(_settings(), connect=connect)
+    await pool.start()
+
+    pool.mark_broken(first)
+    assert pool.connected == 1
+    assert {await pool.get() for _ in range(3)} == {second}
+
+    while pool.connected < 2:
+        await asyncio.sleep(0.001)
+    assert replacement in {await pool.get() for _ in range(2)}
+    assert connect.await_count == 4
+    await pool.close()
+
+
+async def test_get_raises_when_every_slot_is_down():
+    """Test that an empty pool reports Temporal as unavailable."""
+    client = _client()
+    pool = TemporalClientPool(
+        _settings(temporal_pool_size=1, reconnect_backoff_initial=60, reconnect_backoff_max=60),
+        connect=AsyncMock(side_effect=[client, OSError("refused")]),
+    )
+    await pool.start()
+
+    pool.mark_broken(client)
+
+    with pytest.raises(TemporalUnavailableError):
+        await pool.get()
+    await pool.close()
+
+
+async def test_check_ready_caches_probe_results():
+    """Test that readiness probes within the cache period reuse the last result."""
+    client = _client()
+    pool = TemporalClientPool(
+        _settings(temporal_pool_size=1), connect=AsyncMock(return_value=client)
+    )
+    await pool.start()
+
+    results = await asyncio.gather(*(pool.check_ready() for _ in range(5)))
+
+    assert results == [True] * 5
+    client.service_client.check_health.assert_awaited_once()
+    await pool.close()
+
+
+async def test_check_ready_fails_and_reconnects_on_unhealthy_connection():
+    """Test that a failed readiness probe reports not ready and replaces the connection."""
+    unhealthy, replacement = _client(healthy=False), _client()
+    pool = TemporalClientPool(
+        _settings(temporal_pool_size=1, ready_cache_seconds=0),
+        connect=AsyncMock(side_effect=[unhealthy, replacement]),
+    )
+    await pool.start()
+
+    assert await pool.check_ready() is False
+    while pool.connected < 1:
+        await asyncio.sleep(0.001)
+    assert await pool.check_ready() is True
+    await pool.close()
@@ -0,0 +1,98 @@
+"""Tests for OpenAPI schema pre-rendering."""
+
+import inject
+import pytest
+from fastapi import FastAPI
+from pydantic import BaseModel
+from temporalio import workflow
+
+from src.web.openapi import prerender_openapi, schema_fingerprint
+from src.web.routes import generate_workflow_routes
+from src.worker.lib.decorators import workflow_api
+from src.worker.lib.registry import WorkflowRegistry
+
+
+class SchemaInput(BaseModel):
+    """Input model for schema tests."""
+
+    name: str
+
+
+class SchemaOutput(BaseModel):
+    """Output model for schema tests."""
+
+    greeting: str
+
+
+@workflow.defn
+class SchemaWorkflow:
+    """Workflow for schema tests."""
+
+    @workflow.run
+    async def run(self, input_data: SchemaInput) -> SchemaOutput:
+        """Run the workflow."""
+        return SchemaOutput(greeting=input_data.name)
+
+
+@pytest.fixture
+def workflow_registry():
+    """Workflow registry holding only SchemaWorkflow."""
+    from src.common.injection import configure_inject
+
+    configure_inject()
+    registry = inject.instance(WorkflowRegistry)
+    registry.clear()
+    workflow_api(name="schema-workflow", version="v1")(SchemaWorkflow)
+    yield registry
+    registry.clear()
+
+
+def _app(workflow_registry):
+    app = FastAPI()
+    app.include_router(generate_workflow_routes(workflow_registry), prefix="/api/v1")
+    return app
+
+
+def test_prerender_sets_schema_without_cache(workflow_registry):
+    """Test that the schema is rendered eagerly when no cache file is configured."""
+    app = _app(workflow_registry)
+
+    assert prerender_openapi(app, workflow_registry.snapshot()) is False
+    assert "/api/v1/workflow/schema-workflow-v1" in app.openapi_schema["paths"]
+
+
+def test_prerender_reuses_cached_schema(workflow_registry, tmp_path):
+    """Test that a second startup loads the schema saved by the first."""
+    cache_path = str(tmp_path / "openapi.json")
+    snapshot = workflow_registry.snapshot()
+    first = _app(workflow_registry)
+    assert prerender_openapi(first, snapshot, cache_path) is False
+
+    second = _app(workflow_registry)
+    assert prerender_openapi(second, snapshot, cache_path) is True
+    assert second.openapi_schema == first.openapi_schema
+
+
+def test_prerender_ignores_stale_or_corrupt_cache(workflow_registry, tmp_path):
+    """Test that a cache written for different routes, or unreadable, is re-rendered."""
+    cache_path = tmp_path / "openapi.json"
+    cache_path.write_text("{not json")
+    snapshot = workflow_registry.snapshot()
+
+    assert prerender_openapi(_app(workflow_registry), snapshot, str(cache_path)) is False
+
+    other = FastAPI()
+    assert schema_fingerprint(other, ()) != schema_fingerprint(_app(workflow_registry), snapshot)
+
+
+def test_fingerprint_tracks_settings_rendered_into_the_schema(workflow_registry, monkeypatch):
+    """Test that changing a web setting shown in the schema invalidates the cached schema."""
+    from src.web.config import settings
+
+    snapshot = workflow_registry.snapshot()
+    app = _app(workflow_registry)
+    before = schema_fingerprint(app, snapshot)
+
+    monkeypatch.setattr(settings, "status_max_wait", settings.status_max_wait + 1)
+
+    assert schema_fingerprint(app, snapshot) != before
@@ -0,0 +1,97 @@
+"""Tests for the workflow result cache."""
+
+import time
+
+import pytest
+
+from src.common.cache import CacheBackend, MemoryCache, SQLiteCache
+from src.web.config import WebSettings
+from src.web.result_cache import _EXPIRES_AT, WorkflowResultCache
+
+
+@pytest.mark.asyncio
+async def test_result_cache_round_trip():
+    """Test that stored results are returned as the same JSON bytes."""
+    cache = WorkflowResultCache(settings=WebSettings())
+
+    cache.set("k", b'{"result": "done"}', ttl=60)
+
+    assert await cache.get("k") == b'{"result": "done"}'
+    assert await cache.get("missing") is None
+
+
+@pytest.mark.asyncio
+async def test_result_cache_expires_entries():
+    """Test that results are not served past their TTL."""
+    cache = WorkflowResultCache(settings=WebSettings())
+
+    cache.set("k", b"{}", ttl=0.01)
+    time.sleep(0.02)
+
+    assert await cache.get("k") is None
+
+
+@pytest.mark.asyncio
+async def test_result_cache_disabled():
+    """Test that a disabled cache neither stores nor serves results."""
+    cache = WorkflowResultCache(settings=WebSettings(result_cache_enabled=False))
+
+    cache.set("k", b"{}", ttl=60)
+
+    assert await cache.get("k") is None
+    assert len(cache.local) == 0
+
+
+@pytest.mark.asyncio
+async def test_shared_tier_fills_local_tier(tmp_path):
+    """Test that a result written by one process is served to another and cached locally."""
+    settings = WebSettings(result_cache_shared_backend="sqlite")
+    shared = SQLiteCache(tmp_path / "results.db", table="workflow_results")
+    writer = WorkflowResultCache(settings=settings, shared=shared)
+    reader = WorkflowResultCache(settings=settings, local=MemoryCache(), shared=shared)
+
+    writer.set("k", b'{"result": "done"}', ttl=60)
+
+    assert await reader.get("k") == b'{"result": "done"}'
+    assert reader.local.get("k") is not None
+    shared.close()
+
+
+def test_shared_tier_built_from_settings(tmp_path):
+    """Test that the shared tier is created from settings."""
+    settings = WebSettings(
+        result_cache_shared_backend="sqlite", result_cache_path=str(tmp_path / "results.db")
+    )
+
+    cache = WorkflowResultCache(settings=settings)
+
+    assert isinstance(cache.shared, SQLiteCache)
+    cache.shared.close()
+
+
+class _BrokenCache(MemoryCache):
+    """Shared tier whose reads fail."""
+
+    def get(self, key: str) -> bytes | None:
+        """Fail like an unreachable backend."""
+        raise OSError("disk I/O error")
+
+
+@pytest.mark.asyncio
+async def test_unreadable_shared_tier_is_a_miss():
+    """Test that a failing shared-tier read is treated as a miss instead of an error."""
+    cache = WorkflowResultCache(settings=WebSettings(), shared=_BrokenCache())
+
+    assert await cache.get("k") is None
+
+
+@pytest.mark.asyncio
+async def test_expired_shared_entry_is_not_copied_locally():
+    """Test that a shared-tier entry past its expiry is neither served nor cached locally."""
+    shared: CacheBackend = MemoryCache()
+    cache = WorkflowResultCache(settings=WebSettings(), local=MemoryCache(), shared=shared)
+    # Written by a process whose clock already passed the entry's expiry
+    shared.set("k", _EXPIRES_AT.pack(time.time() - 1) + b"{}", ttl=60)
+
+    assert await cache.get("k") is None
+    assert cache.local.get("k") is None
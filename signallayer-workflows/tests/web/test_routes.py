@@ -1,7 +1,10 @@
 """Tests for dynamic route generation."""
 
+import asyncio
+import json
 from unittest.mock import AsyncMock, Mock
 
+import httpx
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
@@ -126,9 +129,11 @@ def test_sync_workflow_execution(app_with_routes, mock_temporal_client):
     client = TestClient(app_with_routes)
 
     # Mock successful execution
-    mock_temporal_client.execute_workflow.return_value = TestWorkflowOutput(
-        result="Processed test"
-    )
+    mock_handle = Mock()
+    mock_handle.id = "test-workflow-20250110-abc123"
+    mock_handle.result_run_id = "run-xyz789"
+    mock_handle.result = AsyncMock(return_value=TestWorkflowOutput(result="Processed test"))
+    mock_temporal_client.start_workflow.return_value = mock_handle
 
     response = client.post(
         "/api/v1/workflow/test-workflow-v2", json={"name": "test", "value": 42}
@@ -136,7 +141,74 @@ def test_sync_workflow_execution(app_with_routes, mock_temporal_client):
 
     assert response.status_code == 200
     assert response.json() == {"result": "Processed test"}
-    mock_temporal_client.execute_workflow.assert_called_once()
+    mock_temporal_client.start_workflow.assert_called_once()
+    mock_handle.result.assert_awaited_once()
+
+
+def test_sync_workflow_execution_returns_202_after_timeout(
+    app_with_routes, mock_temporal_client, monkeypatch
+):
+    """Test that a sync request returns the handle once the wait deadline passes."""
+    from src.web.config import settings
+
+    async def slow_result():
+        await asyncio.sleep(1)
+
+    monkeypatch.setattr(settings, "temporal_timeout", 0.01)
+    mock_handle = Mock()
+    mock_handle.id = "test-workflow-20250110-abc123"
+    mock_handle.result_run_id = "run-xyz789"
+    mock_handle.result = slow_result
+    mock_temporal_client.start_workflow.return_value = mock_handle
+
+    response = TestClient(app_with_routes).post(
+        "/api/v1/workflow/test-workflow-v2", json={"name": "test", "value": 42}
+    )
+
+    assert response.status_code == 202
+    assert response.json()["workflow_id"] == "test-workflow-20250110-abc123"
+    assert response.headers["location"] == response.json()["status_url"]
+
+
+def test_sync_workflow_execution_returns_202_when_waits_saturated(
+    mock_temporal_client, workflow_registry
+):
+    """Test that sync requests beyond the per-workflow limit get the handle immediately."""
+    workflow_api(name="test-workflow", version="v2", max_sync_waits=1)(TestWorkflow)
+    app = FastAPI()
+    from src.web.dependencies import get_temporal_client
+
+    app.dependency_overrides[get_temporal_client] = lambda: mock_temporal_client
+    app.include_router(generate_workflow_routes(workflow_registry), prefix="/api/v1")
+
+    release = asyncio.Event()
+
+    async def blocked_result():
+        await release.wait()
+        return TestWorkflowOutput(result="first")
+
+    first_handle = Mock(id="wf-1", result_run_id="run-1", result=blocked_result)
+    second_handle = Mock(id="wf-2", result_run_id="run-2", result=AsyncMock())
+    mock_temporal_client.start_workflow.side_effect = [first_handle, second_handle]
+
+    async def run_requests():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+            url = "/api/v1/workflow/test-workflow-v2"
+            first = asyncio.create_task(http.post(url, json={"name": "a", "value": 1}))
+            while mock_temporal_client.start_workflow.await_count < 1:
+                await asyncio.sleep(0)
+            second = await http.post(url, json={"name": "b", "value": 2})
+            release.set()
+            return await first, second
+
+    first, second = asyncio.run(run_requests())
+
+    assert first.status_code == 200
+    assert first.json() == {"result": "first"}
+    assert second.status_code == 202
+    assert second.json()["workflow_id"] == "wf-2"
+    second_handle.result.assert_not_called()
 
 
 def test_async_workflow_execution(app_with_routes, mock_temporal_client):
@@ -217,3 +289,321 @@ def test_openapi_schema_includes_workflow_endpoint(app_with_routes):
     async_param = next((p for p in params if p["name"] == "async"), None)
     assert async_param is not None
     assert async_param["in"] == "query"
+
+
+def _mock_handle(status, result=None, workflow_type="TestWorkflow"):
+    """Create a mock workflow handle with the given execution status."""
+    from temporalio.client import WorkflowExecutionStatus
+
+    handle = Mock()
+    handle.id = "wf-1"
+    handle.describe = AsyncMock(
+        return_value=Mock(
+            id="wf-1",
+            run_id="run-1",
+            workflow_type=workflow_type,
+            status=WorkflowExecutionStatus[status],
+            start_time=None,
+            close_time=None,
+        )
+    )
+    handle.result = AsyncMock(return_value=result)
+    return handle
+
+
+def test_status_endpoint_returns_running_workflow(app_with_routes, mock_temporal_client):
+    """Test the status endpoint for a running workflow."""
+    handle = _mock_handle("RUNNING")
+    mock_temporal_client.get_workflow_handle_for = Mock(return_value=handle)
+
+    response = TestClient(app_with_routes).get("/api/v1/workflow/test-workflow-v2/status/wf-1")
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "RUNNING"
+    assert response.json()["result"] is None
+    handle.result.assert_not_called()
+
+
+def test_status_endpoint_includes_result_when_completed(app_with_routes, mock_temporal_client):
+    """Test the status endpoint for a completed workflow."""
+    handle = _mock_handle("COMPLETED", TestWorkflowOutput(result="done"))
+    mock_temporal_client.get_workflow_handle_for = Mock(return_value=handle)
+
+    response = TestClient(app_with_routes).get("/api/v1/workflow/test-workflow-v2/status/wf-1")
+
+    assert response.json()["status"] == "COMPLETED"
+    assert response.json()["result"] == {"result": "done"}
+
+
+def test_status_endpoint_returns_404_for_unknown_workflow(app_with_routes, mock_temporal_client):
+    """Test the status endpoint for a workflow that does not exist."""
+    from temporalio.service import RPCError, RPCStatusCode
+
+    handle = _mock_handle("RUNNING")
+    handle.describe.side_effect = RPCError("not found", RPCStatusCode.NOT_FOUND, b"")
+    mock_temporal_client.get_workflow_handle_for = Mock(return_value=handle)
+
+    response = TestClient(app_with_routes).get("/api/v1/workflow/test-workflow-v2/status/nope")
+
+    assert response.status_code == 404
+
+
+def test_status_endpoint_returns_404_for_another_workflow_type(
+    app_with_routes, mock_temporal_client
+):
+    """Test that a workflow ID belonging to another workflow type is not found."""
+    handle = _mock_handle("COMPLETED", {"other": "shape"}, workflow_type="AnotherWorkflow")
+    mock_temporal_client.get_workflow_handle_for = Mock(return_value=handle)
+
+    response = TestClient(app_with_routes).get("/api/v1/workflow/test-workflow-v2/status/wf-1")
+
+    assert response.status_code == 404
+    handle.result.assert_not_called()
+
+
+def test_status_long_poll_awaits_the_result_once(app_with_routes, mock_temporal_client):
+    """Test that a long-poll that sees the workflow close reuses the awaited result."""
+    from temporalio.client import WorkflowExecutionStatus
+
+    handle = _mock_handle("RUNNING", TestWorkflowOutput(result="done"))
+    closed = Mock(
+        id="wf-1",
+        run_id="run-1",
+        workflow_type="TestWorkflow",
+        status=WorkflowExecutionStatus.COMPLETED,
+        start_time=None,
+        close_time=None,
+    )
+    handle.describe.side_effect = [handle.describe.return_value, closed]
+    mock_temporal_client.get_workflow_handle_for = Mock(return_value=handle)
+
+    response = TestClient(app_with_routes).get(
+        "/api/v1/workflow/test-workflow-v2/status/wf-1", params={"wait": 5}
+    )
+
+    assert response.json()["status"] == "COMPLETED"
+    assert response.json()["result"] == {"result": "done"}
+    assert handle.result.await_count == 1
+
+
+def test_events_endpoint_streams_status_and_result(app_with_routes, mock_temporal_client):
+    """Test the SSE endpoint for a completed workflow."""
+    handle = _mock_handle("COMPLETED", TestWorkflowOutput(result="done"))
+    mock_temporal_client.get_workflow_handle_for = Mock(return_value=handle)
+
+    response = TestClient(app_with_routes).get(
+        "/api/v1/workflow/test-workflow-v2/status/wf-1/events"
+    )
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert "event: status" in response.text
+    assert 'event: result\ndata: {"workflow_id": "wf-1", "result": {"result": "done"}}' in (
+        response.text
+    )
+
+
+def _started_handle(workflow_id, memo=None):
+    description = Mock()
+    description.memo_value = AsyncMock(side_effect=lambda key, default: (memo or {}).get(key))
+    return Mock(id=workflow_id, result_run_id="run-1", describe=AsyncMock(return_value=description))
+
+
+def _use_existing_runs(mock_temporal_client):
+    """Make start_workflow attach to the first run started under each ID, like USE_EXISTING."""
+    runs = {}
+
+    def start(run, input_data, id, memo=None, **kwargs):
+        return runs.setdefault(id, _started_handle(id, memo))
+
+    mock_temporal_client.start_workflow.side_effect = start
+
+
+def test_batch_endpoint_starts_json_array(app_with_routes, mock_temporal_client):
+    """Test that a JSON array batch starts one workflow per input."""
+    mock_temporal_client.start_workflow.side_effect = lambda run, input_data, id, task_queue: (
+        _started_handle(id)
+    )
+
+    response = TestClient(app_with_routes).post(
+        "/api/v1/workflow/test-workflow-v2/batch",
+        json=[{"name": "a", "value": 1}, {"name": "b", "value": 2}],
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = sorted(
+        (json.loads(line) for line in response.text.splitlines()), key=lambda r: r["index"]
+    )
+    assert [line["index"] for line in lines] == [0, 1]
+    assert all(line["status_url"].endswith(line["workflow_id"]) for line in lines)
+    inputs = [call.args[1] for call in mock_temporal_client.start_workflow.call_args_list]
+    assert sorted(i.name for i in inputs) == ["a", "b"]
+
+
+def test_batch_endpoint_reports_invalid_ndjson_items(app_with_routes, mock_temporal_client):
+    """Test that invalid NDJSON lines are reported while valid ones still start."""
+    mock_temporal_client.start_workflow.side_effect = lambda run, input_data, id, task_queue: (
+        _started_handle(id)
+    )
+
+    response = TestClient(app_with_routes).post(
+        "/api/v1/workflow/test-workflow-v2/batch",
+        content=b'{"name": "a", "value": 1}\n\n{"name": "b"}\nnot json\n',
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+    results = {r["index"]: r for r in map(json.loads, response.text.splitlines())}
+    assert set(results) == {0, 1, 2}
+    assert "workflow_id" in results[0]
+    assert "value" in results[1]["error"]
+    assert "error" in results[2]
+    mock_temporal_client.start_workflow.assert_called_once()
+
+
+def test_batch_endpoint_reports_start_failures(app_with_routes, mock_temporal_client):
+    """Test that a failed start is reported for its item only."""
+    mock_temporal_client.start_workflow.side_effect = [
+        _started_handle("wf-1"),
+        RuntimeError("unavailable"),
+    ]
+
+    response = TestClient(app_with_routes).post(
+        "/api/v1/workflow/test-workflow-v2/batch",
+        json=[{"name": "a", "value": 1}, {"name": "b", "value": 2}],
+    )
+
+    results = {r["index"]: r for r in map(json.loads, response.text.splitlines())}
+    assert results[0]["workflow_id"] == "wf-1"
+    assert results[1]["error"] == "unavailable"
+
+
+def test_batch_endpoint_rejects_non_array_and_oversized_bodies(
+    app_with_routes, mock_temporal_client, monkeypatch
+):
+    """Test that malformed or oversized batches are rejected before starting anything."""
+    from src.web.config import settings
+
+    client = TestClient(app_with_routes)
+    url = "/api/v1/workflow/test-workflow-v2/batch"
+    assert client.post(url, json={"name": "a", "value": 1}).status_code == 422
+
+    monkeypatch.setattr(settings, "batch_max_items", 1)
+    response = client.post(url, json=[{"name": "a", "value": 1}, {"name": "b", "value": 2}])
+
+    assert response.status_code == 422
+    mock_temporal_client.start_workflow.assert_not_called()
+
+
+def test_idempotency_key_maps_to_deterministic_workflow_id(app_with_routes, mock_temporal_client):
+    """Test that requests with the same idempotency key target the same workflow ID."""
+    from temporalio.common import WorkflowIDConflictPolicy, WorkflowIDReusePolicy
+
+    _use_existing_runs(mock_temporal_client)
+    client = TestClient(app_with_routes)
+    url = "/api/v1/workflow/test-workflow-v2?async=true"
+
+    first = client.post(url, json={"name": "a", "value": 1}, headers={"Idempotency-Key": "k1"})
+    retry = client.post(url, json={"name": "a", "value": 1}, headers={"Idempotency-Key": "k1"})
+    other = client.post(url, json={"name": "a", "value": 1}, headers={"Idempotency-Key": "k2"})
+
+    assert first.json()["workflow_id"] == retry.json()["workflow_id"]
+    assert first.json()["workflow_id"] != other.json()["workflow_id"]
+    kwargs = mock_temporal_client.start_workflow.call_args.kwargs
+    assert kwargs["id_reuse_policy"] == WorkflowIDReusePolicy.ALLOW_DUPLICATE_FAILED_ONLY
+    assert kwargs["id_conflict_policy"] == WorkflowIDConflictPolicy.USE_EXISTING
+
+
+def test_idempotency_key_reused_with_different_input_is_rejected(
+    app_with_routes, mock_temporal_client
+):
+    """Test that reusing an idempotency key for another input returns 409."""
+    _use_existing_runs(mock_temporal_client)
+    client = TestClient(app_with_routes)
+    url = "/api/v1/workflow/test-workflow-v2?async=true"
+
+    first = client.post(url, json={"name": "a", "value": 1}, headers={"Idempotency-Key": "k1"})
+    conflict = client.post(url, json={"name": "a", "value": 2}, headers={"Idempotency-Key": "k1"})
+
+    assert first.status_code == 200
+    assert conflict.status_code == 409
+    assert "Idempotency-Key" in conflict.json()["detail"]
+
+
+def test_idempotent_workflow_derives_key_from_input(mock_temporal_client, workflow_registry):
+    """Test that idempotent workflows deduplicate identical inputs without a header."""
+    workflow_api(name="test-workflow", version="v2", idempotent=True)(TestWorkflow)
+    app = FastAPI()
+    from src.web.dependencies import get_temporal_client
+
+    app.dependency_overrides[get_temporal_client] = lambda: mock_temporal_client
+    app.include_router(generate_workflow_routes(workflow_registry), prefix="/api/v1")
+    mock_temporal_client.start_workflow.side_effect = lambda run, input_data, id, **kwargs: (
+        _started_handle(id)
+    )
+    client = TestClient(app)
+    url = "/api/v1/workflow/test-workflow-v2?async=true"
+
+    first = client.post(url, json={"value": 1, "name": "a"})
+    same = client.post(url, json={"name": "a", "value": 1})
+    different = client.post(url, json={"name": "a", "value": 2})
+
+    assert first.json()["workflow_id"] == same.json()["workflow_id"]
+    assert first.json()["workflow_id"] != different.json()["workflow_id"]
+
+
+def test_idempotent_retry_returns_completed_run_result(app_with_routes, mock_temporal_client):
+    """Test that a retry after the run completed returns its result without re-running it."""
+    from temporalio.exceptions import WorkflowAlreadyStartedError
+
+    mock_temporal_client.start_workflow.side_effect = WorkflowAlreadyStartedError(
+        "wf-1", "TestWorkflow", run_id="run-1"
+    )
+    existing = _started_handle("wf-1")
+    existing.result = AsyncMock(return_value=TestWorkflowOutput(result="cached"))
+    mock_temporal_client.get_workflow_handle_for = Mock(return_value=existing)
+
+    response = TestClient(app_with_routes).post(
+        "/api/v1/workflow/test-workflow-v2",
+        json={"name": "a", "value": 1},
+        headers={"Idempotency-Key": "k1"},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"result": "cached"}
+    assert mock_temporal_client.get_workflow_handle_for.call_args.kwargs["run_id"] == "run-1"
+
+
+def test_cacheable_workflow_serves_repeated_input_from_cache(
+    mock_temporal_client, workflow_registry
+):
+    """Test that a repeated sync request for a cacheable workflow skips Temporal."""
+    from datetime import timedelta
+
+    from src.web.config import WebSettings
+    from src.web.dependencies import get_result_cache, get_temporal_client
+    from src.web.result_cache import WorkflowResultCache
+
+    workflow_api(name="test-workflow", version="v2", cache_ttl=timedelta(minutes=5))(
+        TestWorkflow
+    )
+    app = FastAPI()
+    result_cache = WorkflowResultCache(settings=WebSettings())
+    app.dependency_overrides[get_temporal_client] = lambda: mock_temporal_client
+    app.dependency_overrides[get_result_cache] = lambda: result_cache
+    app.include_router(generate_workflow_routes(workflow_registry), prefix="/api/v1")
+
+    handle = Mock(id="wf-1", result_run_id="run-1")
+    handle.result = AsyncMock(return_value=TestWorkflowOutput(result="done"))
+    mock_temporal_client.start_workflow.return_value = handle
+    client = TestClient(app)
+    url = "/api/v1/workflow/test-workflow-v2"
+
+    first = client.post(url, json={"name": "a", "value": 1})
+    repeat = client.post(url, json={"value": 1, "name": "a"})
+    other = client.post(url, json={"name": "b", "value": 1})
+
+    assert first.json() == repeat.json() == {"result": "done"}
+    assert "x-cache" not in first.headers
+    assert repeat.headers["x-cache"] == "HIT"
+    assert other.status_code == 200
+    assert mock_temporal_client.start_workflow.call_count == 2
@@ -76,6 +76,16 @@ def test_decorator_with_custom_version(workflow_registry):
     assert metadata.version == "v3"
 
 
+def test_decorator_child_workflows_are_not_registered(workflow_registry):
+    """Test that internal child workflows ride on the parent's metadata only."""
+    workflow_api(name="parent", child_workflows=[AnotherWorkflow])(ExampleWorkflow)
+
+    metadata = workflow_registry.get("parent-v2")
+    assert metadata is not None
+    assert metadata.child_workflows == (AnotherWorkflow,)
+    assert [m.name for m in workflow_registry.get_all()] == ["parent"]
+
+
 def test_decorator_without_workflow_defn_raises():
     """Test that decorator without @workflow.defn raises error."""
     with pytest.raises(ValueError, match="must be decorated with @workflow.defn"):
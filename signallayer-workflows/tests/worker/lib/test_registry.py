@@ -109,6 +109,26 @@ def test_get_all_workflows(workflow_registry):
     assert metadata2 in all_workflows
 
 
+def test_snapshot_is_frozen_and_ordered(workflow_registry):
+    """Test that a snapshot is ordered by key and unaffected by later registrations."""
+    for name in ("workflow-two", "workflow-one"):
+        workflow_registry.register_workflow(
+            WorkflowMetadata(
+                workflow_class=TestWorkflow,
+                name=name,
+                input_model=TestInput,
+                output_model=TestOutput,
+                version="v2",
+            )
+        )
+
+    snapshot = workflow_registry.snapshot()
+    workflow_registry.clear()
+
+    assert isinstance(snapshot, tuple)
+    assert [m.name for m in snapshot] == ["workflow-one", "workflow-two"]
+
+
 def test_clear_registry(workflow_registry):
     """Test clearing the registry."""
     metadata = WorkflowMetadata(
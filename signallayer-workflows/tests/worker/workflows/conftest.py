@@ -0,0 +1,55 @@
+"""Fixtures for workflow orchestration tests against a time-skipping Temporal server."""
+
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+from temporalio.testing import WorkflowEnvironment
+
+from src.common.pydantic_converter import pydantic_data_converter
+
+
+class ConcurrencyTracker:
+    """Records how many stub activities run at once and which keys they saw."""
+
+    def __init__(self, hold_seconds: float = 0.5) -> None:
+        """Initialize the tracker.
+
+        Args:
+            hold_seconds: How long each tracked call stays in flight
+        """
+        self.hold_seconds = hold_seconds
+        self.current = 0
+        self.peak = 0
+        self.seen: list[str] = []
+
+    async def track(self, key: str) -> None:
+        """Hold a slot for ``hold_seconds`` while counting concurrent holders."""
+        self.seen.append(key)
+        self.current += 1
+        self.peak = max(self.peak, self.current)
+        try:
+            await asyncio.sleep(self.hold_seconds)
+        finally:
+            self.current -= 1
+
+
+@pytest.fixture
+async def workflow_env() -> AsyncIterator[WorkflowEnvironment]:
+    """Start a time-skipping test server with the project's data converter.
+
+    The server binary is downloaded on first use; tests are skipped when it
+    cannot be started (e.g. without network access).
+    """
+    try:
+        env = await WorkflowEnvironment.start_time_skipping(data_converter=pydantic_data_converter)
+    except RuntimeError as e:
+        pytest.skip(f"Temporal test server unavailable: {e}")
+    async with env:
+        yield env
+
+
+@pytest.fixture
+def concurrency() -> ConcurrencyTracker:
+    """Fresh concurrency tracker for stub activities."""
+    return ConcurrencyTracker()
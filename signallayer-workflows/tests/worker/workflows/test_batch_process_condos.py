@@ -0,0 +1,120 @@
+"""Tests for the BatchProcessCondosWorkflow sliding window and keyset paging."""
+
+from datetime import timedelta
+
+from temporalio import activity, workflow
+from temporalio.testing import WorkflowEnvironment
+from temporalio.worker import UnsandboxedWorkflowRunner, Worker
+
+from src.worker.workflows.batch_process_condos import (
+    BatchProcessCondosInput,
+    BatchProcessCondosWorkflow,
+)
+from src.worker.workflows.find_condo_emails import FindCondoEmailsInput, FindCondoEmailsOutput
+
+from .conftest import ConcurrencyTracker
+
+TASK_QUEUE = "test-batch-process-condos"
+
+
+@workflow.defn(name="FindCondoEmailsWorkflow")
+class StubFindCondoEmailsWorkflow:
+    """Stands in for the email search; holds its slot through a tracked activity."""
+
+    @workflow.run
+    async def run(self, input: FindCondoEmailsInput) -> FindCondoEmailsOutput:
+        """Run the tracked activity and report no emails."""
+        await workflow.execute_activity(
+            "find_emails_stub", input.condo_name, start_to_close_timeout=timedelta(seconds=30)
+        )
+        return FindCondoEmailsOutput(
+            condo_name=input.condo_name,
+            emails_found=0,
+            emails=[],
+            output_file="",
+            used_agent=False,
+        )
+
+
+async def test_window_stays_full_across_pages_and_runs(
+    workflow_env: WorkflowEnvironment, concurrency: ConcurrencyTracker
+) -> None:
+    """Test that children fill the window across pages and continue-as-new resumes by name."""
+    catalog = sorted(f"Condo {letter}" for letter in "BCDEFGH")
+    list_calls: list[str | None] = []
+
+    @activity.defn(name="list_condo_names")
+    async def list_condo_names(
+        data_dir: str, offset: int = 0, limit: int | None = None, after: str | None = None
+    ) -> list[dict[str, str]]:
+        list_calls.append(after)
+        if len(list_calls) == 2:
+            # A condo sorting before the cursor appears mid-run; keyset paging ignores it
+            catalog.insert(0, "Condo A")
+        names = [name for name in catalog if after is None or name > after]
+        return [{"name": name, "address": name} for name in names[:limit]]
+
+    @activity.defn(name="find_emails_stub")
+    async def find_emails_stub(condo_name: str) -> None:
+        await concurrency.track(condo_name)
+
+    async with Worker(
+        workflow_env.client,
+        task_queue=TASK_QUEUE,
+        workflows=[BatchProcessCondosWorkflow, StubFindCondoEmailsWorkflow],
+        activities=[list_condo_names, find_emails_stub],
+        workflow_runner=UnsandboxedWorkflowRunner(),
+    ):
+        handle = await workflow_env.client.start_workflow(
+            BatchProcessCondosWorkflow.run,
+            BatchProcessCondosInput(batch_size=3, page_size=2, completions_per_run=4),
+            id="batch-process-condos-test",
+            task_queue=TASK_QUEUE,
+        )
+        result = await handle.result()
+        description = await handle.describe()
+
+    expected = [f"Condo {letter}" for letter in "BCDEFGH"]
+    assert result.condos_found == 7
+    assert result.total_processed == 7
+    assert sorted(concurrency.seen) == expected
+    # Pages hold two condos, so three in flight means the window spanned a page boundary
+    assert concurrency.peak == 3
+    # The second run picked up after the last condo the first one started
+    assert description.run_id != handle.first_execution_run_id
+    assert list_calls == [None, "Condo C", "Condo E", "Condo G"]
+
+
+async def test_limit_stops_the_batch(
+    workflow_env: WorkflowEnvironment, concurrency: ConcurrencyTracker
+) -> None:
+    """Test that no more than ``limit`` condos are started."""
+
+    @activity.defn(name="list_condo_names")
+    async def list_condo_names(
+        data_dir: str, offset: int = 0, limit: int | None = None, after: str | None = None
+    ) -> list[dict[str, str]]:
+        names = [f"Condo {i}" for i in range(10) if after is None or f"Condo {i}" > after]
+        return [{"name": name, "address": name} for name in names[:limit]]
+
+    @activity.defn(name="find_emails_stub")
+    async def find_emails_stub(condo_name: str) -> None:
+        await concurrency.track(condo_name)
+
+    async with Worker(
+        workflow_env.client,
+        task_queue=TASK_QUEUE,
+        workflows=[BatchProcessCondosWorkflow, StubFindCondoEmailsWorkflow],
+        activities=[list_condo_names, find_emails_stub],
+        workflow_runner=UnsandboxedWorkflowRunner(),
+    ):
+        result = await workflow_env.client.execute_workflow(
+            BatchProcessCondosWorkflow.run,
+            BatchProcessCondosInput(batch_size=2, page_size=2, limit=3),
+            id="batch-process-condos-limit-test",
+            task_queue=TASK_QUEUE,
+        )
+
+    assert result.condos_found == 3
+    assert sorted(concurrency.seen) == ["Condo 0", "Condo 1", "Condo 2"]
+    assert concurrency.peak <= 2
@@ -0,0 +1,248 @@
+"""Tests for the sharded PropertyGuru ingestion."""
+
+import json
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+from temporalio import activity
+from temporalio.exceptions import ApplicationError
+from temporalio.testing import WorkflowEnvironment
+from temporalio.worker import UnsandboxedWorkflowRunner, Worker
+
+from src.worker.workflows.activities.propertyguru import count_streets, load_streets_list
+from src.worker.workflows.ingest_propertyguru import (
+    FAILED_STREETS_SAMPLE_SIZE,
+    IngestPropertyGuruInput,
+    IngestPropertyGuruOutput,
+    IngestPropertyGuruShardWorkflow,
+    IngestPropertyGuruWorkflow,
+)
+
+TASK_QUEUE = "test-ingest-propertyguru"
+STREETS = [f"Street {i}" for i in range(6)]
+
+
+@pytest.fixture
+def streets_file(tmp_path: Path) -> str:
+    """Streets file holding ``STREETS``."""
+    path = tmp_path / "streets.json"
+    path.write_text(json.dumps(STREETS), encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.asyncio
+async def test_load_streets_list_returns_shard_slice(streets_file: str) -> None:
+    """Test that a shard's slice is cut from the file and clipped at its end."""
+    assert await count_streets(streets_file) == len(STREETS)
+    assert await load_streets_list(streets_file, 4, 3) == ["Street 4", "Street 5"]
+    assert await load_streets_list(streets_file) == STREETS
+
+
+def test_continue_as_new_checkpoint_round_trips() -> None:
+    """Test that the checkpoint carried across continue-as-new survives serialization."""
+    input = IngestPropertyGuruInput(shard_size=2)
+    checkpoint = input.model_copy(
+        update={"cursor": 4, "successful": 3, "failed": 1, "failed_sample": ["Street 1"]}
+    )
+    restored = IngestPropertyGuruInput.model_validate_json(checkpoint.model_dump_json())
+    assert restored.cursor == 4
+    assert restored.successful == 3
+    assert restored.failed == 1
+    assert restored.failed_sample == ["Street 1"]
+    assert restored.shard_size == 2
+
+
+def test_failed_sample_is_bounded() -> None:
+    """Test that the failed-street sample cannot grow past its cap."""
+    too_many = [f"Street {i}" for i in range(FAILED_STREETS_SAMPLE_SIZE + 1)]
+    with pytest.raises(ValidationError):
+        IngestPropertyGuruInput(failed_sample=too_many)
+
+
+@pytest.mark.asyncio
+async def test_fetch_and_save_returns_only_the_path(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the fused activity saves the response and returns just its path."""
+    from src.worker.workflows.activities import propertyguru
+
+    async def fake_fetch(street_name: str) -> list[dict[str, str]]:
+        return [{"displayText": "The Pier", "displayType": "Condominium"}]
+
+    monkeypatch.setattr(propertyguru, "_fetch_autocomplete", fake_fetch)
+
+    path = await propertyguru.fetch_and_save_propertyguru_data("St. George's Lane", str(tmp_path))
+
+    assert path == str(tmp_path / "condo.st_georges_lane.json")
+    assert json.loads((tmp_path / "condo.st_georges_lane.json").read_text())[0]["displayText"] == (
+        "The Pier"
+    )
+
+
+@pytest.mark.asyncio
+async def test_incremental_fetch_skips_fresh_and_unchanged_streets(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that unchanged responses are not rewritten and fresh streets are not fetched."""
+    from src.worker.workflows.activities import propertyguru
+
+    calls: list[str] = []
+
+    async def fake_fetch(street_name: str) -> list[dict[str, str]]:
+        calls.append(street_name)
+        return [{"displayText": "The Pier", "displayType": "Condominium"}]
+
+    monkeypatch.setattr(propertyguru, "_fetch_autocomplete", fake_fetch)
+    output_dir = str(tmp_path)
+    path = tmp_path / "condo.admiralty_drive.json"
+
+    await propertyguru.fetch_and_save_propertyguru_data("Admiralty Drive", output_dir)
+    mtime = path.stat().st_mtime_ns
+
+    # Same content: fetched again but the file is left untouched
+    await propertyguru.fetch_and_save_propertyguru_data("Admiralty Drive", output_dir)
+    assert path.stat().st_mtime_ns == mtime
+
+    # Within the freshness window: not fetched at all
+    await propertyguru.fetch_and_save_propertyguru_data("Admiralty Drive", output_dir, 3600)
+    assert calls == ["Admiralty Drive", "Admiralty Drive"]
+
+
+class FakeIngestActivities:
+    """Stub ingest activities recording fetched streets and saved checkpoints."""
+
+    def __init__(self, checkpoint: int = 0, failing: frozenset[str] = frozenset()) -> None:
+        """Initialize the stubs.
+
+        Args:
+            checkpoint: Cursor returned by load_ingest_checkpoint
+            failing: Streets whose fetch fails without retrying
+        """
+        self.checkpoint = checkpoint
+        self.failing = failing
+        self.runs = 0
+        self.fetched: list[str] = []
+        self.saved: list[int | None] = []
+
+    def definitions(self) -> list[Callable[..., Any]]:
+        """Return the activity definitions to register with a worker."""
+
+        @activity.defn(name="count_streets")
+        async def count_streets(file_path: str) -> int:
+            # Called once at the start of every run, including continued ones
+            self.runs += 1
+            return len(STREETS)
+
+        @activity.defn(name="load_streets_list")
+        async def load_streets_list(
+            file_path: str, offset: int = 0, limit: int | None = None
+        ) -> list[str]:
+            return STREETS[offset : None if limit is None else offset + limit]
+
+        @activity.defn(name="fetch_and_save_propertyguru_data")
+        async def fetch_and_save(
+            street_name: str, output_dir: str, freshness_seconds: float | None = None
+        ) -> str:
+            self.fetched.append(street_name)
+            if street_name in self.failing:
+                raise ApplicationError(f"{street_name} failed", non_retryable=True)
+            return f"{output_dir}/{street_name}.json"
+
+        @activity.defn(name="load_ingest_checkpoint")
+        async def load_ingest_checkpoint(streets_file: str, output_dir: str) -> int:
+            return self.checkpoint
+
+        @activity.defn(name="save_ingest_checkpoint")
+        async def save_ingest_checkpoint(
+            streets_file: str, output_dir: str, cursor: int | None = None
+        ) -> None:
+            self.saved.append(cursor)
+
+        return [
+            count_streets,
+            load_streets_list,
+            fetch_and_save,
+            load_ingest_checkpoint,
+            save_ingest_checkpoint,
+        ]
+
+
+async def _run_ingest(
+    env: WorkflowEnvironment,
+    activities: FakeIngestActivities,
+    input: IngestPropertyGuruInput,
+    workflow_id: str,
+) -> IngestPropertyGuruOutput:
+    """Run an ingest to completion and return its output."""
+    async with Worker(
+        env.client,
+        task_queue=TASK_QUEUE,
+        workflows=[IngestPropertyGuruWorkflow, IngestPropertyGuruShardWorkflow],
+        activities=activities.definitions(),
+        workflow_runner=UnsandboxedWorkflowRunner(),
+    ):
+        return await env.client.execute_workflow(
+            IngestPropertyGuruWorkflow.run, input, id=workflow_id, task_queue=TASK_QUEUE
+        )
+
+
+async def test_ingest_resumes_from_saved_watermark(workflow_env: WorkflowEnvironment) -> None:
+    """Test that a fresh ingest skips the streets before the checkpointed watermark."""
+    activities = FakeIngestActivities(checkpoint=4)
+
+    result = await _run_ingest(
+        workflow_env,
+        activities,
+        IngestPropertyGuruInput(streets_file="streets.json", shard_size=2),
+        "ingest-resume-test",
+    )
+
+    assert activities.runs == 1
+    assert sorted(activities.fetched) == ["Street 4", "Street 5"]
+    assert result.total_streets == 6
+    assert result.successful == 2
+    # The watermark moves past the last shard, then the finished ingest clears it
+    assert activities.saved == [6, None]
+
+
+async def test_ingest_hands_checkpoint_across_continue_as_new(
+    workflow_env: WorkflowEnvironment,
+) -> None:
+    """Test that each continued run picks up at the previous run's watermark."""
+    activities = FakeIngestActivities()
+
+    result = await _run_ingest(
+        workflow_env,
+        activities,
+        IngestPropertyGuruInput(streets_file="streets.json", shard_size=2, shards_per_run=1),
+        "ingest-continue-as-new-test",
+    )
+
+    assert activities.runs == 3
+    assert sorted(activities.fetched) == STREETS
+    assert result.successful == 6
+    assert result.failed == 0
+    assert activities.saved == [2, 4, 6, None]
+
+
+async def test_failures_are_counted_across_continue_as_new(
+    workflow_env: WorkflowEnvironment,
+) -> None:
+    """Test that failed streets are counted and sampled across continued runs."""
+    activities = FakeIngestActivities(failing=frozenset({"Street 1", "Street 4"}))
+
+    result = await _run_ingest(
+        workflow_env,
+        activities,
+        IngestPropertyGuruInput(streets_file="streets.json", shard_size=2, shards_per_run=1),
+        "ingest-failures-test",
+    )
+
+    assert activities.runs == 3
+    assert result.successful == 4
+    assert result.failed == 2
+    assert result.failed_streets == ["Street 1", "Street 4"]
+    assert result.failed_shards == []
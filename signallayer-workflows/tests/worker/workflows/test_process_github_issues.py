@@ -0,0 +1,144 @@
+"""Tests for the ProcessGithubIssuesWorkflow definition and fan-out."""
+
+from datetime import timedelta
+
+import pytest
+from pydantic import ValidationError
+from temporalio import activity, workflow
+from temporalio.testing import WorkflowEnvironment
+from temporalio.worker import UnsandboxedWorkflowRunner, Worker
+
+from src.common.models import IssueReference
+from src.worker.workflows.process_github_issues import (
+    ProcessGithubIssuesInput,
+    ProcessGithubIssuesWorkflow,
+)
+from src.worker.workflows.research_issue import ResearchIssueInput, ResearchIssueOutput
+
+from .conftest import ConcurrencyTracker
+
+TASK_QUEUE = "test-process-github-issues"
+
+
+@workflow.defn(name="ResearchIssueWorkflow")
+class StubResearchIssueWorkflow:
+    """Stands in for issue research; holds its slot through a tracked activity."""
+
+    @workflow.run
+    async def run(self, input: ResearchIssueInput) -> ResearchIssueOutput:
+        """Run the tracked activity and report the issue as researched."""
+        await workflow.execute_activity(
+            "research_stub",
+            str(input.issue_ref.number),
+            start_to_close_timeout=timedelta(seconds=30),
+        )
+        return ResearchIssueOutput(title=input.issue_ref.title, status="done", findings="")
+
+
+@workflow.defn
+class BlockingWorkflow:
+    """Occupies a research workflow ID until the test ends."""
+
+    @workflow.run
+    async def run(self) -> None:
+        """Wait forever."""
+        await workflow.wait_condition(lambda: False)
+
+
+def _issues(count: int) -> list[IssueReference]:
+    """Issue references #1..#count in owner/repo."""
+    return [
+        IssueReference(
+            platform="github",
+            number=number,
+            repository="owner/repo",
+            title=f"Issue {number}",
+            url=f"https://github.com/owner/repo/issues/{number}",
+        )
+        for number in range(1, count + 1)
+    ]
+
+
+def _worker(env: WorkflowEnvironment, issue_count: int, concurrency: ConcurrencyTracker) -> Worker:
+    """Worker running the real parent against stub research workflows."""
+
+    @activity.defn(name="fetch_issues_by_label")
+    async def fetch_issues_by_label(repository: str, label: str) -> list[IssueReference]:
+        return _issues(issue_count)
+
+    @activity.defn(name="research_stub")
+    async def research_stub(number: str) -> None:
+        await concurrency.track(number)
+
+    return Worker(
+        env.client,
+        task_queue=TASK_QUEUE,
+        workflows=[ProcessGithubIssuesWorkflow, StubResearchIssueWorkflow, BlockingWorkflow],
+        activities=[fetch_issues_by_label, research_stub],
+        workflow_runner=UnsandboxedWorkflowRunner(),
+    )
+
+
+def test_max_in_flight_defaults_and_bounds() -> None:
+    """Test that max_in_flight defaults to 5 and must be positive."""
+    assert ProcessGithubIssuesInput(repository="owner/repo").max_in_flight == 5
+    with pytest.raises(ValidationError):
+        ProcessGithubIssuesInput(repository="owner/repo", max_in_flight=0)
+
+
+async def test_progress_query_reports_finished_run(
+    workflow_env: WorkflowEnvironment, concurrency: ConcurrencyTracker
+) -> None:
+    """Test that the progress query is served and reflects the finished fan-out."""
+    async with _worker(workflow_env, 2, concurrency):
+        handle = await workflow_env.client.start_workflow(
+            ProcessGithubIssuesWorkflow.run,
+            ProcessGithubIssuesInput(repository="owner/repo"),
+            id="process-github-issues-progress-test",
+            task_queue=TASK_QUEUE,
+        )
+        await handle.result()
+        progress = await handle.query(ProcessGithubIssuesWorkflow.progress)
+
+    assert progress.signals_found == 2
+    assert progress.processed == 2
+    assert progress.in_flight == 0
+
+
+async def test_research_fan_out_respects_max_in_flight(
+    workflow_env: WorkflowEnvironment, concurrency: ConcurrencyTracker
+) -> None:
+    """Test that no more than ``max_in_flight`` research workflows run at once."""
+    async with _worker(workflow_env, 5, concurrency):
+        result = await workflow_env.client.execute_workflow(
+            ProcessGithubIssuesWorkflow.run,
+            ProcessGithubIssuesInput(repository="owner/repo", max_in_flight=2),
+            id="process-github-issues-window-test",
+            task_queue=TASK_QUEUE,
+        )
+
+    assert result.signals_found == 5
+    assert result.signals_processed == 5
+    assert sorted(concurrency.seen) == ["1", "2", "3", "4", "5"]
+    assert concurrency.peak == 2
+
+
+async def test_already_running_research_is_counted_as_skipped(
+    workflow_env: WorkflowEnvironment, concurrency: ConcurrencyTracker
+) -> None:
+    """Test that an issue whose research workflow is already running is skipped."""
+    async with _worker(workflow_env, 3, concurrency):
+        await workflow_env.client.start_workflow(
+            BlockingWorkflow.run, id="research-issue-owner-repo-2", task_queue=TASK_QUEUE
+        )
+        result = await workflow_env.client.execute_workflow(
+            ProcessGithubIssuesWorkflow.run,
+            ProcessGithubIssuesInput(repository="owner/repo"),
+            id="process-github-issues-skip-test",
+            task_queue=TASK_QUEUE,
+        )
+
+    assert result.signals_found == 3
+    assert result.signals_processed == 2
+    assert result.signals_skipped == 1
+    assert sorted(concurrency.seen) == ["1", "3"]